@@ -3,13 +3,16 @@
 
 
 # Base orchestrator
+from .access import AgentAccess, PortfolioAccess
 from .agent import Agent, AgentConfig
 from .orchestrators import Orchestrator, OrchestratorConfig
 
 
 __all__ = [
     "Agent",
+    "AgentAccess",
     "AgentConfig",
     "Orchestrator",
     "OrchestratorConfig",
+    "PortfolioAccess",
 ]
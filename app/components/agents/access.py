@@ -0,0 +1,37 @@
+# SPDX-License-Identifier: GPLv3-or-later
+# Copyright © 2025 pygaindalf Rui Pinheiro
+
+from enum import Enum
+from typing import NamedTuple
+
+
+# MARK: Portfolio access
+class PortfolioAccess(Enum):
+    NONE = "none"
+    READ = "read"
+    WRITE = "write"
+
+    @property
+    def reads(self) -> bool:
+        return self is not PortfolioAccess.NONE
+
+    @property
+    def writes(self) -> bool:
+        return self is PortfolioAccess.WRITE
+
+
+# MARK: Agent access
+class AgentAccess(NamedTuple):
+    """Resources an agent run reads or writes, used by orchestrators to decide which agents may run concurrently.
+
+    Providers are treated as exclusive resources, i.e. two agents using the same provider never run concurrently.
+    """
+
+    portfolio: PortfolioAccess = PortfolioAccess.WRITE
+    providers: frozenset[str] = frozenset()
+
+    def conflicts_with(self, other: AgentAccess) -> bool:
+        # Portfolio writes go through the single session of the portfolio's session manager, so a writer excludes every other portfolio access
+        if (self.portfolio.writes and other.portfolio.reads) or (other.portfolio.writes and self.portfolio.reads):
+            return True
+        return not self.providers.isdisjoint(other.providers)
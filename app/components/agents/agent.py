@@ -2,7 +2,9 @@
 # Copyright © 2025 pygaindalf Rui Pinheiro
 
 from abc import ABCMeta
-from typing import TYPE_CHECKING, override
+from collections.abc import Iterable, Iterator, Mapping
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, ClassVar, override
 
 from ...context import ContextConfig
 from ...portfolio.models.instrument import Instrument
@@ -10,6 +12,7 @@ from ...portfolio.models.ledger import Ledger
 from ...util.config import FieldInherit
 from ...util.helpers import classproperty
 from ..component import Component, ComponentConfig, component_entrypoint
+from .access import AgentAccess, PortfolioAccess
 
 
 if TYPE_CHECKING:
@@ -19,6 +22,17 @@ if TYPE_CHECKING:
     from ...portfolio.journal import Session
 
 
+def _iter_paths(value: Any) -> Iterator[Path]:
+    if isinstance(value, Path):
+        yield value
+    elif isinstance(value, Mapping):
+        for item in value.values():
+            yield from _iter_paths(item)
+    elif isinstance(value, (list, tuple, set, frozenset)):
+        for item in value:
+            yield from _iter_paths(item)
+
+
 # MARK: Agent Base Configuration
 class AgentConfig(ComponentConfig, metaclass=ABCMeta):
     context: ContextConfig = FieldInherit(default_factory=lambda: ContextConfig(), description="Context configuration for provider")
@@ -31,6 +45,14 @@ class AgentConfig(ComponentConfig, metaclass=ABCMeta):
 
 # MARK: Agent Base class
 class Agent[C: AgentConfig](Component[C], metaclass=ABCMeta):
+    PROFILING_CATEGORY: ClassVar[str] = "agent"
+
+    # By default agents are assumed to write to the portfolio, and therefore never run concurrently with other agents that access it
+    PORTFOLIO_ACCESS: ClassVar[PortfolioAccess] = PortfolioAccess.WRITE
+
+    # Keys of the providers used by this agent, which are never used by two agents concurrently
+    PROVIDERS: ClassVar[frozenset[str]] = frozenset()
+
     # MARK: Run
     @component_entrypoint
     def run(self, context: Context) -> None:
@@ -51,6 +73,17 @@ class Agent[C: AgentConfig](Component[C], metaclass=ABCMeta):
     def _post_run(self) -> None:
         self.log.info(t"{self.instance_hierarchy} finished running.")
 
+    # MARK: Access
+    @classmethod
+    def get_access(cls, config: C) -> AgentAccess:  # noqa: ARG003 as this is for overriding
+        """Return the resources a run of this agent with the given configuration accesses."""
+        return AgentAccess(portfolio=cls.PORTFOLIO_ACCESS, providers=cls.PROVIDERS)
+
+    @classmethod
+    def get_input_paths(cls, config: C) -> Iterable[Path]:
+        """Return the paths a run of this agent with the given configuration may read, by default every path in the configuration."""
+        return _iter_paths(config.model_dump())
+
     # MARK: Session Manager
     def session(self, reason: str, *, reuse: bool = False) -> AbstractContextManager[Session]:
         return self.context.session_manager(actor=self.instance_hierarchy, reason=reason, reuse=reuse)
@@ -0,0 +1,289 @@
+# SPDX-License-Identifier: GPLv3-or-later
+# Copyright © 2025 pygaindalf Rui Pinheiro
+
+"""Columnar export of the portfolio to Parquet or Arrow IPC files, so that it can be queried with e.g. DuckDB or Polars.
+
+One file is written per table in the configured directory:
+
+- ``instruments``: one row per instrument;
+- ``ledgers``: one row per ledger;
+- ``transactions``: one row per transaction, with its S104 holdings annotation if any;
+- ``s104_pools``: one row per S104 match between a disposal and an acquisition;
+- ``forex``: one row per currency of the forex annotation of each transaction.
+
+Ledgers are streamed one at a time, each becoming a record batch (a row group in Parquet files), so that memory use is bounded by the
+largest ledger rather than the whole portfolio. Types and currencies are dictionary-encoded against dictionaries that only grow during an
+export, so that Arrow IPC files can carry them as dictionary deltas. Decimal values are stored as ``decimal128`` with a configurable scale,
+and S104 values are in the S104 currency.
+
+This exporter requires the optional ``pyarrow`` package, installed by the ``columnar`` extra. It is only imported once the exporter runs,
+so that configurations can be loaded without it.
+"""
+
+import contextlib
+import decimal
+
+from collections.abc import Iterable, Mapping, Sequence
+from enum import StrEnum
+from typing import TYPE_CHECKING, Any, ClassVar, override
+
+from pydantic import Field
+
+from ....util.config.models.env_path import EnvPath
+from ...providers import ProviderType
+from .exporter import Exporter, ExporterConfig
+
+
+if TYPE_CHECKING:
+    import pyarrow as pa
+
+    from ....portfolio.models.ledger import Ledger
+
+
+# MARK: Optional dependencies
+def _import_pyarrow() -> None:
+    try:
+        import pyarrow.parquet  # noqa: F401 as it is only imported to check that pyarrow is installed
+    except ImportError as e:
+        msg = "The columnar exporter requires the optional 'pyarrow' package, e.g. 'pip install pygaindalf[columnar]'."
+        raise ImportError(msg) from e
+
+
+# MARK: Configuration
+class ColumnarFormat(StrEnum):
+    PARQUET = "parquet"
+    ARROW = "arrow"
+
+    @property
+    def suffix(self) -> str:
+        return f".{self.value}"
+
+
+class ColumnarExporterConfig(ExporterConfig):
+    directory: EnvPath = Field(description="The directory to write the exported tables to, one file per table")
+    file_format: ColumnarFormat = Field(default=ColumnarFormat.PARQUET, description="The file format of the exported tables")
+    decimal_scale: int = Field(
+        default=10, ge=0, le=38, description="The number of decimal places of exported decimal values, which are stored as decimal128(38, scale)"
+    )
+    compression: str = Field(default="zstd", description="The compression codec of Parquet files")
+
+
+# MARK: Dictionary encoding
+class DictionaryEncoder:
+    """Dictionary encoder of a string column whose dictionary only grows, so that the dictionary of each batch extends the previous one."""
+
+    __slots__ = ("_indices", "_values")
+
+    @staticmethod
+    def get_type() -> pa.DictionaryType:
+        import pyarrow as pa
+
+        return pa.dictionary(pa.int32(), pa.string())
+
+    def __init__(self) -> None:
+        self._indices: dict[str, int] = {}
+        self._values: list[str] = []
+
+    def encode(self, values: Iterable[str | None]) -> pa.DictionaryArray:
+        import pyarrow as pa
+
+        indices: list[int | None] = []
+        for value in values:
+            if value is None:
+                indices.append(None)
+                continue
+            if (index := self._indices.get(value)) is None:
+                index = self._indices[value] = len(self._values)
+                self._values.append(value)
+            indices.append(index)
+
+        return pa.DictionaryArray.from_arrays(pa.array(indices, type=pa.int32()), pa.array(self._values, type=pa.string()))
+
+
+# MARK: Exporter
+class ColumnarExporter(Exporter[ColumnarExporterConfig]):
+    # S104 pool totals are converted through forex annotations, which fetch missing exchange rates on demand
+    PROVIDERS: ClassVar[frozenset[str]] = frozenset({ProviderType.FOREX})
+
+    @property
+    def _decimal_type(self) -> pa.Decimal128Type:
+        import pyarrow as pa
+
+        return pa.decimal128(38, self.config.decimal_scale)
+
+    def _get_schemas(self) -> Mapping[str, pa.Schema]:
+        import pyarrow as pa
+
+        dictionary = DictionaryEncoder.get_type()
+        dec = self._decimal_type
+
+        return {
+            "instruments": pa.schema(
+                [
+                    pa.field("instrument_uid", pa.string(), nullable=False),
+                    pa.field("ticker", pa.string()),
+                    pa.field("isin", pa.string()),
+                    pa.field("type", dictionary, nullable=False),
+                    pa.field("currency", dictionary, nullable=False),
+                ]
+            ),
+            "ledgers": pa.schema(
+                [
+                    pa.field("ledger_uid", pa.string(), nullable=False),
+                    pa.field("instrument_uid", pa.string(), nullable=False),
+                    pa.field("symbol", pa.string(), nullable=False),
+                    pa.field("transactions", pa.int64(), nullable=False),
+                ]
+            ),
+            "transactions": pa.schema(
+                [
+                    pa.field("transaction_uid", pa.string(), nullable=False),
+                    pa.field("ledger_uid", pa.string(), nullable=False),
+                    pa.field("type", dictionary, nullable=False),
+                    pa.field("date", pa.date32(), nullable=False),
+                    pa.field("quantity", dec, nullable=False),
+                    pa.field("consideration", dec, nullable=False),
+                    pa.field("currency", dictionary, nullable=False),
+                    pa.field("fees", dec, nullable=False),
+                    pa.field("fees_currency", dictionary),
+                    pa.field("discount", dec, nullable=False),
+                    pa.field("discount_currency", dictionary),
+                    pa.field("s104_quantity", dec),
+                    pa.field("s104_cumulative_cost", dec),
+                ]
+            ),
+            "s104_pools": pa.schema(
+                [
+                    pa.field("disposal_uid", pa.string(), nullable=False),
+                    pa.field("acquisition_uid", pa.string(), nullable=False),
+                    pa.field("quantity", dec, nullable=False),
+                    pa.field("acquisition_quantity", dec, nullable=False),
+                    pa.field("total_cost", dec, nullable=False),
+                    pa.field("total_proceeds", dec, nullable=False),
+                ]
+            ),
+            "forex": pa.schema(
+                [
+                    pa.field("transaction_uid", pa.string(), nullable=False),
+                    pa.field("currency", dictionary, nullable=False),
+                    pa.field("exchange_rate", dec),
+                    pa.field("consideration", dec),
+                ]
+            ),
+        }
+
+    def _open_writer(self, name: str, schema: pa.Schema) -> Any:
+        import pyarrow as pa
+        import pyarrow.parquet as pq
+
+        path = str(self.config.directory / f"{name}{self.config.file_format.suffix}")
+
+        if self.config.file_format is ColumnarFormat.PARQUET:
+            return pq.ParquetWriter(path, schema, compression=self.config.compression)
+        return pa.ipc.new_file(path, schema, options=pa.ipc.IpcWriteOptions(emit_dictionary_deltas=True))
+
+    @override
+    def _do_run(self) -> None:
+        _import_pyarrow()
+        import pyarrow as pa
+
+        self.config.directory.mkdir(parents=True, exist_ok=True)
+
+        schemas = self._get_schemas()
+        encoders: dict[str, DictionaryEncoder] = {}
+        count = 0
+
+        with contextlib.ExitStack() as stack:
+            writers = {name: stack.enter_context(self._open_writer(name, schema)) for name, schema in schemas.items()}
+
+            for ledger in self.context.ledgers:
+                for name, columns in self._get_ledger_columns(ledger, schemas).items():
+                    schema = schemas[name]
+                    if not columns[schema.names[0]]:
+                        continue
+
+                    arrays = [self._to_array(columns[field.name], field, encoders.setdefault(f"{name}.{field.name}", DictionaryEncoder())) for field in schema]
+                    writers[name].write_batch(pa.record_batch(arrays, schema=schema))
+                count += 1
+
+        self.log.info(t"Exported {count} ledgers to {self.config.directory}")
+
+    def _to_array(self, values: Sequence[Any], field: pa.Field, encoder: DictionaryEncoder) -> pa.Array:
+        import pyarrow as pa
+
+        if pa.types.is_dictionary(field.type):
+            return encoder.encode(values)
+
+        if pa.types.is_decimal(field.type):
+            # Quantize through decimal.Decimal directly, as decimal128 values must fit the column's scale exactly
+            quantize = decimal.Decimal.quantize
+            exponent = decimal.Decimal(1).scaleb(-self.config.decimal_scale)
+            values = [None if value is None else quantize(value, exponent) for value in values]
+
+        return pa.array(values, type=field.type)
+
+    def _get_ledger_columns(self, ledger: Ledger, schemas: Mapping[str, pa.Schema]) -> Mapping[str, Mapping[str, Sequence[Any]]]:
+        instrument = ledger.instrument
+        transactions = self._get_transactions(ledger)
+        ledger_uid = str(ledger.uid)
+
+        columns: dict[str, dict[str, list[Any]]] = {name: {field.name: [] for field in schema} for name, schema in schemas.items()}
+
+        # Instrument and ledger
+        row = columns["instruments"]
+        row["instrument_uid"].append(str(instrument.uid))
+        row["ticker"].append(instrument.ticker)
+        row["isin"].append(instrument.isin)
+        row["type"].append(instrument.type.value)
+        row["currency"].append(instrument.currency.code)
+
+        row = columns["ledgers"]
+        row["ledger_uid"].append(ledger_uid)
+        row["instrument_uid"].append(str(instrument.uid))
+        row["symbol"].append(ledger.symbol)
+        row["transactions"].append(len(transactions))
+
+        # Transactions and their annotations
+        txns = columns["transactions"]
+        pools = columns["s104_pools"]
+        forex = columns["forex"]
+        for txn in transactions:
+            uid = str(txn.uid)
+            holdings = txn.get_s104_holdings_or_none()
+
+            txns["transaction_uid"].append(uid)
+            txns["ledger_uid"].append(ledger_uid)
+            txns["type"].append(txn.type.value)
+            txns["date"].append(txn.date)
+            txns["quantity"].append(txn.quantity)
+            txns["consideration"].append(txn.consideration)
+            txns["currency"].append(txn.currency.code)
+            txns["fees"].append(txn.fees)
+            txns["fees_currency"].append(txn.fees.currency.code if txn.fees.currency is not None else None)
+            txns["discount"].append(txn.discount)
+            txns["discount_currency"].append(txn.discount.currency.code if txn.discount.currency is not None else None)
+            txns["s104_quantity"].append(holdings.quantity if holdings is not None else None)
+            txns["s104_cumulative_cost"].append(holdings.cumulative_cost if holdings is not None else None)
+
+            # Pools are shared by both of their transactions, so they are only exported from the disposal's side
+            if txn.type.disposal and (ann := txn.s104_pool_annotation_or_none) is not None:
+                for pool in ann.pools:
+                    pools["disposal_uid"].append(uid)
+                    pools["acquisition_uid"].append(str(pool.acquisition.uid))
+                    pools["quantity"].append(pool.quantity)
+                    pools["acquisition_quantity"].append(pool.get_quantity(pool.acquisition))
+                    pools["total_cost"].append(pool.total_cost)
+                    pools["total_proceeds"].append(pool.total_proceeds)
+
+            if (fx := txn.forex_annotation_or_none) is not None:
+                for currency in fx.exchange_rates.keys() | fx.considerations.keys():
+                    consideration = fx.considerations.get(currency)
+                    forex["transaction_uid"].append(uid)
+                    forex["currency"].append(currency.code)
+                    forex["exchange_rate"].append(fx.exchange_rates.get(currency))
+                    forex["consideration"].append(consideration)
+
+        return columns
+
+
+COMPONENT = ColumnarExporter
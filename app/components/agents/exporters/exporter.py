@@ -5,11 +5,12 @@ import datetime
 
 from abc import ABCMeta
 from collections.abc import Sequence
-from typing import TYPE_CHECKING, override
+from typing import TYPE_CHECKING, ClassVar, override
 
 from pydantic import Field
 
 from .. import Agent, AgentConfig
+from ..access import PortfolioAccess
 
 
 if TYPE_CHECKING:
@@ -24,6 +25,8 @@ class ExporterConfig(AgentConfig, metaclass=ABCMeta):
 
 # MARK: Exporter Base class
 class Exporter[C: ExporterConfig](Agent[C], metaclass=ABCMeta):
+    PORTFOLIO_ACCESS: ClassVar[PortfolioAccess] = PortfolioAccess.READ
+
     def _should_include_transaction(self, transaction: Transaction) -> bool:  # noqa: ARG002
         return True
 
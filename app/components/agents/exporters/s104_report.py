@@ -2,11 +2,12 @@
 # Copyright © 2025 pygaindalf Rui Pinheiro
 
 
+import csv
 import dataclasses
 import datetime
+import decimal
 
-from collections.abc import Callable, Mapping, MutableMapping, MutableSequence, Sequence
-from csv import DictWriter
+from collections.abc import Iterable, MutableMapping, Sequence
 from typing import TYPE_CHECKING, ClassVar, TextIO, override
 
 from pydantic import Field
@@ -16,18 +17,19 @@ from app.portfolio.models.transaction import Transaction
 from ....util.config.models.env_path import EnvForceNewPath
 from ....util.helpers.currency import S104_CURRENCY
 from ....util.helpers.decimal_currency import DecimalCurrency
+from ...providers import ProviderType
 from .exporter import DateFilteredExporter, DateFilteredExporterConfig
 
 
 if TYPE_CHECKING:
-    from decimal import Decimal
+    from _csv import Writer as CsvWriter
 
     from ....portfolio.models.annotation.s104.s104_holdings_annotation import S104HoldingsAnnotation
     from ....portfolio.models.annotation.s104.s104_pool_annotation import S104Pool
     from ....portfolio.models.ledger import Ledger
     from ....portfolio.models.transaction import Transaction
 
-type CsvCell = str | int | Decimal
+type CsvCell = str | int | decimal.Decimal
 type MutableCsvRow = MutableMapping[str, CsvCell]
 
 
@@ -38,18 +40,58 @@ class S104ReportExporterConfig(DateFilteredExporterConfig):
     cost_precision: int = Field(default=2, description="The number of decimal places for S104 costs.")
 
 
-# Utility class
+# MARK: Aggregates
+def _zero() -> DecimalCurrency:
+    return DecimalCurrency(0, currency=S104_CURRENCY)
+
+
+@dataclasses.dataclass
+class S104Aggregates:
+    """Running totals of the disposals in a period, updated once per disposal and merged in O(1)."""
+
+    disposals: int = 0
+
+    proceeds: DecimalCurrency = dataclasses.field(default_factory=_zero)
+    allowable_cost: DecimalCurrency = dataclasses.field(default_factory=_zero)
+
+    gains: DecimalCurrency = dataclasses.field(default_factory=_zero)
+    losses: DecimalCurrency = dataclasses.field(default_factory=_zero)
+
+    @property
+    def result(self) -> DecimalCurrency:
+        return self.gains - self.losses
+
+    def add_disposal(self, proceeds: DecimalCurrency, allowable_cost: DecimalCurrency, cost_precision: int) -> None:
+        self.disposals += 1
+        self.proceeds += round(proceeds, cost_precision)
+        self.allowable_cost += round(allowable_cost, cost_precision)
+
+        gain = round(proceeds - allowable_cost, cost_precision)
+        if gain >= 0:
+            self.gains += gain
+        else:
+            self.losses += -gain
+
+    def merge(self, other: S104Aggregates) -> None:
+        self.disposals += other.disposals
+        self.proceeds += other.proceeds
+        self.allowable_cost += other.allowable_cost
+        self.gains += other.gains
+        self.losses += other.losses
+
+
 @dataclasses.dataclass
 class S104TaxYear:
+    # CGT rates changed mid-way through the 2024-25 tax year, so its gains must be reported separately before and after this date
+    RATE_CHANGE_DATE: ClassVar[datetime.date] = datetime.date(2024, 10, 30)
+
     start_year: int
 
     buys: int = 0
-    sells: int = 0
 
-    losses: DecimalCurrency = dataclasses.field(default_factory=lambda: DecimalCurrency(0, currency=S104_CURRENCY))
-    gains: DecimalCurrency = dataclasses.field(default_factory=lambda: DecimalCurrency(0, currency=S104_CURRENCY))
-
-    transactions: MutableSequence[Transaction] = dataclasses.field(default_factory=list)
+    total: S104Aggregates = dataclasses.field(default_factory=S104Aggregates)
+    until_rate_change: S104Aggregates = dataclasses.field(default_factory=S104Aggregates)
+    from_rate_change: S104Aggregates = dataclasses.field(default_factory=S104Aggregates)
 
     @property
     def start_date(self) -> datetime.date:
@@ -67,39 +109,61 @@ class S104TaxYear:
     def name(self) -> str:
         return f"{self.start_year}-{str(self.end_year)[-2:]}"
 
+    @property
+    def has_rate_change(self) -> bool:
+        return self.start_date < self.RATE_CHANGE_DATE <= self.end_date
+
+    @property
+    def sells(self) -> int:
+        return self.total.disposals
+
     @property
     def trades(self) -> int:
         return self.buys + self.sells
 
+    @property
+    def gains(self) -> DecimalCurrency:
+        return self.total.gains
+
+    @property
+    def losses(self) -> DecimalCurrency:
+        return self.total.losses
+
     @property
     def result(self) -> DecimalCurrency:
-        return self.gains - self.losses
+        return self.total.result
 
     def merge(self, other: S104TaxYear) -> None:
         assert self.start_year == other.start_year, "Can only merge tax years with the same start year."
 
         self.buys += other.buys
-        self.sells += other.sells
-        self.gains += other.gains
-        self.losses += other.losses
-        self.transactions.extend(other.transactions)
-
-    def add_transaction(self, transaction: Transaction, cost_precision: int) -> None:
+        self.total.merge(other.total)
+        self.until_rate_change.merge(other.until_rate_change)
+        self.from_rate_change.merge(other.from_rate_change)
+
+    def add_transaction(
+        self,
+        transaction: Transaction,
+        cost_precision: int,
+        *,
+        proceeds: DecimalCurrency | None = None,
+        allowable_cost: DecimalCurrency | None = None,
+    ) -> None:
         assert transaction.date >= self.start_date, f"Transaction date {transaction.date} is before tax year start date {self.start_date}."
         assert transaction.date <= self.end_date, f"Transaction date {transaction.date} is after tax year end date {self.end_date}."
 
-        self.transactions.append(transaction)
-
         if transaction.type.acquisition:
             self.buys += 1
         elif transaction.type.disposal:
-            self.sells += 1
+            if proceeds is None:
+                proceeds = transaction.get_s104_total_proceeds()
+            if allowable_cost is None:
+                allowable_cost = transaction.get_s104_total_cost()
 
-            gain = round(transaction.get_s104_capital_gain(), cost_precision)
-            if gain >= 0:
-                self.gains += gain
-            else:
-                self.losses += -gain
+            self.total.add_disposal(proceeds, allowable_cost, cost_precision)
+            if self.has_rate_change:
+                period = self.until_rate_change if transaction.date < self.RATE_CHANGE_DATE else self.from_rate_change
+                period.add_disposal(proceeds, allowable_cost, cost_precision)
 
 
 @dataclasses.dataclass
@@ -128,7 +192,14 @@ class S104Summary:
             self.tax_years[year] = S104TaxYear(start_year=year)
         return self.tax_years[year]
 
-    def add_transaction(self, transaction: Transaction, cost_precision: int) -> None:
+    def add_transaction(
+        self,
+        transaction: Transaction,
+        cost_precision: int,
+        *,
+        proceeds: DecimalCurrency | None = None,
+        allowable_cost: DecimalCurrency | None = None,
+    ) -> None:
         self.add_date(transaction.date)
 
         tax_year_i = transaction.date.year
@@ -136,7 +207,7 @@ class S104Summary:
             tax_year_i -= 1
 
         tax_year = self._get_or_create_tax_year(tax_year_i)
-        tax_year.add_transaction(transaction, cost_precision)
+        tax_year.add_transaction(transaction, cost_precision, proceeds=proceeds, allowable_cost=allowable_cost)
 
     def merge(self, other: S104Summary) -> None:
         self._min_first_date(other.start_date)
@@ -171,46 +242,62 @@ class S104Summary:
         return self.gains - self.losses
 
 
+# MARK: Columns
+def format_currency_column(values: Iterable[DecimalCurrency], precision: int) -> Sequence[str]:
+    """Round and format a column of currency values, exactly as ``str(round(value, precision))`` would.
+
+    Rounding goes through :class:`decimal.Decimal` directly, skipping the per-operation currency checks of :class:`DecimalCurrency` which
+    dominate the cost of formatting large columns.
+    """
+    round_ = decimal.Decimal.__round__
+    return [str(round_(value, precision)) if value.currency is None else f"{round_(value, precision)!s} {value.currency.code}" for value in values]
+
+
+def format_date_column(values: Iterable[datetime.date]) -> Sequence[str]:
+    return [value.strftime("%Y-%m-%d") for value in values]
+
+
+class S104ReportColumns:
+    """Column-oriented values of the rows of a ledger section of the S104 report.
+
+    Each transaction row is followed by one row per S104 pool it was matched in. Columns are extracted one at a time over all rows of the
+    relevant kind and scattered into place, and the rows are then written in bulk.
+    """
+
+    def __init__(self, headers: Sequence[str], symbol: str, transactions: Sequence[Transaction]) -> None:
+        self.headers = headers
+        self.transaction_rows: list[int] = []
+        self.matches: list[tuple[Transaction, S104Pool]] = []
+        self.match_rows: list[int] = []
+
+        row = 0
+        for transaction in transactions:
+            self.transaction_rows.append(row)
+            row += 1
+
+            if (ann := transaction.s104_pool_annotation_or_none) is not None:
+                for pool in ann.pools:
+                    self.matches.append((transaction, pool))
+                    self.match_rows.append(row)
+                    row += 1
+
+        self.columns: dict[str, list[CsvCell]] = {header: [""] * row for header in headers}
+        self.columns["Symbol"] = [symbol] * row
+
+    def scatter(self, header: str, rows: Sequence[int], values: Sequence[CsvCell]) -> None:
+        column = self.columns[header]
+        for i, value in zip(rows, values, strict=True):
+            column[i] = value
+
+    @property
+    def rows(self) -> Iterable[Sequence[CsvCell]]:
+        return zip(*(self.columns[header] for header in self.headers), strict=True)
+
+
 # MARK: Exporter
 class S104ReportExporter(DateFilteredExporter[S104ReportExporterConfig]):
-    MAPPINGS_TXN: ClassVar[Mapping[Callable[[Transaction], bool], Mapping[str, Callable[[S104ReportExporter, Transaction], CsvCell]]]] = {
-        lambda _txn: True: {
-            "ID": lambda _self, txn: f"#{txn.uid.id}",
-            "Type": lambda _self, txn: txn.type.name,
-            "Date": lambda _self, txn: txn.date.strftime("%Y-%m-%d"),
-            "Quantity": lambda _self, txn: txn.quantity,
-            "S104 Holdings": lambda _self, txn: txn.get_s104_holdings().quantity,
-            "S104 Cumulative Cost": lambda self, txn: round(txn.get_s104_holdings().cumulative_cost, self.config.cost_precision),
-        },
-        lambda txn: txn.type.trade: {
-            "Fees": lambda self, txn: round(txn.get_fees(currency=S104_CURRENCY), self.config.cost_precision),
-        },
-        lambda txn: txn.type.acquisition: {
-            "FMV": lambda self, txn: round(txn.get_consideration(currency=S104_CURRENCY), self.config.cost_precision),
-        },
-        lambda txn: txn.type.disposal: {
-            "S104 Total Cost": lambda self, txn: round(txn.get_s104_total_cost(), self.config.cost_precision),
-            "Disposal Proceeds": lambda self, txn: round(txn.get_s104_total_proceeds(), self.config.cost_precision),
-            "Gain": lambda self, txn: round(txn.get_s104_capital_gain(), self.config.cost_precision),
-        },
-    }
-
-    MAPPINGS_MATCH: ClassVar[Mapping[str, Callable[[S104ReportExporter, Transaction, S104Pool], CsvCell]]] = {
-        "Match ID": lambda _self, main, pool: f"#{pool.acquisition.uid.id}" if main is pool.disposal else f"#{pool.disposal.uid.id}",
-        "Match Date": lambda _self, main, pool: pool.acquisition.date.strftime("%Y-%m-%d")
-        if main is pool.disposal
-        else pool.disposal.date.strftime("%Y-%m-%d"),
-        "Match Quantity": lambda _self, _main, pool: pool.quantity,
-        "Match Cost": lambda self, _main, pool: round(pool.total_cost, self.config.cost_precision),
-        "Match Proceeds": lambda self, _main, pool: round(pool.total_proceeds, self.config.cost_precision),
-    }
-
-    MAPPINGS_HOLDINGS: ClassVar[Mapping[str, Callable[[S104ReportExporter, S104HoldingsAnnotation | None], CsvCell]]] = {
-        "S104 Holdings": lambda _self, holdings: holdings.quantity if holdings else 0,
-        "S104 Cumulative Cost": lambda self, holdings: round(holdings.cumulative_cost, self.config.cost_precision)
-        if holdings
-        else DecimalCurrency(0, currency=S104_CURRENCY),
-    }
+    # S104 costs and proceeds are converted through forex annotations, which fetch missing exchange rates on demand
+    PROVIDERS: ClassVar[frozenset[str]] = frozenset({ProviderType.FOREX})
 
     HEADERS: ClassVar[Sequence[str]] = (
         "Symbol",
@@ -251,52 +338,44 @@ class S104ReportExporter(DateFilteredExporter[S104ReportExporterConfig]):
         if not any(txn.type.trade for txn in txns):
             return None
 
-        w = DictWriter(f, fieldnames=self.HEADERS, extrasaction="raise")
+        w = csv.writer(f)
 
         start_date = self.config.start_date or (txns[0].date - datetime.timedelta(days=1))
         summary = S104Summary(start_date=start_date, end_date=self.config.end_date)
         self._write_header(f, w, ledger, txns, summary)
 
-        for transaction in txns:
-            self._process_transaction(w, ledger, transaction, summary)
+        columns = self._extract_columns(ledger, txns, summary)
+        w.writerows(columns.rows)
 
         self._write_footer(f, ledger, txns, summary)
 
         return summary
 
-    def _write_header(self, f: TextIO, w: DictWriter, ledger: Ledger, txns: Sequence[Transaction], summary: S104Summary) -> None:
+    def _write_header(self, f: TextIO, w: CsvWriter, ledger: Ledger, txns: Sequence[Transaction], summary: S104Summary) -> None:
         assert txns, "Transactions should not be empty when writing header."
 
         f.write("\n\n")
 
-        w.writeheader()
+        w.writerow(self.HEADERS)
 
         holdings = txns[0].get_previous_s104_holdings_or_none()
         if holdings is not None and holdings.quantity > 0:
-            self._write_holdings(w, ledger, txns[0].get_previous_s104_holdings_or_none(), date=summary.start_date)
+            self._write_holdings(w, ledger, holdings, date=summary.start_date)
 
-    def _write_holdings(self, w: DictWriter, ledger: Ledger, holdings: S104HoldingsAnnotation | None, *, date: datetime.date | None = None) -> None:
+    def _write_holdings(self, w: CsvWriter, ledger: Ledger, holdings: S104HoldingsAnnotation | None, *, date: datetime.date | None = None) -> None:
         date = date if date else holdings.transaction.date if holdings else None
         if date is None:
             msg = "Date must be provided if holdings is None."
             raise ValueError(msg)
 
-        row: MutableCsvRow = {
-            "Type": "INITIAL",
-            "Symbol": ledger.symbol,
-            "Date": date.strftime("%Y-%m-%d"),
-        }
-
-        for header in self.HEADERS:
-            fn = self.MAPPINGS_HOLDINGS.get(header)
-            if fn is None:
-                if header not in row:
-                    row[header] = ""
-                continue
-
-            row[header] = fn(self, holdings)
+        row: MutableCsvRow = dict.fromkeys(self.HEADERS, "")
+        row["Type"] = "INITIAL"
+        row["Symbol"] = ledger.symbol
+        row["Date"] = date.strftime("%Y-%m-%d")
+        row["S104 Holdings"] = holdings.quantity if holdings else 0
+        row["S104 Cumulative Cost"] = round(holdings.cumulative_cost, self.config.cost_precision) if holdings else DecimalCurrency(0, currency=S104_CURRENCY)
 
-        w.writerow(row)
+        w.writerow(row.values())
 
     @override
     def _should_include_transaction(self, transaction: Transaction) -> bool:
@@ -309,56 +388,57 @@ class S104ReportExporter(DateFilteredExporter[S104ReportExporterConfig]):
 
         return True
 
-    def _process_transaction(self, w: DictWriter, ledger: Ledger, transaction: Transaction, summary: S104Summary) -> None:
-        summary.add_transaction(transaction, self.config.cost_precision)
-
-        # Sell Transaction
-        self._write_transaction(w, ledger, transaction)
+    def _extract_columns(self, ledger: Ledger, txns: Sequence[Transaction], summary: S104Summary) -> S104ReportColumns:
+        precision = self.config.cost_precision
+        columns = S104ReportColumns(self.HEADERS, ledger.symbol, txns)
+        rows = columns.transaction_rows
+
+        # All transactions
+        holdings = [txn.get_s104_holdings() for txn in txns]
+        columns.scatter("ID", rows, [f"#{txn.uid.id}" for txn in txns])
+        columns.scatter("Type", rows, [txn.type.name for txn in txns])
+        columns.scatter("Date", rows, format_date_column(txn.date for txn in txns))
+        columns.scatter("Quantity", rows, [txn.quantity for txn in txns])
+        columns.scatter("S104 Holdings", rows, [ann.quantity for ann in holdings])
+        columns.scatter("S104 Cumulative Cost", rows, format_currency_column((ann.cumulative_cost for ann in holdings), precision))
+
+        # Trades
+        trades = [(row, txn) for row, txn in zip(rows, txns, strict=True) if txn.type.trade]
+        columns.scatter("Fees", [row for row, _ in trades], format_currency_column((txn.get_fees(currency=S104_CURRENCY) for _, txn in trades), precision))
+
+        # Acquisitions
+        acquisitions = [(row, txn) for row, txn in trades if txn.type.acquisition]
+        columns.scatter(
+            "FMV",
+            [row for row, _ in acquisitions],
+            format_currency_column((txn.get_consideration(currency=S104_CURRENCY) for _, txn in acquisitions), precision),
+        )
+
+        # Disposals, whose totals are computed once and shared with the summary
+        proceeds: dict[Transaction, DecimalCurrency] = {}
+        costs: dict[Transaction, DecimalCurrency] = {}
+        for txn in txns:
+            if txn.type.disposal:
+                proceeds[txn] = txn.get_s104_total_proceeds()
+                costs[txn] = txn.get_s104_total_cost()
+            summary.add_transaction(txn, precision, proceeds=proceeds.get(txn), allowable_cost=costs.get(txn))
+
+        disposal_rows = [row for row, txn in trades if txn.type.disposal]
+        columns.scatter("S104 Total Cost", disposal_rows, format_currency_column(costs.values(), precision))
+        columns.scatter("Disposal Proceeds", disposal_rows, format_currency_column(proceeds.values(), precision))
+        columns.scatter("Gain", disposal_rows, format_currency_column((proceeds[txn] - cost for txn, cost in costs.items()), precision))
 
         # Matches
-        self._write_matches(w, ledger, transaction)
-
-    def _write_transaction(self, w: DictWriter, ledger: Ledger, transaction: Transaction) -> None:
-        row: MutableCsvRow = {
-            "Symbol": ledger.symbol,
-        }
-
-        mappings = {}
-        for predicate, mapping in self.MAPPINGS_TXN.items():
-            if predicate(transaction):
-                mappings.update(mapping)
-
-        for header in self.HEADERS:
-            fn = mappings.get(header)
-            if fn is None:
-                if header not in row:
-                    row[header] = ""
-                continue
-
-            row[header] = fn(self, transaction)
-
-        w.writerow(row)
-
-    def _write_matches(self, w: DictWriter, ledger: Ledger, transaction: Transaction) -> None:
-        ann = transaction.s104_pool_annotation_or_none
-        if ann is None:
-            return
-
-        for match in ann.pools:
-            row: MutableCsvRow = {
-                "Symbol": ledger.symbol,
-            }
-
-            for header in self.HEADERS:
-                fn = self.MAPPINGS_MATCH.get(header)
-                if fn is None:
-                    if header not in row:
-                        row[header] = ""
-                    continue
-
-                row[header] = fn(self, transaction, match)
+        rows = columns.match_rows
+        others = [pool.acquisition if main is pool.disposal else pool.disposal for main, pool in columns.matches]
+        pools = [pool for _, pool in columns.matches]
+        columns.scatter("Match ID", rows, [f"#{other.uid.id}" for other in others])
+        columns.scatter("Match Date", rows, format_date_column(other.date for other in others))
+        columns.scatter("Match Quantity", rows, [pool.get_quantity(main) for main, pool in columns.matches])
+        columns.scatter("Match Cost", rows, format_currency_column((pool.total_cost for pool in pools), precision))
+        columns.scatter("Match Proceeds", rows, format_currency_column((pool.total_proceeds for pool in pools), precision))
 
-            w.writerow(row)
+        return columns
 
     def _write_footer(self, f: TextIO, ledger: Ledger, txns: Sequence[Transaction], summary: S104Summary) -> None:
         assert txns, "Transactions should not be empty when writing footer."
@@ -391,30 +471,24 @@ class S104ReportExporter(DateFilteredExporter[S104ReportExporterConfig]):
             f.write(f"  Trades: {ty.trades}\n")
             f.write(f"    Acquisitions: {ty.buys}\n")
             f.write(f"    Disposals: {ty.sells}\n")
+            f.write(f"  Disposal Proceeds: {ty.total.proceeds!s}\n")
+            f.write(f"  Allowable Costs: {ty.total.allowable_cost!s}\n")
             f.write(f"  Result: {ty.result!s}\n")
             f.write(f"    Gains: {ty.gains!s}\n")
             f.write(f"    Losses: {ty.losses!s}\n")
 
             # 2024 has special rules where the gain needs to be split in 'until 29/10/2024' and 'from 30/10/2024'
-            if ty.start_year == 2024:  # noqa: PLR2004
-                threshold = datetime.date(2024, 10, 30)
-                until_gains = DecimalCurrency(0, currency=S104_CURRENCY)
-                from_gains = DecimalCurrency(0, currency=S104_CURRENCY)
-
-                for txn in ty.transactions:
-                    if not txn.type.disposal:
-                        continue
-                    gain = round(txn.get_s104_capital_gain(), self.config.cost_precision)
-                    if gain > 0:
-                        if txn.date < threshold:
-                            until_gains += gain
-                        else:
-                            from_gains += gain
-                assert ty.gains == until_gains + from_gains, f"Gains split does not add up to total gains, expected {ty.gains} got {until_gains + from_gains}."
+            if ty.has_rate_change:
+                until, from_ = ty.until_rate_change, ty.from_rate_change
+                assert ty.gains == until.gains + from_.gains, (
+                    f"Gains split does not add up to total gains, expected {ty.gains} got {until.gains + from_.gains}."
+                )
 
                 f.write(f"  Gains Split for TY{ty.name}:\n")
-                f.write(f"    Gains until 29/10/2024: {until_gains!s}\n")
-                f.write(f"    Gains from 30/10/2024: {from_gains!s}\n")
+                f.write(f"    Gains until 29/10/2024: {until.gains!s}\n")
+                f.write(f"    Gains from 30/10/2024: {from_.gains!s}\n")
+                f.write(f"    Losses until 29/10/2024: {until.losses!s}\n")
+                f.write(f"    Losses from 30/10/2024: {from_.losses!s}\n")
 
             f.write("\n")
 
@@ -0,0 +1,68 @@
+# SPDX-License-Identifier: GPLv3-or-later
+# Copyright © 2025 pygaindalf Rui Pinheiro
+
+
+import datetime
+
+from typing import ClassVar, Self, override
+
+from pydantic import Field, model_validator
+
+from ...util.helpers.currency import Currency
+from ...util.requests import RequestsManager
+from ..providers import ProviderType
+from .access import AgentAccess, PortfolioAccess
+from .agent import Agent, AgentConfig
+
+
+# MARK: Configuration
+class ForexCacheWarmupAgentConfig(AgentConfig):
+    provider: str = Field(default=ProviderType.FOREX, description="The key of the forex provider used to fetch the exchange rates")
+    currencies: tuple[Currency, ...] = Field(min_length=2, description="The currencies for which all pairwise exchange rates are fetched")
+    start_date: datetime.date = Field(description="The first date (inclusive) to fetch exchange rates for")
+    end_date: datetime.date = Field(description="The last date (inclusive) to fetch exchange rates for")
+    weekdays_only: bool = Field(default=False, description="Whether to skip Saturdays and Sundays")
+    compact: bool = Field(default=True, description="Whether to drop expired or invalid responses from the HTTP cache once all rates are fetched")
+
+    @model_validator(mode="after")
+    def _validate_date_range(self) -> Self:
+        if self.end_date < self.start_date:
+            msg = f"end_date ({self.end_date}) must not be before start_date ({self.start_date})"
+            raise ValueError(msg)
+        return self
+
+
+# MARK: Agent
+class ForexCacheWarmupAgent(Agent[ForexCacheWarmupAgentConfig]):
+    """Pre-populate the forex rate and HTTP caches for a date range, so that later runs can be performed offline."""
+
+    PORTFOLIO_ACCESS: ClassVar[PortfolioAccess] = PortfolioAccess.NONE
+
+    @classmethod
+    @override
+    def get_access(cls, config: ForexCacheWarmupAgentConfig) -> AgentAccess:
+        return super().get_access(config)._replace(providers=frozenset({config.provider}))
+
+    @override
+    def _do_run(self) -> None:
+        manager = RequestsManager()
+        before = manager.cache_stats.snapshot()
+
+        provider = self.context.get_forex_provider(self.config.provider)
+        rates = provider.prefetch_daily_rates(
+            currencies=self.config.currencies,
+            start_date=self.config.start_date,
+            end_date=self.config.end_date,
+            weekdays_only=self.config.weekdays_only,
+        )
+
+        stats = manager.cache_stats.snapshot() - before
+        self.log.info(t"Fetched {len(rates)} exchange rates: {stats}")
+        for host in sorted(stats.hosts):
+            self.log.debug(t"{host}: {stats.hits.get(host, 0)} hits, {stats.misses.get(host, 0)} misses ({stats.host_hit_ratio(host):.1%})")
+
+        if self.config.compact:
+            manager.compact()
+
+
+COMPONENT = ForexCacheWarmupAgent
@@ -2,10 +2,11 @@
 # Copyright © 2025 pygaindalf Rui Pinheiro
 
 
-from typing import override
+from typing import ClassVar, override
 
 from pydantic import Field
 
+from .access import PortfolioAccess
 from .agent import Agent, AgentConfig
 
 
@@ -16,6 +17,8 @@ class HelloWorldAgentConfig(AgentConfig):
 
 # MARK: Orchestrator
 class HelloWorldAgent(Agent[HelloWorldAgentConfig]):
+    PORTFOLIO_ACCESS: ClassVar[PortfolioAccess] = PortfolioAccess.NONE
+
     @override
     def _do_run(self) -> None:
         self.log.info(self.config.message)
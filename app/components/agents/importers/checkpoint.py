@@ -0,0 +1,33 @@
+# SPDX-License-Identifier: GPLv3-or-later
+# Copyright © 2025 pygaindalf Rui Pinheiro
+
+
+import json
+
+from typing import override
+
+from pydantic import Field
+
+from ....util.config.models.env_path import EnvFilePath
+from .importer import PortfolioImportData, SchemaImporter, SchemaImporterConfig
+
+
+class CheckpointImporterConfig(SchemaImporterConfig):
+    filepath: EnvFilePath = Field(description="The JSON checkpoint file to restore the portfolio data from")
+
+
+# MARK: Importer
+class CheckpointImporter(SchemaImporter[CheckpointImporterConfig]):
+    """Restore a portfolio checkpoint, as written by :class:`StageCheckpoints` after an orchestrator stage."""
+
+    @override
+    def _do_run(self) -> None:
+        with self.session(reason=f"Restore checkpoint {self.config.filepath}"):
+            data = json.loads(self.config.filepath.read_bytes())
+
+            portfolio_data = PortfolioImportData.model_validate(data)
+
+            self._import_portfolio_from_schema(portfolio_data)
+
+
+COMPONENT = CheckpointImporter
@@ -2,23 +2,23 @@
 # Copyright © 2025 pygaindalf Rui Pinheiro
 
 import datetime
-import glob
-import os
 
 from enum import StrEnum
-from pathlib import Path
 from typing import TYPE_CHECKING, ClassVar, override
 
 from pydantic import Field
 
 from ....portfolio.models.ledger import Ledger
 from ....portfolio.models.transaction import Transaction, TransactionType
+from ....util.config.models.env_path import EnvPath
 from ....util.helpers.currency import Currency
 from ....util.helpers.pdf_text import PdfText
-from .importer import SchemaImporter, SchemaImporterConfig
+from .importer import ImportManifest, SchemaImporter, SchemaImporterConfig
 
 
 if TYPE_CHECKING:
+    from pathlib import Path
+
     from ....portfolio.models.ledger import Ledger
 
 
@@ -32,6 +32,7 @@ class FidelityNetbenefitsImporterConfig(SchemaImporterConfig):
     glob: str = Field(description="The glob pattern to all Fidelity Netbenefits Trade Confirmation PDF files")
     create_ledger: bool = Field(default=False, description="Whether to create a new ledger for the imported data if it does not already exist.")
     currency: Currency = Field(default=Currency("USD"), description="The currency of the transactions being imported")
+    manifest: EnvPath | None = Field(default=None, description="Manifest file used to skip re-parsing source files that are unchanged since the previous run")
 
 
 # MARK: Importer
@@ -96,6 +97,11 @@ class FidelityNetbenefitsImporter(SchemaImporter[FidelityNetbenefitsImporterConf
         msg = "Unknown PDF kind (not VEST, SALE, or ESPP)"
         raise ValueError(msg)
 
+    @property
+    @override
+    def _create_ledger(self) -> bool:
+        return self.config.create_ledger
+
     def _get_ledger(self, symbol: str) -> Ledger:
         ledger = self.get_or_create_ledger(ticker=symbol, currency=self.config.currency) if self.config.create_ledger else self.get_ledger(ticker=symbol)
 
@@ -139,7 +145,7 @@ class FidelityNetbenefitsImporter(SchemaImporter[FidelityNetbenefitsImporterConf
             discount=discount_total,
         )
 
-        ledger.journal.transactions.add(txn)
+        self._add_transaction(ledger, txn)
 
     def _parse_vest(self, pdf: PdfText) -> None:
         # Symbol
@@ -172,7 +178,7 @@ class FidelityNetbenefitsImporter(SchemaImporter[FidelityNetbenefitsImporterConf
             consideration=fmv_total,
         )
 
-        ledger.journal.transactions.add(txn)
+        self._add_transaction(ledger, txn)
 
     def _parse_sale(self, pdf: PdfText) -> None:
         # Symbol
@@ -206,7 +212,7 @@ class FidelityNetbenefitsImporter(SchemaImporter[FidelityNetbenefitsImporterConf
             fees=fees,
         )
 
-        ledger.journal.transactions.add(txn)
+        self._add_transaction(ledger, txn)
 
     def _process_pdf(self, path: Path) -> None:
         try:
@@ -230,14 +236,11 @@ class FidelityNetbenefitsImporter(SchemaImporter[FidelityNetbenefitsImporterConf
 
     @override
     def _do_run(self) -> None:
-        paths = sorted(Path(p) for p in glob.glob(os.path.expandvars(self.config.glob)))  # noqa: PTH207
-        if not paths:
-            msg = f"No files matched glob: {self.config.glob}"
-            raise FileNotFoundError(msg)
+        paths = self._glob(self.config.glob)
+        manifest = ImportManifest.for_config(self.config.manifest, self.config) if self.config.manifest is not None else None
 
         with self.session(f"Fidelity NetBenefits Importer for {self.config.glob}"):
-            for path in paths:
-                self._process_pdf(path)
+            self._import_files(paths, self._process_pdf, manifest)
 
 
 COMPONENT = FidelityNetbenefitsImporter
@@ -4,12 +4,15 @@
 
 # Base orchestrator
 from .importer import Importer, ImporterConfig
+from .manifest import ImportManifest, ImportManifestEntry
 from .schema import LedgerImportData, PortfolioImportData, SchemaImporter, SchemaImporterConfig
 from .spreadsheet import BaseCsvSpreadsheetImporter, SpreadsheetImporter, SpreadsheetImporterConfig
 
 
 __all__ = [
     "BaseCsvSpreadsheetImporter",
+    "ImportManifest",
+    "ImportManifestEntry",
     "Importer",
     "ImporterConfig",
     "LedgerImportData",
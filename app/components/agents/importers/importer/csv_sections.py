@@ -0,0 +1,65 @@
+# SPDX-License-Identifier: GPLv3-or-later
+# Copyright © 2025 pygaindalf Rui Pinheiro
+
+"""Single-pass demultiplexing of CSV files made up of multiple sections, such as Interactive Brokers activity statements.
+
+Every row of such a file starts with the name of its section and the kind of row, e.g. ``Trades,Header,...`` or ``Trades,Data,...``. Header rows
+define the column names of the following data rows of the same section, and may be repeated whenever the columns change (e.g. between asset
+categories). Rows are read as a stream and only those of the requested sections are converted into mappings, so that files of any size are
+read once and never fully materialized.
+"""
+
+import csv
+
+from collections.abc import Collection, Iterable, Iterator, Mapping, Sequence
+from typing import TYPE_CHECKING, NamedTuple
+
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+
+HEADER_KIND = "Header"
+DATA_KIND = "Data"
+
+
+class CsvSectionRow(NamedTuple):
+    section: str
+    line: int
+    data: Mapping[str, str]
+
+
+def iter_section_rows(rows: Iterable[Sequence[str]], sections: Collection[str], *, kinds: Collection[str] = (DATA_KIND,)) -> Iterator[CsvSectionRow]:
+    """Yield the rows of the given ``sections`` (and row ``kinds``) as mappings from their section's column names to their values."""
+    headers: dict[str, Sequence[str]] = {}
+
+    for line, row in enumerate(rows, start=1):
+        if len(row) < 2 or (section := row[0]) not in sections:  # noqa: PLR2004 as rows start with section and kind
+            continue
+
+        kind = row[1]
+        values = row[2:]
+
+        if kind == HEADER_KIND:
+            headers[section] = values
+            continue
+        if kind not in kinds:
+            continue
+
+        header = headers.get(section)
+        if header is None:
+            msg = f"Line {line}: '{section}' {kind} row before its header."
+            raise ValueError(msg)
+        if len(values) != len(header):
+            msg = f"Line {line}: '{section}' {kind} row has {len(values)} columns, expected {len(header)}."
+            raise ValueError(msg)
+
+        yield CsvSectionRow(section=section, line=line, data=dict(zip(header, values, strict=True)))
+
+
+def iter_csv_section_rows(
+    filepath: Path, sections: Collection[str], *, kinds: Collection[str] = (DATA_KIND,), dialect: str = "excel"
+) -> Iterator[CsvSectionRow]:
+    """Stream the rows of the given ``sections`` of a multi-section CSV file, reading it once."""
+    with filepath.open("r", newline="", encoding="utf-8-sig") as csvfile:
+        yield from iter_section_rows(csv.reader(csvfile, dialect=dialect), sections, kinds=kinds)
@@ -1,11 +1,23 @@
 # SPDX-License-Identifier: GPLv3-or-later
 # Copyright © 2025 pygaindalf Rui Pinheiro
 
+import glob
+import os
+
 from abc import ABCMeta
+from collections.abc import Callable, Iterator, Mapping, Sequence
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, override
 
+from .....portfolio.models.transaction import Transaction
 from .... import Agent, AgentConfig
 
 
+if TYPE_CHECKING:
+    from .....portfolio.models.ledger import Ledger
+    from .manifest import ImportManifest
+
+
 # MARK: Importer Base Configuration
 class ImporterConfig(AgentConfig, metaclass=ABCMeta):
     pass
@@ -13,4 +25,85 @@ class ImporterConfig(AgentConfig, metaclass=ABCMeta):
 
 # MARK: Importer Base class
 class Importer[C: ImporterConfig](Agent[C], metaclass=ABCMeta):
-    pass
+    # MARK: Transactions
+    # Transactions added while processing a file recorded in an import manifest, if any
+    _imported_transactions: list[tuple[Ledger, Transaction]] | None = None
+
+    def _add_transaction(self, ledger: Ledger, transaction: Transaction) -> None:
+        ledger.journal.transactions.add(transaction)
+
+        if (imported := self._imported_transactions) is not None:
+            imported.append((ledger, transaction))
+
+    @property
+    def _create_ledger(self) -> bool:
+        return False
+
+    def _get_restored_ledger(self, instrument_data: Mapping[str, Any]) -> Ledger:
+        isin = instrument_data.get("isin")
+        ticker = instrument_data.get("ticker")
+
+        ledger = self.get_ledger(isin=isin, ticker=ticker)
+        if ledger is not None:
+            return ledger
+
+        if not self._create_ledger:
+            msg = f"Could not find ledger for instrument with {ticker=}, {isin=}."
+            raise ValueError(msg)
+
+        data = {k: v for k, v in instrument_data.items() if k not in {"isin", "ticker"}}
+        return self.get_or_create_ledger(isin=isin, ticker=ticker, **data)
+
+    # MARK: Files
+    @classmethod
+    def _glob(cls, pattern: str) -> Sequence[Path]:
+        paths = sorted(Path(p) for p in glob.glob(os.path.expandvars(pattern)))  # noqa: PTH207
+        if not paths:
+            msg = f"No files matched glob: {pattern}"
+            raise FileNotFoundError(msg)
+        return paths
+
+    @classmethod
+    @override
+    def get_input_paths(cls, config: C) -> Iterator[Path]:
+        yield from super().get_input_paths(config)
+
+        # Importers configured with a glob pattern read every file it matches
+        if isinstance(pattern := getattr(config, "glob", None), str):
+            try:
+                yield from cls._glob(pattern)
+            except FileNotFoundError:
+                return
+
+    def _import_files(self, paths: Sequence[Path], process: Callable[[Path], None], manifest: ImportManifest | None = None) -> None:
+        """Import each of ``paths`` using ``process``.
+
+        If a manifest is given, files it records as unchanged are restored from it instead of being processed, and the manifest is updated
+        with the transactions produced by every file.
+        """
+        if manifest is None:
+            for path in paths:
+                process(path)
+            return
+
+        restored = 0
+        for path in paths:
+            if (entry := manifest.get_unchanged(path)) is not None:
+                for instrument_data, transactions_data in manifest.iter_ledgers(entry):
+                    ledger = self._get_restored_ledger(instrument_data)
+                    for transaction_data in transactions_data:
+                        self._add_transaction(ledger, Transaction(**transaction_data))
+                restored += 1
+                continue
+
+            self._imported_transactions = imported = []
+            try:
+                process(path)
+            finally:
+                self._imported_transactions = None
+            manifest.record(path, imported)
+
+        manifest.prune(paths)
+        manifest.save()
+
+        self.log.info(t"Restored {restored} unchanged files from {manifest.path}, processed {len(paths) - restored} new or modified files")
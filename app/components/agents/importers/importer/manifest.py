@@ -0,0 +1,152 @@
+# SPDX-License-Identifier: GPLv3-or-later
+# Copyright © 2025 pygaindalf Rui Pinheiro
+
+"""Content-addressed manifest of the source files processed by an importer.
+
+For each file, the manifest stores its size, modification time and SHA-256, together with a compact, schema-form copy of the transactions it
+produced grouped by instrument. On later runs, files whose contents are unchanged are restored from
+that copy instead of being re-parsed, so that only new or modified files pay the parsing cost.
+
+The manifest is keyed by the importer configuration and the script version, and is discarded whenever either changes.
+"""
+
+import hashlib
+import json
+import os
+
+from collections.abc import Iterable, Iterator, Mapping, Sequence
+from typing import TYPE_CHECKING, Any, NamedTuple
+
+from .....util.helpers import script_version
+from .schema import LedgerImportData, SchemaImporter
+
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+    from .....portfolio.models.ledger import Ledger
+    from .....portfolio.models.transaction import Transaction
+    from .....util.models.uid import Uid
+    from .importer import ImporterConfig
+
+
+def file_sha256(path: Path) -> str:
+    with path.open("rb") as f:
+        return hashlib.file_digest(f, "sha256").hexdigest()
+
+
+# MARK: Entry
+class ImportManifestEntry(NamedTuple):
+    size: int
+    mtime_ns: int
+    sha256: str
+    ledgers: tuple[Mapping[str, Any], ...]
+
+
+# MARK: Manifest
+class ImportManifest:
+    VERSION = 1
+
+    def __init__(self, path: Path, *, key: str) -> None:
+        self.path = path
+        self.key = key
+        self.entries: dict[str, ImportManifestEntry] = {}
+        self.load()
+
+    @classmethod
+    def for_config(cls, path: Path, config: ImporterConfig) -> ImportManifest:
+        """Return the manifest at ``path`` for an importer with the given configuration."""
+        digest = hashlib.sha256(script_version.version_string.encode())
+        digest.update(config.model_dump_json(exclude={"manifest"}).encode())
+        return cls(path, key=digest.hexdigest())
+
+    # MARK: Persistence
+    def load(self) -> None:
+        self.entries.clear()
+        if not self.path.is_file():
+            return
+
+        data = json.loads(self.path.read_bytes())
+        if data.get("version") != self.VERSION or data.get("key") != self.key:
+            return
+
+        for name, entry in data["files"].items():
+            self.entries[name] = ImportManifestEntry(
+                size=entry["size"],
+                mtime_ns=entry["mtime_ns"],
+                sha256=entry["sha256"],
+                ledgers=tuple(entry["ledgers"]),
+            )
+
+    def save(self) -> None:
+        """Atomically write the manifest."""
+        data = {
+            "version": self.VERSION,
+            "key": self.key,
+            "files": {name: entry._asdict() for name, entry in self.entries.items()},
+        }
+
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = self.path.with_suffix(f".{os.getpid()}.tmp")
+        with tmp.open("w", encoding="utf-8") as f:
+            json.dump(data, f, separators=(",", ":"))
+        tmp.replace(self.path)
+
+    # MARK: Lookup
+    def get_unchanged(self, path: Path) -> ImportManifestEntry | None:
+        """Return the entry for ``path`` if the file is unchanged since it was recorded.
+
+        Files with the recorded size and modification time are assumed unchanged without being read. Otherwise, the file is hashed, so that
+        e.g. a re-downloaded but identical statement is still considered unchanged.
+        """
+        entry = self.entries.get(str(path))
+        if entry is None:
+            return None
+
+        stat = path.stat()
+        if stat.st_size != entry.size:
+            return None
+        if stat.st_mtime_ns == entry.mtime_ns:
+            return entry
+
+        if file_sha256(path) != entry.sha256:
+            return None
+
+        entry = entry._replace(mtime_ns=stat.st_mtime_ns)
+        self.entries[str(path)] = entry
+        return entry
+
+    def iter_ledgers(self, entry: ImportManifestEntry) -> Iterator[tuple[Mapping[str, Any], Sequence[Mapping[str, Any]]]]:
+        """Yield the instrument schema values of each ledger in ``entry``, with the schema values of the transactions to restore into it."""
+        skip = SchemaImporter.SKIP_SCHEMA_FIELDS
+
+        for ledger_data in entry.ledgers:
+            data = LedgerImportData.model_validate(ledger_data)
+            instrument = data.instrument.get_schema_field_values(skip=skip)
+            transactions = tuple(transaction.get_schema_field_values(default_currency=instrument["currency"], skip=skip) for transaction in data.transactions)
+            yield instrument, transactions
+
+    # MARK: Update
+    def record(self, path: Path, transactions: Iterable[tuple[Ledger, Transaction]]) -> None:
+        """Record the transactions produced by parsing ``path``."""
+        stat = path.stat()
+
+        ledgers: dict[Uid, dict[str, Any]] = {}
+        for ledger, transaction in transactions:
+            if (ledger_data := ledgers.get(ledger.uid)) is None:
+                instrument = ledger.instrument.model_dump(mode="json", exclude_none=True, exclude_defaults=True)
+                ledger_data = ledgers[ledger.uid] = {"instrument": instrument, "transactions": []}
+            ledger_data["transactions"].append(transaction.model_dump(mode="json", exclude_none=True, exclude_defaults=True))
+
+        self.entries[str(path)] = ImportManifestEntry(
+            size=stat.st_size,
+            mtime_ns=stat.st_mtime_ns,
+            sha256=file_sha256(path),
+            ledgers=tuple(ledgers.values()),
+        )
+
+    def prune(self, paths: Iterable[Path]) -> None:
+        """Drop the entries of files that are no longer matched."""
+        keep = {str(path) for path in paths}
+        for name in self.entries.keys() - keep:
+            del self.entries[name]
@@ -2,6 +2,7 @@
 # Copyright © 2025 pygaindalf Rui Pinheiro
 
 
+import functools
 import importlib
 
 from abc import ABCMeta
@@ -83,6 +84,25 @@ class PortfolioImportData(ImportData):
     ledgers: tuple[LedgerImportData, ...] = Field(default_factory=tuple, description="The ledgers to import")
 
 
+# MARK: Annotation class resolution
+@functools.lru_cache(maxsize=256)
+def resolve_annotation_class(class_name: str) -> type[Annotation]:
+    """Resolve a dotted annotation class path, relative to the ``app`` package, to the annotation class.
+
+    Results are cached per dotted path, so that importing many annotations of the same class only imports and validates the class once.
+    """
+    module_path, name = class_name.rsplit(".", 1)
+    module = importlib.import_module(f".{module_path}", "app")
+    klass = getattr(module, name, None)
+    if klass is None:
+        msg = f"Annotation class '{class_name}' not found."
+        raise KeyError(msg)
+    elif not isinstance(klass, type) or not issubclass(klass, Annotation):
+        msg = f"Class '{class_name}' is not a subclass of Annotation."
+        raise TypeError(msg)
+    return klass
+
+
 # MARK: Schema Importer Base Configuration
 class SchemaImporterConfig(ImporterConfig, metaclass=ABCMeta):
     pass
@@ -111,16 +131,7 @@ class SchemaImporter[C: SchemaImporterConfig](Importer[C], metaclass=ABCMeta):
                 entity.j.add(annotation)
 
             else:
-                module_path, class_name = annotation_data.class_name.rsplit(".", 1)
-                module = importlib.import_module(f".{module_path}", "app")
-                klass = getattr(module, class_name)
-                if klass is None:
-                    msg = f"Annotation class '{annotation_data.class_name}' not found."
-                    raise KeyError(msg)
-                elif not issubclass(klass, Annotation):
-                    msg = f"Class '{annotation_data.class_name}' is not a subclass of Annotation."
-                    raise TypeError(msg)
-
+                klass = resolve_annotation_class(annotation_data.class_name)
                 extra: frozendict[str, Any] = frozendict(typing_cast("dict[str, Any]", annotation_data.__pydantic_extra__))
                 annotation = klass.create(entity, **extra)
 
@@ -134,11 +145,17 @@ class SchemaImporter[C: SchemaImporterConfig](Importer[C], metaclass=ABCMeta):
             instrument_data = ledger_data.instrument
             instrument = Instrument(**instrument_data.get_schema_field_values(skip=type(self).SKIP_SCHEMA_FIELDS))
 
+            # Pending transaction annotations, keyed by the transaction UID they should be attached to (first match wins)
+            pending_annotations: dict[Uid, tuple[AnnotationImportData, ...]] = {}
+
             transactions = set()
             for transaction_data in ledger_data.transactions:
                 transaction = Transaction(**transaction_data.get_schema_field_values(default_currency=instrument.currency, skip=type(self).SKIP_SCHEMA_FIELDS))
                 transactions.add(transaction)
 
+                if transaction_data.uid is not None:
+                    pending_annotations.setdefault(transaction_data.uid, transaction_data.annotations)
+
             ledger = Ledger(instrument=instrument, transactions=transactions)
             self.portfolio.j.ledgers.add(ledger)
 
@@ -146,13 +163,13 @@ class SchemaImporter[C: SchemaImporterConfig](Importer[C], metaclass=ABCMeta):
             self._import_annotations(instrument, instrument_data.annotations, imported_annotations=imported_annotations)
             self._import_annotations(ledger, ledger_data.annotations, imported_annotations=imported_annotations)
 
+            if not pending_annotations:
+                continue
+
             for transaction in ledger.transactions:
-                for transaction_data in ledger_data.transactions:
-                    if transaction_data.uid == transaction.uid:
-                        break
-                else:
+                if (annotations_data := pending_annotations.get(transaction.uid)) is None:
                     continue
-                self._import_annotations(transaction, transaction_data.annotations, imported_annotations=imported_annotations)
+                self._import_annotations(transaction, annotations_data, imported_annotations=imported_annotations)
 
     def _import_portfolio_from_schema(self, portfolio_data: PortfolioImportData) -> None:
         self._import_ledgers_from_schema(portfolio_data.ledgers)
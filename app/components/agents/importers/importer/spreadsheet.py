@@ -82,6 +82,11 @@ class SpreadsheetImporter[C: SpreadsheetImporterConfig](Importer[C]):
         return {k: v for k, v in data.items() if k not in {"ticker", "isin", "currency"}}
 
     # MARK: Internal Methods
+    @property
+    @override
+    def _create_ledger(self) -> bool:
+        return self.config.create_ledger
+
     def _get_ledger(self, *, data: Mapping[str, Any], ticker: str | None = None, isin: str | None = None) -> Ledger:
         ledger = self.get_ledger(ticker=ticker, isin=isin)
         if ledger is not None:
@@ -197,7 +202,7 @@ class SpreadsheetImporter[C: SpreadsheetImporterConfig](Importer[C]):
         txn_data = self._extract_transaction_data(data)
 
         txn = Transaction(**txn_data)
-        ledger.journal.transactions.add(txn)
+        self._add_transaction(ledger, txn)
 
     def _process_row(self, row: Sequence[str]) -> None:
         data = self._parse_row(row)
@@ -211,6 +216,15 @@ class SpreadsheetImporter[C: SpreadsheetImporterConfig](Importer[C]):
         for row in self._iterate_rows(start=1 if self._has_header else 0):
             self._process_row(row)
 
+    def _process_file(self, filepath: Path) -> None:
+        self.open(filepath)
+        self.process()
+
+    @abstractmethod
+    def open(self, filepath: Path) -> None:
+        msg = "Subclasses must implement the 'open' method."
+        raise NotImplementedError(msg)
+
 
 class BaseCsvSpreadsheetImporter[C: SpreadsheetImporterConfig](SpreadsheetImporter[C]):
     # MARK: Properties and Methods to be Implemented by Subclasses
@@ -218,6 +232,7 @@ class BaseCsvSpreadsheetImporter[C: SpreadsheetImporterConfig](SpreadsheetImport
         msg = "Subclasses must implement the '_get_csv_dialect' method."
         raise NotImplementedError(msg)
 
+    @override
     def open(self, filepath: Path) -> None:
         import csv
 
@@ -3,22 +3,38 @@
 
 
 import datetime
-import glob
-import os
+import re
 
 from collections.abc import Mapping, MutableMapping
-from pathlib import Path
-from typing import Any, ClassVar, override
+from enum import StrEnum
+from typing import TYPE_CHECKING, Any, ClassVar, override
 
 from pydantic import Field
 
 from ....portfolio.models.instrument.instrument_type import InstrumentType
+from ....portfolio.models.transaction import Transaction
 from ....portfolio.models.transaction.transaction_type import TransactionType
-from .importer import BaseCsvSpreadsheetImporter, SpreadsheetImporterConfig
+from ....util.config.models.env_path import EnvPath
+from .importer import BaseCsvSpreadsheetImporter, ImportManifest, SpreadsheetImporterConfig
+from .importer.csv_sections import iter_csv_section_rows
+
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+
+class InteractiveBrokersSection(StrEnum):
+    TRADES = "Trades"
+    DIVIDENDS = "Dividends"
+    CORPORATE_ACTIONS = "Corporate Actions"
 
 
 class InteractiveBrokersImporterConfig(SpreadsheetImporterConfig):
     glob: str = Field(description="The glob pattern to all Interactive Brokers CSV files")
+    manifest: EnvPath | None = Field(default=None, description="Manifest file used to skip re-parsing source files that are unchanged since the previous run")
+    sections: frozenset[InteractiveBrokersSection] = Field(
+        default=frozenset({InteractiveBrokersSection.TRADES}), description="The activity statement sections to import, all of which are read in a single pass"
+    )
 
 
 # MARK: Importer
@@ -34,15 +50,28 @@ class InteractiveBrokersImporter(BaseCsvSpreadsheetImporter[InteractiveBrokersIm
         "Comm/Fee": "fees",
     }
 
+    # Handler method for each section
+    SECTION_HANDLERS: ClassVar[Mapping[InteractiveBrokersSection, str]] = {
+        InteractiveBrokersSection.TRADES: "_import_trade",
+        InteractiveBrokersSection.DIVIDENDS: "_import_dividend",
+        InteractiveBrokersSection.CORPORATE_ACTIONS: "_import_corporate_action",
+    }
+
+    # e.g. 'AAPL(US0378331005) Cash Dividend USD 0.24 per Share (Ordinary Dividend)'
+    DIVIDEND_PATTERN: ClassVar[re.Pattern[str]] = re.compile(r"^(?P<ticker>[^(]+)\((?P<isin>[A-Z0-9]+)\)\s")
+
+    # e.g. 'AAPL(US0378331005) Split 4 for 1 (AAPL, APPLE INC, US0378331005)'
+    SPLIT_PATTERN: ClassVar[re.Pattern[str]] = re.compile(
+        r"^(?P<ticker>[^(]+)\((?P<isin>[A-Z0-9]+)\)\s+Split\s+(?P<new>\d+(?:\.\d+)?)\s+for\s+(?P<old>\d+(?:\.\d+)?)"
+    )
+
+    # Splits already imported from the activity statement being processed, if any
+    _imported_splits: set[tuple[str, datetime.date, str, str]] | None = None
+
     @override
     def _get_csv_dialect(self) -> str:
         return "excel"
 
-    @property
-    @override
-    def _skip_until(self) -> str | int | tuple[int, int] | None:
-        return "Trades"
-
     @property
     @override
     def _has_header(self) -> bool:
@@ -63,6 +92,8 @@ class InteractiveBrokersImporter(BaseCsvSpreadsheetImporter[InteractiveBrokersIm
 
         if itype == "Equity and Index Options":
             return InstrumentType.OPTION
+        elif itype == "Stocks":
+            return InstrumentType.EQUITY
         # TODO: Add more mappings as needed
         else:
             msg = f"Unsupported instrument type '{itype}' encountered during import."
@@ -82,9 +113,7 @@ class InteractiveBrokersImporter(BaseCsvSpreadsheetImporter[InteractiveBrokersIm
         currency = self._get_currency_from_data(data)
 
         # Date
-        datetime_str = self._get_data(data, "datetime")
-        date_str = datetime_str.split(", ")[0]
-        date = datetime.date.strptime(date_str, "%Y-%m-%d")
+        date = self._parse_date(self._get_data(data, "datetime"))
 
         # Quantity
         quantity_str = self._get_data(data, "quantity")
@@ -111,17 +140,102 @@ class InteractiveBrokersImporter(BaseCsvSpreadsheetImporter[InteractiveBrokersIm
             "fees": fees,
         }
 
+    # MARK: Sections
+    def _parse_date(self, datetime_str: str) -> datetime.date:
+        return datetime.date.strptime(datetime_str.split(", ")[0], "%Y-%m-%d")
+
+    def _map_row(self, row: Mapping[str, str]) -> Mapping[str, Any]:
+        return {attr: row[column] for column, attr in self.__class__.HEADER_MAPPINGS.items() if isinstance(column, str) and column in row}
+
+    def _import_trade(self, row: Mapping[str, str]) -> None:
+        data = self._map_row(row)
+        if self._should_import_row_data(data):
+            self._import_row_data(data)
+
+    def _import_dividend(self, row: Mapping[str, str]) -> None:
+        # Skip the per-currency and overall totals
+        currency = row["Currency"]
+        if currency.startswith("Total"):
+            return
+
+        match = self.DIVIDEND_PATTERN.match(row["Description"])
+        if match is None:
+            msg = f"Could not parse dividend description '{row['Description']}'."
+            raise ValueError(msg)
+
+        ticker = match["ticker"].strip()
+        data = {"ticker": ticker, "currency": currency, "asset_category": "Stocks"}
+        ledger = self._get_ledger(data=data, ticker=ticker)
+
+        self._add_transaction(
+            ledger,
+            Transaction(
+                type=TransactionType.DIVIDEND,
+                date=self._parse_date(row["Date"]),
+                quantity=self.decimal(1),
+                consideration=self.decimal.currency(row["Amount"], currency=self._get_currency_from_data(data)),
+            ),
+        )
+
+    def _import_corporate_action(self, row: Mapping[str, str]) -> None:
+        # Skip the totals
+        if row["Asset Category"].startswith("Total"):
+            return
+
+        match = self.SPLIT_PATTERN.match(row["Description"])
+        if match is None:
+            self.log.warning(t"Skipping unsupported corporate action '{row['Description']}', only stock splits are imported")
+            return
+
+        ticker = match["ticker"].strip()
+        date = self._parse_date(row["Date/Time"])
+
+        if (imported := self._imported_splits) is None:
+            msg = "Corporate actions can only be imported while processing an activity statement"
+            raise RuntimeError(msg)
+
+        # Reverse splits are reported as one row removing the old shares and one adding the new ones, so only import each split once
+        key = (ticker, date, match["new"], match["old"])
+        if key in imported:
+            return
+        imported.add(key)
+
+        data = {"ticker": ticker, "currency": row["Currency"], "asset_category": row["Asset Category"]}
+        ledger = self._get_ledger(data=data, ticker=ticker)
+
+        self._add_transaction(
+            ledger,
+            Transaction(
+                type=TransactionType.SPLIT,
+                date=date,
+                quantity=self.decimal(match["new"]) / self.decimal(match["old"]),
+                consideration=self.decimal.currency(0, currency=self._get_currency_from_data(data)),
+            ),
+        )
+
+    def _process_sections(self, filepath: Path) -> None:
+        """Import the configured sections of an activity statement, reading it in a single pass."""
+        sections = self.config.sections
+        self._imported_splits = set()
+
+        try:
+            for row in iter_csv_section_rows(filepath, sections, dialect=self._get_csv_dialect()):
+                handler = getattr(self, self.SECTION_HANDLERS[InteractiveBrokersSection(row.section)])
+                try:
+                    handler(row.data)
+                except Exception as e:
+                    msg = f"Error importing '{row.section}' row {row.line} of '{filepath}': {e}"
+                    raise RuntimeError(msg) from e
+        finally:
+            self._imported_splits = None
+
     @override
     def _do_run(self) -> None:
-        paths = sorted(Path(p) for p in glob.glob(os.path.expandvars(self.config.glob)))  # noqa: PTH207
-        if not paths:
-            msg = f"No files matched glob: {self.config.glob}"
-            raise FileNotFoundError(msg)
+        paths = self._glob(self.config.glob)
+        manifest = ImportManifest.for_config(self.config.manifest, self.config) if self.config.manifest is not None else None
 
         with self.session(f"Interactive Brokers CSV Importer for {self.config.glob}"):
-            for path in paths:
-                self.open(path)
-                self.process()
+            self._import_files(paths, self._process_sections, manifest)
 
 
 COMPONENT = InteractiveBrokersImporter
@@ -3,23 +3,22 @@
 
 
 import datetime
-import glob
-import os
 
 from collections.abc import Mapping, MutableMapping
-from pathlib import Path
 from typing import Any, ClassVar, override
 
 from pydantic import Field
 
 from ....portfolio.models.instrument.instrument_type import InstrumentType
 from ....portfolio.models.transaction.transaction_type import TransactionType
+from ....util.config.models.env_path import EnvPath
 from ....util.helpers.currency import Currency
-from .importer import BaseCsvSpreadsheetImporter, SpreadsheetImporterConfig
+from .importer import BaseCsvSpreadsheetImporter, ImportManifest, SpreadsheetImporterConfig
 
 
 class Trading212ImporterConfig(SpreadsheetImporterConfig):
     glob: str = Field(description="The glob pattern to all Trading 212 CSV files")
+    manifest: EnvPath | None = Field(default=None, description="Manifest file used to skip re-parsing source files that are unchanged since the previous run")
 
 
 # MARK: Importer
@@ -127,15 +126,11 @@ class Trading212Importer(BaseCsvSpreadsheetImporter[Trading212ImporterConfig]):
 
     @override
     def _do_run(self) -> None:
-        paths = sorted(Path(p) for p in glob.glob(os.path.expandvars(self.config.glob)))  # noqa: PTH207
-        if not paths:
-            msg = f"No files matched glob: {self.config.glob}"
-            raise FileNotFoundError(msg)
+        paths = self._glob(self.config.glob)
+        manifest = ImportManifest.for_config(self.config.manifest, self.config) if self.config.manifest is not None else None
 
         with self.session(f"Trading 212 CSV Importer for {self.config.glob}"):
-            for path in paths:
-                self.open(path)
-                self.process()
+            self._import_files(paths, self._process_file, manifest)
 
 
 COMPONENT = Trading212Importer
@@ -3,11 +3,13 @@
 
 
 # Base orchestrator
+from .checkpoint import CheckpointConfig
 from .config import ConfigOrchestrator, ConfigOrchestratorConfig
 from .orchestrator import Orchestrator, OrchestratorConfig
 
 
 __all__ = [
+    "CheckpointConfig",
     "ConfigOrchestrator",
     "ConfigOrchestratorConfig",
     "Orchestrator",
@@ -0,0 +1,120 @@
+# SPDX-License-Identifier: GPLv3-or-later
+# Copyright © 2025 pygaindalf Rui Pinheiro
+
+"""Checkpoints of the portfolio between the stages of a :class:`ConfigOrchestrator`.
+
+After each checkpointed stage, the portfolio is dumped to ``<directory>/<key>.json``. The key of a stage chains the key of the previous stage
+with the configuration of every agent that writes to the portfolio and the list and contents of the files it reads (see
+:meth:`Agent.get_input_paths`, which e.g. expands importer glob patterns), so that a checkpoint is only reused when neither the pipeline up to
+that stage nor its inputs have changed. Agents that do not write to the portfolio leave the key unchanged, e.g. adding or reconfiguring an
+exporter does not invalidate earlier checkpoints.
+"""
+
+import hashlib
+import json
+import os
+
+from collections.abc import Mapping, Sequence
+from typing import TYPE_CHECKING, Any
+
+from pydantic import Field
+
+from ....util.config.models import BaseConfigModel
+from ....util.config.models.env_path import EnvPath
+from ....util.helpers import script_version
+from ..agent import Agent
+
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+    from ..agent import AgentConfig
+
+
+# MARK: Configuration
+class CheckpointConfig(BaseConfigModel):
+    directory: EnvPath = Field(description="Directory where portfolio checkpoints are stored")
+    stages: tuple[str, ...] | None = Field(
+        default=None,
+        description="Titles of the agents after which a checkpoint is written. If not set, a checkpoint is written after every agent that writes to the portfolio.",
+    )
+
+
+# MARK: Stage keys
+def _get_agent_class(config: AgentConfig) -> type[Agent]:
+    component_class = config.component_class
+    if not issubclass(component_class, Agent):
+        msg = f"Expected an Agent component class for '{config.title}', got {component_class.__name__}."
+        raise TypeError(msg)
+    return component_class
+
+
+def _hash_config(digest: Any, config: AgentConfig) -> None:
+    digest.update(config.model_dump_json().encode())
+
+    # Hash the list and contents of every input file the agent reads, so that e.g. a new or modified broker export invalidates the checkpoint
+    paths = sorted({path for path in _get_agent_class(config).get_input_paths(config) if path.is_file()})
+    digest.update(json.dumps([str(path) for path in paths]).encode())
+    for path in paths:
+        with path.open("rb") as f:
+            digest.update(hashlib.file_digest(f, "sha256").digest())
+
+
+def _writes_portfolio(config: AgentConfig) -> bool:
+    return _get_agent_class(config).get_access(config).portfolio.writes
+
+
+def get_stage_keys(configs: Sequence[AgentConfig]) -> Sequence[str]:
+    """Return, for each agent, the key identifying the portfolio state after it runs."""
+    key = hashlib.sha256(f"pygaindalf-checkpoint:{script_version.version_string}".encode()).hexdigest()
+
+    keys = []
+    for config in configs:
+        if _writes_portfolio(config):
+            digest = hashlib.sha256(key.encode())
+            _hash_config(digest, config)
+            key = digest.hexdigest()
+
+        keys.append(key)
+
+    return tuple(keys)
+
+
+# MARK: Stage checkpoints
+class StageCheckpoints:
+    """The checkpoint stages of a sequence of agents, and their checkpoint files."""
+
+    def __init__(self, config: CheckpointConfig, configs: Sequence[AgentConfig]) -> None:
+        self.config = config
+        self.keys = get_stage_keys(configs)
+
+        if config.stages is None:
+            self.stages = frozenset(i for i, cfg in enumerate(configs) if _writes_portfolio(cfg))
+        else:
+            titles = [cfg.title for cfg in configs]
+            if unknown := set(config.stages).difference(titles):
+                msg = f"Unknown checkpoint stages {sorted(unknown)}, expected agent titles from {titles}."
+                raise ValueError(msg)
+            self.stages = frozenset(i for i, title in enumerate(titles) if title in config.stages)
+
+    def path(self, i: int) -> Path:
+        return self.config.directory / f"{self.keys[i]}.json"
+
+    def find_latest(self) -> int | None:
+        """Return the index of the last checkpointed stage that has a checkpoint file, if any."""
+        for i in sorted(self.stages, reverse=True):
+            if self.path(i).is_file():
+                return i
+        return None
+
+    def save(self, i: int, dump: Mapping[str, Any]) -> Path:
+        """Atomically write the portfolio dump for stage ``i``."""
+        path = self.path(i)
+        path.parent.mkdir(parents=True, exist_ok=True)
+
+        tmp = path.with_suffix(f".{os.getpid()}.tmp")
+        with tmp.open("w", encoding="utf-8") as f:
+            json.dump(dump, f, separators=(",", ":"))
+        tmp.replace(path)
+
+        return path
@@ -2,28 +2,152 @@
 # Copyright © 2025 pygaindalf Rui Pinheiro
 
 
+import contextvars
+import heapq
+
 from collections.abc import Sequence
-from typing import override
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from typing import Self, override
+
+from pydantic import Field, PositiveInt, model_validator
 
 from ..agent import Agent, AgentConfig
+from .checkpoint import CheckpointConfig, StageCheckpoints
 from .orchestrator import Orchestrator, OrchestratorConfig
 
 
 # MARK: Configuration
 class ConfigOrchestratorConfig(OrchestratorConfig):
     components: Sequence[AgentConfig]
+    max_workers: PositiveInt = Field(
+        default=1,
+        description="Maximum number of agents to run concurrently. Agents whose declared accesses conflict always run in configuration order; with 1 worker, all agents run one after another.",
+    )
+    checkpoints: CheckpointConfig | None = Field(
+        default=None,
+        description="Write portfolio checkpoints between stages, and resume from the latest valid checkpoint instead of re-running earlier stages",
+    )
+
+    @model_validator(mode="after")
+    def _validate_checkpoints(self) -> Self:
+        if self.checkpoints is not None and self.max_workers > 1:
+            msg = "Checkpoints require agents to run sequentially, i.e. 'max_workers' must be 1."
+            raise ValueError(msg)
+        return self
+
+
+# MARK: Dependencies
+def get_agent_dependencies(configs: Sequence[AgentConfig]) -> Sequence[frozenset[int]]:
+    """Return, for each agent, the indices of the earlier agents it must wait for because their declared accesses conflict."""
+    accesses = []
+    for config in configs:
+        component_class = config.component_class
+        if not issubclass(component_class, Agent):
+            msg = f"Expected an Agent component class for '{config.title}', got {component_class.__name__}."
+            raise TypeError(msg)
+        accesses.append(component_class.get_access(config))
+
+    return tuple(frozenset(i for i in range(j) if accesses[i].conflicts_with(access)) for j, access in enumerate(accesses))
 
 
 # MARK: Orchestrator
 class ConfigOrchestrator(Orchestrator[ConfigOrchestratorConfig]):
     @override
     def _do_run(self) -> None:
+        if self.config.max_workers > 1 and len(self.config.components) > 1:
+            self._run_concurrently()
+            return
+
+        if self.config.checkpoints is not None:
+            self._run_with_checkpoints(self.config.checkpoints)
+            return
+
         for i, component_config in enumerate(self.config.components):
-            title = f"{i}.{component_config.title}"
-            component = component_config.create_component(instance_name=title, instance_parent=self)
-            assert isinstance(component, Agent)
-            with self._create_subcontext(config=component_config.context) as subctx:
-                component.run(subctx)
+            self._run_component(self._create_component(i, component_config), component_config)
+
+    def _create_component(self, i: int, component_config: AgentConfig) -> Agent:
+        title = f"{i}.{component_config.title}"
+        component = component_config.create_component(instance_name=title, instance_parent=self)
+        assert isinstance(component, Agent)
+        return component
+
+    def _run_component(self, component: Agent, component_config: AgentConfig) -> None:
+        with self._create_subcontext(config=component_config.context) as subctx:
+            component.run(subctx)
+
+    def _run_with_checkpoints(self, config: CheckpointConfig) -> None:
+        """Run the configured agents in order, resuming from the latest valid checkpoint and writing a checkpoint after each checkpoint stage."""
+        configs = self.config.components
+        checkpoints = StageCheckpoints(config, configs)
+
+        # Only resume into an empty portfolio, as restoring a checkpoint on top of existing data would duplicate it
+        start = 0
+        if not len(self.context.portfolio.ledgers) and (latest := checkpoints.find_latest()) is not None:
+            path = checkpoints.path(latest)
+            self.log.info(t"Restoring checkpoint {path} after stage '{configs[latest].title}', skipping {latest + 1} agents")
+
+            restore_config = AgentConfig.model_validate({"package": "importers.checkpoint", "title": "checkpoint", "filepath": path})
+            self._run_component(self._create_component(latest, restore_config), restore_config)
+            start = latest + 1
+
+        for i in range(start, len(configs)):
+            self._run_component(self._create_component(i, configs[i]), configs[i])
+
+            if i in checkpoints.stages:
+                dump = self.context.portfolio.model_dump(mode="json", exclude_none=True, exclude_defaults=True)
+                path = checkpoints.save(i, dump)
+                self.log.debug(t"Wrote checkpoint {path} after stage '{configs[i].title}'")
+
+    def _run_concurrently(self) -> None:
+        """Run the configured agents as a DAG, where each agent waits only for the earlier agents whose accesses conflict with its own."""
+        configs = self.config.components
+        components = [self._create_component(i, component_config) for i, component_config in enumerate(configs)]
+
+        dependencies = get_agent_dependencies(configs)
+        dependents: list[list[int]] = [[] for _ in components]
+        for j, deps in enumerate(dependencies):
+            for i in deps:
+                dependents[i].append(j)
+        pending = [len(deps) for deps in dependencies]
+
+        # Ready agents are started in configuration order
+        ready = [j for j, count in enumerate(pending) if not count]
+        heapq.heapify(ready)
+
+        self.log.debug(t"Running {len(components)} agents with up to {self.config.max_workers} workers, dependencies: {dependencies}")
+
+        def _run(j: int) -> None:
+            self._run_component(components[j], configs[j])
+
+        error: BaseException | None = None
+        with ThreadPoolExecutor(max_workers=self.config.max_workers, thread_name_prefix=self.instance_name or type(self).__name__) as executor:
+            running: dict[Future[None], int] = {}
+
+            while ready or running:
+                while ready and error is None:
+                    j = heapq.heappop(ready)
+                    # Each agent runs in a copy of the current context, so that it sees this orchestrator's context, component and span
+                    context = contextvars.copy_context()
+                    running[executor.submit(context.run, _run, j)] = j
+
+                if not running:
+                    break
+
+                done, _ = wait(running, return_when=FIRST_COMPLETED)
+                for future in done:
+                    j = running.pop(future)
+                    if (exception := future.exception()) is not None:
+                        # Stop scheduling new agents, but let the running ones finish
+                        if error is None:
+                            error = exception
+                        continue
+                    for k in dependents[j]:
+                        pending[k] -= 1
+                        if not pending[k]:
+                            heapq.heappush(ready, k)
+
+        if error is not None:
+            raise error
 
 
 COMPONENT = ConfigOrchestrator
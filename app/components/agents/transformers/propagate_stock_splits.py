@@ -45,18 +45,25 @@ class PropagateStockSplitsTransformer(Transformer[PropagateStockSplitsTransforme
         if parent_ledger is None:
             return
 
-        for txn in parent_ledger:
-            if not txn.type.stock_split:
+        # Only the parent's stock splits are visited, through its corporate action index, and splits the ledger already has are skipped
+        index = ledger.corporate_action_index
+        propagated = []
+        for txn in parent_ledger.stock_splits:
+            if index.has_stock_split(txn.date, txn.quantity):
                 continue
             self.log.debug(t"Propagating stock split transaction {txn} from '{parent_ledger}' to '{ledger}'")
 
-            _txn = Transaction(
-                type=txn.type,
-                date=txn.date,
-                quantity=txn.quantity,
-                consideration=txn.consideration,
+            propagated.append(
+                Transaction(
+                    type=txn.type,
+                    date=txn.date,
+                    quantity=txn.quantity,
+                    consideration=txn.consideration,
+                )
             )
-            ledger.journal.transactions.add(_txn)
+
+        if propagated:
+            ledger.journal.transactions.update(propagated)
 
 
 COMPONENT = PropagateStockSplitsTransformer
@@ -121,6 +121,8 @@ class S104BaseTransformer[C: S104BaseTransformerConfig](Transformer[C], metaclas
             return
 
         timedelta_30d = datetime.timedelta(days=30)
+
+        # Product of the ratios of the stock splits seen so far, i.e. the number of shares each disposed share became
         split_ratio = self.decimal(1)
         for other in others:
             assert other.date >= txn.date, "Other transaction must be on or after disposal transaction date"
@@ -135,6 +137,7 @@ class S104BaseTransformer[C: S104BaseTransformerConfig](Transformer[C], metaclas
 
             # Stock splits
             if other.type.stock_split:
+                assert other.quantity > 0, f"Stock split ratio must be positive, got {other.quantity}"
                 split_ratio *= other.quantity  # TODO: Dedicated stock split transaction type?
                 continue
 
@@ -147,10 +150,7 @@ class S104BaseTransformer[C: S104BaseTransformerConfig](Transformer[C], metaclas
                 continue
 
             # Match the transactions
-            if split_ratio != 1:
-                msg = f"Cannot match disposal {txn} with acquisition {other} after stock split adjustment (split ratio {split_ratio}) is not implemented"
-                raise NotImplementedError(msg)
-            fully_matched = self.match_disposal_with_acquisition(txn, other)
+            fully_matched = self.match_disposal_with_acquisition(txn, other, split_ratio=split_ratio)
             if fully_matched:
                 self.log.debug(t"Disposal {txn} fully matched after processing acquisition {other}")
                 return
@@ -158,7 +158,13 @@ class S104BaseTransformer[C: S104BaseTransformerConfig](Transformer[C], metaclas
         if not process_s104_holdings:
             self.log.warning(t"Disposal {txn} not fully matched after processing all acquisitions within 30 days")
 
-    def match_disposal_with_acquisition(self, disposal: Transaction, acquisition: Transaction) -> bool:
+    def match_disposal_with_acquisition(self, disposal: Transaction, acquisition: Transaction, *, split_ratio: Decimal | None = None) -> bool:
+        """Match as many unmatched shares of ``disposal`` as possible with the unmatched shares of ``acquisition``.
+
+        If there were stock splits between both transactions, ``split_ratio`` is the product of their ratios, i.e. each disposed share is
+        matched with ``split_ratio`` acquired shares. The matched quantity of each side is stored explicitly in the pool, so that rounding of
+        non-terminating ratios never over-matches either transaction.
+        """
         acq_remaining = acquisition.s104_quantity_unmatched
         assert acq_remaining > 0, "Acquisition must have unmatched shares"
 
@@ -166,10 +172,17 @@ class S104BaseTransformer[C: S104BaseTransformerConfig](Transformer[C], metaclas
             ann = S104PoolAnnotation.get_or_create(disposal)
             dis_remaining = ann.journal.quantity_unmatched
 
-            matched = min(dis_remaining, acq_remaining)
+            acq_matched = None
+            if split_ratio is None or split_ratio == 1:
+                matched = min(dis_remaining, acq_remaining)
+            elif (acq_matched := dis_remaining * split_ratio) <= acq_remaining:
+                matched = dis_remaining
+            else:
+                matched = min(dis_remaining, acq_remaining / split_ratio)
+                acq_matched = acq_remaining
             assert matched >= 0, "Matched shares must be non-negative"
 
-            ann.journal.create_pool(acquisition, quantity=matched)
+            ann.journal.create_pool(acquisition, quantity=matched, acquisition_quantity=acq_matched)
 
         self.log.debug(t"Matched {matched} shares between disposal {disposal} and acquisition {acquisition}")
         return ann.fully_matched
@@ -278,8 +291,12 @@ class S104BaseTransformer[C: S104BaseTransformerConfig](Transformer[C], metaclas
         return state, unmatched
 
     def _handle_stock_split(self, txn: Transaction, state: S104State) -> S104State:
-        # Simply multiple the number of shares by the ratio
+        """Stock splits: Rescale the number of shares by the split ratio, preserving the pool cost.
+
+        The new holdings only depend on the previous state, so a split never requires earlier states to be recomputed.
+        """
         ratio = txn.quantity  # TODO: This should maybe be handled by a separate Entity type?
+        assert ratio > 0, f"Stock split ratio must be positive, got {ratio}"
 
         return S104State(
             shares=state.shares * ratio,
@@ -290,8 +307,6 @@ class S104BaseTransformer[C: S104BaseTransformerConfig](Transformer[C], metaclas
         """Annotate the given transaction with the updated S104 holdings after it was executed.
 
         This corresponds to point #3 (and #4 if shorting) of https://www.gov.uk/hmrc-internal-manuals/capital-gains-manual/cg51555
-
-        TODO: Handle stock splits
         """
         self.log.debug(t"Annotating S104 holdings for transaction {txn}...")
 
@@ -8,12 +8,14 @@ from collections.abc import Callable
 from contextvars import ContextVar
 from typing import (
     TYPE_CHECKING,
+    ClassVar,
     Concatenate,
     Self,
     Unpack,
 )
 
 from ...util.callguard import CallguardOptions, CallguardWrapped, callguard_class
+from ...util.profiling import PROFILER
 from .component_config import ComponentConfig
 from .component_meta import ComponentMeta
 
@@ -38,6 +40,8 @@ HIDE_TRACEBACK = True
     ignore_patterns=("inside_entrypoint"),
 )
 class Component[C: ComponentConfig](ComponentMeta[C], metaclass=ABCMeta):
+    PROFILING_CATEGORY: ClassVar[str] = "component"
+
     # MARK: Construction
     @staticmethod
     def get_current() -> Component | None:
@@ -64,7 +68,11 @@ class Component[C: ComponentConfig](ComponentMeta[C], metaclass=ABCMeta):
             self._before_entrypoint(entrypoint.__name__, *args, **kwargs)
 
             try:
-                result = self._wrap_entrypoint(entrypoint, *args, **kwargs)
+                if PROFILER.enabled:
+                    with PROFILER.span(f"{self.instance_hierarchy}.{entrypoint.__name__}", category=self.PROFILING_CATEGORY):
+                        result = self._wrap_entrypoint(entrypoint, *args, **kwargs)
+                else:
+                    result = self._wrap_entrypoint(entrypoint, *args, **kwargs)
             finally:
                 self._after_entrypoint(entrypoint.__name__)
 
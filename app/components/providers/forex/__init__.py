@@ -2,11 +2,12 @@
 # Copyright © 2025 pygaindalf Rui Pinheiro
 
 from ...component import component_entrypoint
-from .forex import ForexProvider, ForexProviderConfig
+from .forex import ForexProvider, ForexProviderConfig, ForexRateKey
 
 
 __all__ = [
     "ForexProvider",
     "ForexProviderConfig",
+    "ForexRateKey",
     "component_entrypoint",
 ]
@@ -2,13 +2,16 @@
 # Copyright © 2025 pygaindalf Rui Pinheiro
 
 
+import asyncio
+import datetime
 import decimal
 
 from abc import ABCMeta, abstractmethod
 from decimal import Decimal
 from typing import TYPE_CHECKING
 
-from pydantic import Field
+from frozendict import frozendict
+from pydantic import Field, PositiveInt
 
 from ....util.helpers import classproperty, instance_lru_cache
 from ....util.helpers.currency import Currency
@@ -17,12 +20,19 @@ from .. import Provider, ProviderConfig, ProviderType, component_entrypoint
 
 
 if TYPE_CHECKING:
-    import datetime
+    from collections.abc import Iterable, Mapping, Sequence
+
+
+type ForexRateKey = tuple[Currency, Currency, datetime.date]
 
 
 # MARK: Provider Base Configuration
 class ForexProviderConfig(ProviderConfig, metaclass=ABCMeta):
     precision: int = Field(description="The number of decimal places for exchange rates", default=6)
+    max_concurrency: PositiveInt = Field(
+        default=4,
+        description="The maximum number of exchange rates fetched concurrently when prefetching. Requests remain subject to the shared per-host rate limits.",
+    )
 
 
 # MARK: Provider Base class
@@ -106,3 +116,75 @@ class ForexProvider[C: ForexProviderConfig](Provider[C], metaclass=ABCMeta):
         rate = self._wrap_get_daily_exchange_rate(source=source, target=target, date=date)
 
         return DecimalCurrency(amount * rate, currency=target)
+
+    # MARK: Prefetching
+    def _iter_prefetch_keys(
+        self, *, currencies: Iterable[Currency | str], start_date: datetime.date, end_date: datetime.date, weekdays_only: bool = False
+    ) -> Iterable[ForexRateKey]:
+        if end_date < start_date:
+            msg = f"End date {end_date} must not be before start date {start_date}"
+            raise ValueError(msg)
+
+        # Aliased currencies (e.g. GBX) are served from their alias' rates, so only the alias needs fetching
+        resolved = sorted({self._validate_currency(currency).forex_alias for currency in currencies}, key=lambda c: c.code)
+
+        date = start_date
+        while date <= end_date:
+            if not weekdays_only or date.weekday() < 5:  # noqa: PLR2004
+                for source in resolved:
+                    for target in resolved:
+                        if source is not target:
+                            yield (source, target, date)
+            date += datetime.timedelta(days=1)
+
+    def _validate_prefetched_rate(self, rate: Decimal, *, source: Currency, target: Currency, date: datetime.date) -> Decimal:
+        if not isinstance(rate, Decimal) or not rate.is_finite() or rate <= 0:
+            msg = f"Invalid exchange rate {rate} for {source} to {target} on {date}"
+            raise ValueError(msg)
+        return rate
+
+    async def _aget_daily_exchange_rate(self, *, source: Currency, target: Currency, date: datetime.date) -> Decimal:
+        """Asynchronous variant of :meth:`_get_daily_exchange_rate`.
+
+        By default this runs the synchronous implementation in a worker thread, which keeps the in-memory and HTTP cache semantics unchanged.
+        Rate limiting still happens inside the requests session, whose limiters are shared between all sessions and threads.
+        """
+
+        def _fetch(self: ForexProvider) -> Decimal:
+            return self._get_daily_exchange_rate(source=source, target=target, date=date)
+
+        return await asyncio.to_thread(_fetch, self)
+
+    async def _aprefetch_daily_rates(self, keys: Iterable[ForexRateKey]) -> Mapping[ForexRateKey, Decimal]:
+        semaphore = asyncio.Semaphore(self.config.max_concurrency)
+
+        async def _prefetch(self: ForexProvider, key: ForexRateKey) -> tuple[ForexRateKey, Decimal]:
+            source, target, date = key
+            async with semaphore:
+                rate = await self._aget_daily_exchange_rate(source=source, target=target, date=date)
+            return key, self._validate_prefetched_rate(rate, source=source, target=target, date=date)
+
+        return dict(await asyncio.gather(*(_prefetch(self, key) for key in keys)))
+
+    def _prefetch_daily_rates(self, keys: Sequence[ForexRateKey]) -> Mapping[ForexRateKey, Decimal]:
+        if self.config.max_concurrency > 1 and len(keys) > 1:
+            return asyncio.run(self._aprefetch_daily_rates(keys))
+
+        return {
+            (source, target, date): self._validate_prefetched_rate(
+                self._get_daily_exchange_rate(source=source, target=target, date=date), source=source, target=target, date=date
+            )
+            for source, target, date in keys
+        }
+
+    @component_entrypoint
+    def prefetch_daily_rates(
+        self, *, currencies: Iterable[Currency | str], start_date: datetime.date, end_date: datetime.date, weekdays_only: bool = False
+    ) -> Mapping[ForexRateKey, Decimal]:
+        """Fetch and validate the daily rates between every pair of ``currencies`` for every day in ``[start_date, end_date]``.
+
+        This populates both the in-memory rate cache and, when installed, the HTTP cache, so that later lookups in the same range do not hit the network.
+        """
+        keys = tuple(self._iter_prefetch_keys(currencies=currencies, start_date=start_date, end_date=end_date, weekdays_only=weekdays_only))
+        self.log.info(t"Prefetching {len(keys)} daily exchange rates between {start_date} and {end_date}")
+        return frozendict(self._prefetch_daily_rates(keys))
@@ -9,6 +9,8 @@ from typing import TYPE_CHECKING, Any, override
 
 import requests
 
+from pydantic import Field
+
 from ....util.helpers import instance_lru_cache
 from . import ForexProvider, ForexProviderConfig
 
@@ -21,18 +23,17 @@ if TYPE_CHECKING:
 
 # MARK: Configuration
 class OandaForexProviderConfig(ForexProviderConfig):
-    pass
+    url: str = Field(
+        default="https://fxds-public-exchange-rates-api.oanda.com/cc-api/currencies",
+        description="The OANDA exchange rates API endpoint. Can be pointed at a local stand-in, e.g. for cache warm-up tests.",
+    )
 
 
 # MARK: Provider
 class OandaForexProvider(ForexProvider[OandaForexProviderConfig]):
-    @instance_lru_cache(maxsize=128)
-    @override
-    def _get_daily_exchange_rate(self, *, source: Currency, target: Currency, date: datetime.date) -> Decimal:
-        """Get the daily exchange rate."""
-        url = "https://fxds-public-exchange-rates-api.oanda.com/cc-api/currencies"
+    def _get_request_params(self, *, source: Currency, target: Currency, date: datetime.date) -> dict[str, Any]:
         #         ?base=USD&quote=GBP&data_type=general_currency_pair&start_date=2025-08-05&end_date=2025-08-06'
-        params: dict[str, Any] = {
+        return {
             "base": source.code.upper(),
             "quote": target.code.upper(),
             "data_type": "general_currency_pair",
@@ -40,8 +41,7 @@ class OandaForexProvider(ForexProvider[OandaForexProviderConfig]):
             "end_date": date.strftime("%Y-%m-%d"),
         }
 
-        response = requests.get(url, params=params)
-
+    def _parse_response(self, response: requests.Response, *, source: Currency, target: Currency, date: datetime.date) -> Decimal:
         if response.status_code != HTTPStatus.OK:
             self.log.error(t"Failed to fetch exchange rate ({response.status_code}): {response.text}")
             msg = f"Failed to fetch exchange rate for {source} to {target} on {date}"
@@ -63,5 +63,13 @@ class OandaForexProvider(ForexProvider[OandaForexProviderConfig]):
         self.log.debug(t"Exchange rate for {source} to {target} on {date}: {result}")
         return result
 
+    @instance_lru_cache(maxsize=128)
+    @override
+    def _get_daily_exchange_rate(self, *, source: Currency, target: Currency, date: datetime.date) -> Decimal:
+        """Get the daily exchange rate."""
+        params = self._get_request_params(source=source, target=target, date=date)
+        response = requests.get(self.config.url, params=params)
+        return self._parse_response(response, source=source, target=target, date=date)
+
 
 COMPONENT = OandaForexProvider
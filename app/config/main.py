@@ -3,9 +3,10 @@
 
 
 from frozendict import frozendict
-from pydantic import Field
+from pydantic import Field, PositiveInt
 
 from ..components import AgentConfig, ProviderConfig
+from ..portfolio.models.entity import EntityLogConfig
 from ..util.config import ConfigBase
 from ..util.helpers.frozendict import FrozenDict
 from .default import DefaultConfig
@@ -18,3 +19,9 @@ class Config(ConfigBase):
     providers: FrozenDict[str, ProviderConfig] = Field(default_factory=frozendict, description="Dictionary of configured providers")
 
     agents: tuple[AgentConfig, ...] = Field(default_factory=tuple, description="Tuple of configured agents")
+
+    entity_log: EntityLogConfig = Field(default_factory=EntityLogConfig, description="Retention of the per-entity audit logs")
+
+    max_workers: PositiveInt = Field(
+        default=1, description="Maximum number of top-level agents to run concurrently, when their declared accesses do not conflict"
+    )
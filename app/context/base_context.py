@@ -9,7 +9,6 @@ from functools import cached_property
 from typing import TYPE_CHECKING, Self
 
 from ..components.providers import ProviderType
-from ..portfolio.models.instrument import Instrument
 from ..util.callguard import callguard_class
 from ..util.helpers.decimal import DecimalFactory
 from ..util.mixins import LoggableHierarchicalNamedMixin
@@ -19,6 +18,7 @@ if TYPE_CHECKING:
     from ..components.providers import Provider
     from ..components.providers.forex import ForexProvider
     from ..portfolio.journal import SessionManager
+    from ..portfolio.models.instrument import Instrument
     from ..portfolio.models.ledger import Ledger
     from ..portfolio.models.portfolio import PortfolioProtocol
     from ..portfolio.models.transaction import Transaction
@@ -73,21 +73,21 @@ class Context(LoggableHierarchicalNamedMixin, metaclass=ABCMeta):
             yield from ledger.transactions
 
     def get_instrument(self, isin: str | None = None, ticker: str | None = None) -> Instrument | None:
-        instrument = Instrument.instance(isin=isin, ticker=ticker)
-        if instrument is None:
+        ledger = self.get_ledger(isin=isin, ticker=ticker)
+        if ledger is None:
             return None
 
-        if instrument not in self.portfolio:
-            return None
-
-        return instrument
+        return ledger.instrument
 
     def get_ledger(self, isin: str | None = None, ticker: str | None = None) -> Ledger | None:
-        instrument = self.get_instrument(isin=isin, ticker=ticker)
-        if instrument is None:
-            return None
-
-        return self.portfolio[instrument]
+        if not isinstance(isin, (str, type(None))) or not isinstance(ticker, (str, type(None))):
+            msg = f"Expected 'isin' and 'ticker' to be str or None, got {type(isin).__name__} and {type(ticker).__name__}."
+            raise TypeError(msg)
+
+        # Inside a session, look up the ledgers as edited by the session
+        portfolio = self.portfolio
+        source = journal if (journal := portfolio.journal_or_none) is not None else portfolio
+        return source.get_ledger(isin=isin, ticker=ticker)
 
     @property
     def session_manager(self) -> SessionManager:
@@ -2,7 +2,7 @@
 # Copyright © 2025 pygaindalf Rui Pinheiro
 
 from abc import ABCMeta, abstractmethod
-from collections.abc import Collection
+from collections.abc import Collection, Sequence
 from typing import Any, Literal, Self, override
 from typing import cast as typing_cast
 
@@ -72,6 +72,14 @@ class JournalledCollection[T_Value: Any, T_Original: Collection, T_Mutable: Coll
     def journal(self) -> tuple[T_Journal, ...]:
         return tuple(self._journal)
 
+    @property
+    def edit_count(self) -> int:
+        return len(self._journal)
+
+    def journal_since(self, start: int) -> Sequence[T_Journal]:
+        """Return the edits recorded after the first ``start`` edits, e.g. to apply new edits to a derived index incrementally."""
+        return self._journal[start:]
+
     def __len__(self) -> int:
         return len(self._get_container())
 
@@ -3,7 +3,7 @@
 
 import dataclasses
 
-from collections.abc import Iterator, MutableSet
+from collections.abc import Iterable, Iterator, MutableSet, Sequence
 from collections.abc import Set as AbstractSet
 from enum import Enum
 from typing import Any, override
@@ -42,6 +42,10 @@ class GenericJournalledSet[T: Any, T_Original: AbstractSet, T_Mutable: MutableSe
         self._journal.append(JournalledSetEdit(type=type, value=value.uid if isinstance(value, UidProtocol) else value))
         self._on_edit()
 
+    def _append_journal_many(self, type: JournalledSetEditType, values: Sequence[T]) -> None:  # noqa: A002
+        self._journal.extend(JournalledSetEdit(type=type, value=value.uid if isinstance(value, UidProtocol) else value) for value in values)
+        self._on_edit()
+
     @override
     def __contains__(self, value: object) -> bool:
         return value in self._get_container()
@@ -62,6 +66,17 @@ class GenericJournalledSet[T: Any, T_Original: AbstractSet, T_Mutable: MutableSe
         self._get_mut_container().discard(value)
         self._append_journal(JournalledSetEditType.DISCARD, value)
 
+    def update(self, values: Iterable[T]) -> None:
+        """Add all of ``values`` to the set, notifying the parent of a single edit rather than one per value."""
+        added = [value for value in dict.fromkeys(values) if value not in self]
+        if not added:
+            return
+
+        container = self._get_mut_container()
+        for value in added:
+            container.add(value)
+        self._append_journal_many(JournalledSetEditType.ADD, added)
+
     @override
     def __iter__(self) -> Iterator[T]:
         return iter(self._get_container())
@@ -33,6 +33,13 @@ class JournalledOrderedViewSet[T: Any, T_Mutable: OrderedViewMutableSet, T_Immut
         self._update_frontier_sort_key(self.item_sort_key(value))
         self.clear_sort_cache()
 
+    @override
+    def _append_journal_many(self, type: JournalledSetEditType, values: Sequence[T]) -> None:
+        super()._append_journal_many(type=type, values=values)
+        for value in values:
+            self._update_frontier_sort_key(self.item_sort_key(value))
+        self.clear_sort_cache()
+
     def item_sort_key(self, item: SortKeyProtocol) -> SupportsRichComparison:
         return self._get_container().item_sort_key(item)
 
@@ -72,6 +79,17 @@ class JournalledOrderedViewSet[T: Any, T_Mutable: OrderedViewMutableSet, T_Immut
     def frontier_sort_key(self) -> SupportsRichComparison | None:
         return self._frontier_sort_key
 
+    # MARK: Range invalidation
+    @property
+    def frontier_items(self) -> Sequence[T]:
+        """Return the items at or after the frontier sort key, in sorted order.
+
+        This is the range of items invalidated by the edits made to this set, resolved with a single bisection of the sorted items.
+        """
+        if (frontier_sort_key := self._frontier_sort_key) is None:
+            return ()
+        return self._get_container().from_sort_key(frontier_sort_key)
+
     @overload
     def __getitem__(self, index: int) -> T: ...
     @overload
@@ -1,6 +1,7 @@
 # SPDX-License-Identifier: GPLv3-or-later
 # Copyright © 2025 pygaindalf Rui Pinheiro
 
+import bisect
 import functools
 
 from abc import ABCMeta, abstractmethod
@@ -63,6 +64,25 @@ class OrderedViewCollection[T: Hashable](Sequence[T], Collection[T], metaclass=A
 
     def clear_sort_cache(self) -> None:
         self.sort.cache_clear()
+        self._sort_keys.cache_clear()
+
+    # MARK: Range queries
+    @instance_lru_cache
+    def _sort_keys(self) -> Sequence[SupportsRichComparison]:
+        return tuple(self.item_sort_key(item) for item in self.sorted)
+
+    def bisect_sort_key(self, sort_key: SupportsRichComparison) -> int:
+        """Return the index in :attr:`sorted` of the first item whose sort key is at or after ``sort_key``, in O(log n)."""
+        keys = self._sort_keys()
+        if not self.item_sort_reverse:
+            return bisect.bisect_left(keys, sort_key)
+
+        # Keys are in descending order, so search for the first key that is not above the sort key
+        return bisect.bisect_left(keys, x=True, key=lambda key: not sort_key < key)
+
+    def from_sort_key(self, sort_key: SupportsRichComparison) -> Sequence[T]:
+        """Return the items whose sort key is at or after ``sort_key``, in sorted order."""
+        return self.sorted[self.bisect_sort_key(sort_key) :]
 
     # MARK: Collection ABC
     @override
@@ -42,6 +42,13 @@ class OrderedViewMutableSet[T: Hashable](OrderedViewSet[T], MutableSet[T]):
         self._set.discard(value)
         self.clear_sort_cache()
 
+    def update(self, values: Iterable[T]) -> None:
+        if isinstance(self._set, frozenset):
+            msg = f"Cannot modify frozen {type(self).__name__}."
+            raise TypeError(msg)
+        self._set.update(values)
+        self.clear_sort_cache()
+
     @override
     def clear(self) -> None:
         if isinstance(self._set, frozenset):
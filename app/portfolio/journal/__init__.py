@@ -1,12 +1,16 @@
 # SPDX-License-Identifier: GPLv3-or-later
 # Copyright © 2025 pygaindalf Rui Pinheiro
 
+from .commit_statistics import COMMIT_STATISTICS, CommitStatistics, CommitStatisticsSnapshot
 from .journal import Journal
 from .session import Session
 from .session_manager import SessionManager
 
 
 __all__ = [
+    "COMMIT_STATISTICS",
+    "CommitStatistics",
+    "CommitStatisticsSnapshot",
     "Journal",
     "Session",
     "SessionManager",
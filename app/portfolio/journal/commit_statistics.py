@@ -0,0 +1,214 @@
+# SPDX-License-Identifier: GPLv3-or-later
+# Copyright © 2025 pygaindalf Rui Pinheiro
+
+"""Instrumentation of :class:`Session` commits.
+
+Every commit records a :class:`CommitStatistics` with the size of the commit (dirty journals, created entities), the work it caused
+(notification passes, dependency handlers invoked per record class, records created and deleted) and the time spent in each phase. Each of
+them is then folded into :data:`COMMIT_STATISTICS`, whose snapshots can be exported e.g. by benchmarks, and commits slower than a configurable
+threshold are logged with their full breakdown.
+"""
+
+import contextlib
+import threading
+import time
+
+from collections import Counter
+from collections.abc import Iterable, Iterator, Mapping
+from typing import NamedTuple, override
+
+
+# MARK: Phases
+#: Commit phases, in order. Phases are inclusive, e.g. ``notify`` includes the time spent in ``travel`` and ``notify_dependents``.
+COMMIT_PHASES = ("notify", "travel", "notify_dependents", "notify_hooks", "apply", "journal_commit", "apply_hooks")
+
+
+# MARK: Per-commit statistics
+class CommitStatistics:
+    """Counters and per-phase timings of a single session commit."""
+
+    __slots__ = (
+        "_start_ns",
+        "actor",
+        "dirty_journals",
+        "entities_created",
+        "handlers",
+        "journals_committed",
+        "journals_notified",
+        "notify_passes",
+        "phase_ns",
+        "reason",
+        "records_created",
+        "records_deleted",
+        "total_ns",
+    )
+
+    def __init__(self, *, actor: str, reason: str, dirty_journals: int, entities_created: int) -> None:
+        self.actor = actor
+        self.reason = reason
+
+        self.dirty_journals = dirty_journals
+        self.entities_created = entities_created
+
+        self.notify_passes = 0
+        self.journals_notified = 0
+        self.journals_committed = 0
+        self.records_created = 0
+        self.records_deleted = 0
+
+        # Dependency handlers invoked, keyed by '<record class>.<handler>'
+        self.handlers: Counter[str] = Counter()
+
+        self.phase_ns: Counter[str] = Counter()
+        self.total_ns = 0
+        self._start_ns = time.perf_counter_ns()
+
+    @contextlib.contextmanager
+    def phase(self, name: str) -> Iterator[None]:
+        start = time.perf_counter_ns()
+        try:
+            yield
+        finally:
+            self.phase_ns[name] += time.perf_counter_ns() - start
+
+    def time_iter[T](self, name: str, iterable: Iterable[T]) -> Iterator[T]:
+        """Iterate ``iterable``, accounting the time spent producing each item (but not consuming it) to phase ``name``."""
+        iterator = iter(iterable)
+        while True:
+            start = time.perf_counter_ns()
+            try:
+                item = next(iterator)
+            except StopIteration:
+                return
+            finally:
+                self.phase_ns[name] += time.perf_counter_ns() - start
+            yield item
+
+    def on_handler(self, klass: type, handler: str) -> None:
+        self.handlers[f"{klass.__name__}.{handler}"] += 1
+
+    def finish(self) -> None:
+        self.total_ns = time.perf_counter_ns() - self._start_ns
+
+    @property
+    def total_ms(self) -> float:
+        return self.total_ns / 1e6
+
+    @property
+    def counters(self) -> Mapping[str, int]:
+        return {
+            "dirty_journals": self.dirty_journals,
+            "entities_created": self.entities_created,
+            "notify_passes": self.notify_passes,
+            "journals_notified": self.journals_notified,
+            "journals_committed": self.journals_committed,
+            "records_created": self.records_created,
+            "records_deleted": self.records_deleted,
+            "handlers": self.handlers.total(),
+        }
+
+    def breakdown(self) -> str:
+        """Return a multi-line, human-readable breakdown of this commit."""
+        lines = [f"Commit '{self.reason}' by '{self.actor}' took {self.total_ms:.1f}ms"]
+        lines.append("  " + ", ".join(f"{name}={value}" for name, value in self.counters.items()))
+        lines.extend(f"  {name}: {self.phase_ns[name] / 1e6:.1f}ms" for name in COMMIT_PHASES if name in self.phase_ns)
+        lines.extend(f"  {handler}: {count}" for handler, count in self.handlers.most_common())
+        return "\n".join(lines)
+
+    @override
+    def __repr__(self) -> str:
+        return f"<{type(self).__name__} '{self.reason}' {self.total_ms:.3f}ms {self.dirty_journals} journals>"
+
+
+# MARK: Snapshot
+class CommitStatisticsSnapshot(NamedTuple):
+    commits: int
+    slow_commits: int
+    total_ns: int
+    counters: Mapping[str, int]
+    phase_ns: Mapping[str, int]
+    handlers: Mapping[str, int]
+
+    def as_dict(self) -> dict[str, int]:
+        """Flatten this snapshot into a single mapping, suitable for exporting e.g. as benchmark metrics."""
+        return {
+            "commits": self.commits,
+            "slow_commits": self.slow_commits,
+            "total_ns": self.total_ns,
+            **self.counters,
+            **{f"phase_ns.{name}": value for name, value in self.phase_ns.items()},
+            **{f"handlers.{name}": value for name, value in self.handlers.items()},
+        }
+
+    def __sub__(self, other: CommitStatisticsSnapshot) -> CommitStatisticsSnapshot:
+        def _diff(a: Mapping[str, int], b: Mapping[str, int]) -> Mapping[str, int]:
+            return {key: value for key in a if (value := a[key] - b.get(key, 0))}
+
+        return CommitStatisticsSnapshot(
+            commits=self.commits - other.commits,
+            slow_commits=self.slow_commits - other.slow_commits,
+            total_ns=self.total_ns - other.total_ns,
+            counters=_diff(self.counters, other.counters),
+            phase_ns=_diff(self.phase_ns, other.phase_ns),
+            handlers=_diff(self.handlers, other.handlers),
+        )
+
+    @override
+    def __str__(self) -> str:
+        return f"{self.commits} commits in {self.total_ns / 1e6:.1f}ms ({self.slow_commits} slow)"
+
+
+# MARK: Aggregate statistics
+class CommitStatisticsAggregator:
+    """Thread-safe totals of every commit, and the slow-commit threshold."""
+
+    def __init__(self, slow_threshold_ms: float | None = None) -> None:
+        self._lock = threading.Lock()
+        self.slow_threshold_ms = slow_threshold_ms
+        self._reset()
+
+    def configure(self, *, slow_threshold_ms: float | None) -> None:
+        self.slow_threshold_ms = slow_threshold_ms
+
+    def is_slow(self, statistics: CommitStatistics) -> bool:
+        return self.slow_threshold_ms is not None and statistics.total_ms >= self.slow_threshold_ms
+
+    def record(self, statistics: CommitStatistics) -> None:
+        with self._lock:
+            self._commits += 1
+            self._slow_commits += self.is_slow(statistics)
+            self._total_ns += statistics.total_ns
+            self._counters.update(statistics.counters)
+            self._phase_ns.update(statistics.phase_ns)
+            self._handlers.update(statistics.handlers)
+
+    def _reset(self) -> None:
+        self._commits = 0
+        self._slow_commits = 0
+        self._total_ns = 0
+        self._counters: Counter[str] = Counter()
+        self._phase_ns: Counter[str] = Counter()
+        self._handlers: Counter[str] = Counter()
+
+    def reset(self) -> None:
+        with self._lock:
+            self._reset()
+
+    def snapshot(self) -> CommitStatisticsSnapshot:
+        with self._lock:
+            return CommitStatisticsSnapshot(
+                commits=self._commits,
+                slow_commits=self._slow_commits,
+                total_ns=self._total_ns,
+                counters=dict(self._counters),
+                phase_ns=dict(self._phase_ns),
+                handlers=dict(self._handlers),
+            )
+
+    @override
+    def __str__(self) -> str:
+        return str(self.snapshot())
+
+
+#: Totals of every session commit in this process.
+COMMIT_STATISTICS = CommitStatisticsAggregator()
@@ -3,7 +3,7 @@
 
 import logging
 
-from collections.abc import Mapping, MutableSet, Sequence
+from collections.abc import Iterable, Mapping, MutableSet, Sequence
 from collections.abc import Set as AbstractSet
 from functools import cached_property
 from typing import TYPE_CHECKING, Any, ClassVar, override
@@ -27,6 +27,7 @@ if TYPE_CHECKING:
 
     from ..collections import UidProxyMutableSet
     from ..models.annotation import Annotation
+    from ..models.entity.annotation_index import AnnotationTypeIndex
     from .session import Session
 
 # Sentinel for default parameters
@@ -489,6 +490,15 @@ class Journal(
 
         return result
 
+    # MARK: Annotations
+    @property
+    @override
+    def annotation_index(self) -> AnnotationTypeIndex | None:
+        # While the annotations are unedited they match the record's, so reuse its index; edited annotations are scanned instead
+        if self.is_field_edited("annotations") or (record := self.record_or_none) is None:
+            return None
+        return record.annotation_index
+
     # MARK: Dirty Propagation
     _dirty_children: MutableSet[Uid] = PrivateAttr(default_factory=set)
     _propagated_dirty: bool = PrivateAttr(default=False)
@@ -579,7 +589,17 @@ class Journal(
         deletion = self._marked_for_deletion
         self.log.debug(t"Notifying dependents of pending {'deletion' if deletion else 'update'}...")
 
-        for dep in self.record.dependent_uids:
+        statistics = self.session.commit_statistics
+        if statistics is None:
+            self._notify_dependent_records(deletion=deletion)
+            return
+
+        statistics.journals_notified += 1
+        with statistics.phase("notify_dependents"):
+            self._notify_dependent_records(deletion=deletion)
+
+    def _notify_dependent_records(self, *, deletion: bool) -> None:
+        for dep in self._iter_dependent_uids():
             record = EntityRecord.by_uid(dep)
 
             if not record.marked_for_deletion:
@@ -588,6 +608,13 @@ class Journal(
                 else:
                     record.on_dependency_updated(self)
 
+    def _iter_dependent_uids(self) -> Iterable[Uid]:
+        """Yield the uids of the entity records to notify of the changes in this journal.
+
+        Subclasses may extend this with dependents that are not tracked by the record, e.g. ranges resolved from the edited fields.
+        """
+        return self.record.dependent_uids
+
     def _reset_notified_dependents(self) -> None:
         if not self._notified_dependents:
             return
@@ -603,7 +630,8 @@ class Journal(
         return self._committed
 
     def commit(self) -> EntityRecord | None:
-        if not self.session.in_commit:
+        session = self.session
+        if not session.in_commit:
             msg = f"Cannot commit journal {self} outside of session commit."
             raise RuntimeError(msg)
 
@@ -615,16 +643,27 @@ class Journal(
             self.mark_superseded()
             return record
 
-        if self._marked_for_deletion:
-            self._commit_delete()
-            result = None
+        statistics = session.commit_statistics
+        if statistics is None:
+            result = self._commit_record()
         else:
-            result = self._commit_new_or_update()
+            previous = self.record_or_none
+            with statistics.phase("journal_commit"):
+                result = self._commit_record()
+            statistics.journals_committed += 1
+            statistics.records_deleted += result is None
+            statistics.records_created += result is not None and result is not previous
 
         self._committed = True
         self.mark_superseded()
         return result
 
+    def _commit_record(self) -> EntityRecord | None:
+        if self._marked_for_deletion:
+            self._commit_delete()
+            return None
+        return self._commit_new_or_update()
+
     def _commit_new_or_update(self) -> EntityRecord:
         self.log.debug(t"Committing {'new record' if self.is_new_record else 'update'}...")
 
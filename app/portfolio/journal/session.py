@@ -6,6 +6,7 @@ import sys
 import weakref
 
 from collections.abc import Callable, Iterable, MutableMapping, MutableSet, Sequence
+from collections.abc import Set as AbstractSet
 from typing import TYPE_CHECKING, Any, ClassVar, NotRequired, TypedDict, Unpack, override
 
 from pydantic import ConfigDict, Field, PrivateAttr, computed_field, field_validator
@@ -15,7 +16,9 @@ from ...util.helpers import script_info
 from ...util.models import LoggableHierarchicalModel
 from ...util.models.superseded import SupersededError, superseded_check
 from ...util.models.uid import UID_SEPARATOR, IncrementingUidFactory, Uid, UidProtocol
+from ...util.profiling import PROFILER
 from ..models.entity import Entity, EntityModificationType, EntityRecord
+from .commit_statistics import COMMIT_STATISTICS, CommitStatistics
 from .journal import Journal
 
 
@@ -116,6 +119,10 @@ class Session(LoggableHierarchicalModel):
 
         self._created.add(uid)
 
+    @property
+    def created_uids(self) -> AbstractSet[Uid]:
+        return frozenset(self._created)
+
     # MARK: EntityRecord Journals
     _journals: MutableMapping[Uid, Journal] = PrivateAttr(default_factory=dict)
 
@@ -283,6 +290,7 @@ class Session(LoggableHierarchicalModel):
     # MARK: Commit
     _in_commit: bool = PrivateAttr(default=False)
     _after_commit_notify: bool = PrivateAttr(default=False)
+    _commit_statistics: CommitStatistics | None = PrivateAttr(default=None)
 
     @property
     def in_commit(self) -> bool:
@@ -304,12 +312,17 @@ class Session(LoggableHierarchicalModel):
 
         # TODO: Log commit
         self.log.debug("Committing session...")
+        PROFILER.count("commits")
 
         self._in_commit = True
+        statistics = self._commit_statistics = CommitStatistics(
+            actor=self.actor, reason=self.reason, dirty_journals=sum(1 for j in self._journals.values() if j.dirty), entities_created=len(self._created)
+        )
         try:
             self._commit()
             self._clear()
             self._call_parent_hook("commit")
+            statistics.finish()
         except Exception:
             if exit_on_exception:
                 self.log.exception("Exception occurred during session commit; exiting application.")
@@ -318,12 +331,18 @@ class Session(LoggableHierarchicalModel):
         finally:
             self._in_commit = False
             self._after_commit_notify = False
+            self._commit_statistics = None
 
-        self.log.debug("Commit concluded.")
+        self._report_commit_statistics(statistics)
 
     def _commit(self) -> None:
-        flattened = self._commit_notify()
-        self._commit_apply(flattened)
+        statistics = self._commit_statistics
+        assert statistics is not None, "Commit statistics must be available during commit."
+
+        with statistics.phase("notify"):
+            flattened = self._commit_notify()
+        with statistics.phase("apply"):
+            self._commit_apply(flattened)
 
     def _commit_travel_hierarchy(self, iterable: Iterable[Uid], *, copy: bool = False) -> Iterable[Journal]:
         if copy:
@@ -365,16 +384,20 @@ class Session(LoggableHierarchicalModel):
         """Notify all journals of changes in dependency order, allowing them to update their diffs accordingly."""
         self.log.debug("Notifying journals of changes...")
 
+        statistics = self._commit_statistics
+        assert statistics is not None, "Commit statistics must be available during commit."
+
         flattened = []
         pass_count = 0
         while True:
             pass_count += 1
+            statistics.notify_passes = pass_count
             flattened.clear()
             self.log.debug(t"Starting notify pass {pass_count}...")
 
             self._restart_commit_notify = False
 
-            for j in self._commit_travel_hierarchy(self._journals.keys(), copy=True):
+            for j in statistics.time_iter("travel", self._commit_travel_hierarchy(self._journals.keys(), copy=True)):
                 flattened.append(j)
 
                 if j.notified_dependents:
@@ -387,7 +410,8 @@ class Session(LoggableHierarchicalModel):
             if self._restart_commit_notify:
                 continue
 
-            self._call_parent_hook("notify")
+            with statistics.phase("notify_hooks"):
+                self._call_parent_hook("notify")
             if not self._restart_commit_notify:
                 break
 
@@ -411,6 +435,9 @@ class Session(LoggableHierarchicalModel):
         """Iterate through flattened hierarchy, flatten updates and apply them (creating new entity versions, or deleting them as requested)."""
         self.log.debug("Committing journals...")
 
+        statistics = self._commit_statistics
+        assert statistics is not None, "Commit statistics must be available during commit."
+
         # Apply all journals in dependency order
         for j in flattened:  # for j in self._commit_travel_hierarchy(self._journals.keys(), copy=False):
             j.commit()
@@ -423,4 +450,19 @@ class Session(LoggableHierarchicalModel):
                 self.log.warning(t"Entity {entity.instance_name} created in this session is unreachable; reverting. This may indicate a logic bug.")
                 entity.revert()
 
-        self._call_parent_hook("apply")
+        with statistics.phase("apply_hooks"):
+            self._call_parent_hook("apply")
+
+    # MARK: Commit - Statistics
+    @property
+    def commit_statistics(self) -> CommitStatistics | None:
+        """Statistics of the commit in progress, or ``None`` outside of a commit."""
+        return self._commit_statistics
+
+    def _report_commit_statistics(self, statistics: CommitStatistics) -> None:
+        COMMIT_STATISTICS.record(statistics)
+
+        if COMMIT_STATISTICS.is_slow(statistics):
+            self.log.warning(t"Slow commit exceeded {COMMIT_STATISTICS.slow_threshold_ms}ms threshold:\n{statistics.breakdown()}")
+        else:
+            self.log.debug(t"Commit concluded in {statistics.total_ms:.1f}ms.")
@@ -10,6 +10,7 @@ from typing import Any, Protocol, Unpack, runtime_checkable
 from pydantic import ConfigDict, PrivateAttr, computed_field, field_validator
 
 from ...util.models import LoggableHierarchicalModel
+from ...util.profiling import PROFILER
 from .protocols import SessionManagerHookLiteral, SessionManagerHooksProtocol
 from .session import Session, SessionOptions
 
@@ -67,6 +68,7 @@ class SessionManager(LoggableHierarchicalModel):
 
         session = self._session = Session(instance_parent=weakref.ref(self), **kwargs)
         assert session.instance_parent is self, "Session instance parent mismatch."
+        PROFILER.count("sessions")
         return session
 
     def _commit(self) -> None:
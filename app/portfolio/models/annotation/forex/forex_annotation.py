@@ -130,10 +130,8 @@ class ForexAnnotationDependencyHandler(
     def entity_matchers(owner: ForexAnnotationRecord, record: TransactionRecord | InstrumentRecord) -> bool:
         return record is owner.record_parent or record is owner.transaction.instrument
 
-    @staticmethod
-    @override
-    def attribute_matchers(owner: ForexAnnotationRecord, record: TransactionRecord | InstrumentRecord, attribute: str, value: Any) -> bool:
-        return attribute in ("consideration", "date")
+    # Plain attribute names let the dependency event dispatch index this handler by attribute
+    attribute_matchers = ("consideration", "date")
 
     @staticmethod
     @override
@@ -3,7 +3,6 @@
 
 from typing import Any, override
 
-from ....collections.journalled.set.ordered_view_set import JournalledOrderedViewSet
 from ...entity import EntityDependencyEventHandlerImpl, EntityDependencyEventType
 from ...ledger import LedgerRecord
 from ...transaction import TransactionRecord
@@ -27,16 +26,8 @@ class S104AnnotationDependencyHandler(
     @override
     def attribute_matchers(owner: TransactionAnnotationRecord, record: TransactionRecord | LedgerRecord, attribute: str, value: Any) -> bool:
         if isinstance(record, LedgerRecord):
-            if attribute != "transactions":
-                return False
-
-            assert isinstance(value, JournalledOrderedViewSet), "Expected value to be JournalledOrderedViewSet"
-            frontier_sort_key = value.frontier_sort_key
-            if frontier_sort_key is None:
-                return False
-
-            self_sort_key = owner.transaction.sort_key()
-            return bool(frontier_sort_key <= self_sort_key)
+            # Ledger journals only notify the annotations of transactions at or after the earliest edited transaction
+            return attribute == "transactions"
         else:
             return attribute in ("type", "date", "quantity")
 
@@ -49,5 +40,30 @@ class S104AnnotationDependencyHandler(
         *,
         matched_attributes: frozenset[str] | None = None,
     ) -> None:
+        if isinstance(record, LedgerRecord) and event is EntityDependencyEventType.UPDATED:
+            S104AnnotationDependencyHandler._invalidate(owner)
+            return
+
         msg = f"S104 annotation detected unsupported dependency event {event} for record {record}"
         raise NotImplementedError(msg)
+
+    @staticmethod
+    def _invalidate(owner: TransactionAnnotationRecord) -> None:
+        """Delete an annotation whose transaction is at or after the earliest edit to its ledger, so that the S104 transformers recompute it.
+
+        Pools are stored on both of their transactions, so the pool annotations of matched transactions are deleted too, even if they precede the
+        edit, as otherwise their matches would outlive this annotation's.
+        """
+        from .s104_pool_annotation import S104PoolAnnotation, S104PoolAnnotationRecord
+
+        owner.log.debug(t"Invalidating S104 annotation {owner} after an edit to the transactions of its ledger.")
+        owner.delete()
+
+        if not isinstance(owner, S104PoolAnnotationRecord):
+            return
+
+        transaction = owner.transaction
+        for pool in owner.pools:
+            other = pool.disposal if pool.acquisition is transaction else pool.acquisition
+            if (annotation := S104PoolAnnotation.get(other)) is not None:
+                annotation.record.delete()
@@ -4,15 +4,17 @@
 from abc import ABCMeta
 from collections.abc import MutableSequence, Sequence
 from decimal import Decimal
-from typing import TYPE_CHECKING, override
+from functools import cached_property
+from typing import TYPE_CHECKING, NamedTuple, override
 
-from pydantic import Field, field_validator
+from pydantic import Field, PrivateAttr, field_validator
 
 from app.util.models import SingleInitializationModel
 
 from .....util.helpers.currency import S104_CURRENCY
 from .....util.helpers.empty_class import empty_class
 from .....util.models import NonChild
+from ...entity import EntityRecord
 from ...transaction import Transaction
 from ..annotation_schema import AnnotationSchema
 from ..transaction_annotation import TransactionAnnotationImpl, TransactionAnnotationJournal, TransactionAnnotationRecord, UniqueTransactionAnnotation
@@ -24,10 +26,21 @@ if TYPE_CHECKING:
 
 
 # MARK: S104 Pool
+class S104PoolAggregates(NamedTuple):
+    unit_cost: DecimalCurrency
+    total_cost: DecimalCurrency
+    unit_proceeds: DecimalCurrency
+    total_proceeds: DecimalCurrency
+
+
 class S104Pool(SingleInitializationModel):
     acquisition: NonChild[Transaction] = Field(description="The acquisition transaction for this S104 pool.")
     disposal: NonChild[Transaction] = Field(description="The disposal transaction for this S104 pool.")
     quantity: Decimal = Field(description="The quantity of shares in this S104 pool.")
+    acquisition_quantity: Decimal | None = Field(
+        default=None,
+        description="The quantity of acquired shares in this S104 pool, if different from 'quantity' because of stock splits between the disposal and the acquisition.",
+    )
 
     @field_validator("acquisition", mode="after")
     def _validate_acquisition(cls, acquisition: Transaction) -> Transaction:
@@ -50,29 +63,97 @@ class S104Pool(SingleInitializationModel):
             raise ValueError(msg)
         return quantity
 
+    @field_validator("acquisition_quantity", mode="after")
+    def _validate_acquisition_quantity(cls, quantity: Decimal | None) -> Decimal | None:
+        if quantity is not None and quantity <= Decimal(0):
+            msg = f"S104PoolInfo acquisition quantity must be positive, got {quantity}"
+            raise ValueError(msg)
+        return quantity
+
+    # MARK: Quantities
+    @property
+    def split_ratio(self) -> Decimal:
+        """Number of acquired shares matched per disposed share, i.e. the product of the stock split ratios between the disposal and the acquisition."""
+        if self.acquisition_quantity is None:
+            return Decimal(1)
+        return self.acquisition_quantity / self.quantity
+
+    def get_quantity(self, transaction: Transaction) -> Decimal:
+        """Return the quantity of shares of the given transaction matched by this pool."""
+        if transaction is self.acquisition and self.acquisition_quantity is not None:
+            return self.acquisition_quantity
+        return self.quantity
+
+    # MARK: Aggregates
+    _aggregates: tuple[tuple[EntityRecord | None, ...], S104PoolAggregates] | None = PrivateAttr(default=None)
+
+    def _get_aggregates_version(self) -> tuple[EntityRecord | None, ...] | None:
+        """Return the records the aggregates are computed from, or ``None`` if any of them has uncommitted edits.
+
+        Records are immutable and replaced on every update, so the aggregates remain valid for as long as these records are current.
+        """
+        version: list[EntityRecord | None] = []
+        for transaction in (self.acquisition, self.disposal):
+            for entity in (transaction, transaction.forex_annotation_or_none):
+                if entity is None:
+                    version.append(None)
+                    continue
+                if entity.dirty or (record := entity.record_or_none) is None:
+                    return None
+                version.append(record)
+        return tuple(version)
+
+    @property
+    def aggregates(self) -> S104PoolAggregates:
+        """Cost and proceeds of this pool in the S104 currency.
+
+        These are computed on first access and then reused by every subsequent read, until the pool's transactions or their forex annotations are
+        updated.
+        """
+        version = self._get_aggregates_version()
+        if version is not None and (cached := self._aggregates) is not None and all(a is b for a, b in zip(cached[0], version, strict=True)):
+            return cached[1]
+
+        aggregates = self._compute_aggregates()
+        self._aggregates = None if version is None else (version, aggregates)
+        return aggregates
+
+    def _compute_aggregates(self) -> S104PoolAggregates:
+        one = Decimal(1)
+        acquisition = self.acquisition
+        disposal = self.disposal
+
+        # Costs are per disposed share, i.e. acquisitions after a stock split contribute 'split_ratio' acquired shares per disposed share
+        ratio = self.split_ratio
+        acquisition_quantity = self.get_quantity(acquisition)
+
+        return S104PoolAggregates(
+            unit_cost=acquisition.get_partial_consideration(ratio, currency=S104_CURRENCY) + acquisition.get_partial_fees(ratio, currency=S104_CURRENCY),
+            total_cost=(
+                acquisition.get_partial_consideration(acquisition_quantity, currency=S104_CURRENCY)
+                + acquisition.get_partial_fees(acquisition_quantity, currency=S104_CURRENCY)
+            ),
+            unit_proceeds=disposal.get_partial_consideration(one, currency=S104_CURRENCY) - disposal.get_partial_fees(one, currency=S104_CURRENCY),
+            total_proceeds=(
+                disposal.get_partial_consideration(self.quantity, currency=S104_CURRENCY) - disposal.get_partial_fees(self.quantity, currency=S104_CURRENCY)
+            ),
+        )
+
     @property
     def unit_cost(self) -> DecimalCurrency:
-        consideration = self.acquisition.get_partial_consideration(Decimal(1), currency=S104_CURRENCY)
-        fees = self.acquisition.get_partial_fees(Decimal(1), currency=S104_CURRENCY)
-        return consideration + fees
+        return self.aggregates.unit_cost
 
     @property
     def total_cost(self) -> DecimalCurrency:
-        consideration = self.acquisition.get_partial_consideration(self.quantity, currency=S104_CURRENCY)
-        fees = self.acquisition.get_partial_fees(self.quantity, currency=S104_CURRENCY)
-        return consideration + fees
+        return self.aggregates.total_cost
 
     @property
     def unit_proceeds(self) -> DecimalCurrency:
-        consideration = self.disposal.get_partial_consideration(Decimal(1), currency=S104_CURRENCY)
-        fees = self.disposal.get_partial_fees(Decimal(1), currency=S104_CURRENCY)
-        return consideration - fees
+        return self.aggregates.unit_proceeds
 
     @property
     def total_proceeds(self) -> DecimalCurrency:
-        consideration = self.disposal.get_partial_consideration(self.quantity, currency=S104_CURRENCY)
-        fees = self.disposal.get_partial_fees(self.quantity, currency=S104_CURRENCY)
-        return consideration - fees
+        return self.aggregates.total_proceeds
 
     @property
     def total_gain(self) -> DecimalCurrency:
@@ -107,8 +188,9 @@ class S104PoolAnnotationImpl[
     @property
     def quantity_matched(self) -> Decimal:
         result = self.decimal(0)
+        txn = self.transaction
         for pool in self.pools:
-            result += pool.quantity
+            result += pool.get_quantity(txn)
         assert result >= 0, "Matched quantity cannot be negative"
         assert result <= self.transaction.quantity, "Matched quantity cannot exceed transaction quantity"
         return result
@@ -150,8 +232,8 @@ class S104PoolAnnotationJournal(
             msg = f"Pool acquisition or disposal must match the annotation transaction, got {pool.acquisition} and {pool.disposal}"
             raise ValueError(msg)
 
-        if pool.quantity > self.quantity_unmatched:
-            msg = f"Cannot append pool with quantity {pool.quantity} greater than unmatched quantity {self.quantity_unmatched}"
+        if (quantity := pool.get_quantity(txn)) > self.quantity_unmatched:
+            msg = f"Cannot append pool with quantity {quantity} greater than unmatched quantity {self.quantity_unmatched}"
             raise ValueError(msg)
 
         other = pool.disposal if txn is pool.acquisition else pool.acquisition
@@ -161,7 +243,7 @@ class S104PoolAnnotationJournal(
 
         self.pools.append(pool)
 
-    def create_pool(self, other: Transaction, *, quantity: Decimal) -> None:
+    def create_pool(self, other: Transaction, *, quantity: Decimal, acquisition_quantity: Decimal | None = None) -> None:
         txn = self.transaction
 
         if txn.instrument is not other.instrument:
@@ -184,6 +266,7 @@ class S104PoolAnnotationJournal(
             acquisition=acquisition,
             disposal=disposal,
             quantity=quantity,
+            acquisition_quantity=acquisition_quantity,
         )
 
         self._append_pool(pool_info)
@@ -198,6 +281,13 @@ class S104PoolAnnotationRecord(
     init=False,
     unsafe_hash=True,
 ):
+    # Records are immutable, so the quantity matched by their pools is computed at most once
+    # Costs and proceeds are not cached here, as they follow updates to the pools' transactions and are already cached by each pool
+    @cached_property
+    @override
+    def quantity_matched(self) -> Decimal:  # pyright: ignore[reportIncompatibleMethodOverride]
+        return super().quantity_matched
+
     @classmethod
     @override
     def __init_dependencies__(cls) -> None:
@@ -2,6 +2,7 @@
 # Copyright © 2025 pygaindalf Rui Pinheiro
 
 
+from .annotation_index import AnnotationTypeIndex
 from .dependency_event_handler import (
     EntityDependencyEventAttributeMatcher,
     EntityDependencyEventEntityMatcher,
@@ -14,7 +15,8 @@ from .dependency_event_handler.model import EntityDependencyEventHandlerModel
 from .entity import Entity
 from .entity_base import EntityBase
 from .entity_impl import EntityImpl
-from .entity_log import EntityLog, EntityLogEntry, EntityModificationType
+from .entity_log import CompactEntityLogEntry, EntityLog, EntityLogEntry, EntityLogRetention, EntityModificationType
+from .entity_log_config import EntityLogConfig
 from .entity_record import EntityRecord
 from .entity_record_base import EntityRecordBase
 from .entity_schema import EntitySchema
@@ -24,6 +26,8 @@ from .instance_store import InstanceStoreMixin, NamedInstanceStoreMixin
 
 
 __all__ = [
+    "AnnotationTypeIndex",
+    "CompactEntityLogEntry",
     "Entity",
     "EntityBase",
     "EntityDependencyEventAttributeMatcher",
@@ -35,7 +39,9 @@ __all__ = [
     "EntityDependencyEventType",
     "EntityImpl",
     "EntityLog",
+    "EntityLogConfig",
     "EntityLogEntry",
+    "EntityLogRetention",
     "EntityModificationType",
     "EntityRecord",
     "EntityRecordBase",
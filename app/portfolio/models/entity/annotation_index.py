@@ -0,0 +1,52 @@
+# SPDX-License-Identifier: GPLv3-or-later
+# Copyright © 2025 pygaindalf Rui Pinheiro
+
+
+from collections.abc import Iterable
+from typing import TYPE_CHECKING, override
+
+
+if TYPE_CHECKING:
+    from ....util.models.uid import Uid
+    from ..annotation import Annotation
+
+
+# MARK: Annotation type index
+class AnnotationTypeIndex:
+    """Index of an immutable collection of annotations by annotation class.
+
+    Annotations are grouped by their concrete class when the index is built. Lookups by a (possibly abstract) annotation class are resolved
+    against the concrete classes once and then memoized, so repeated lookups of the same annotation class are O(1).
+
+    As records are immutable, each record owns its own index. Commits create new records (and therefore new indices), and rollbacks discard the
+    journal while leaving the record and its index untouched, so the index never needs to be invalidated.
+    """
+
+    __slots__ = ("_by_class", "_by_concrete_class")
+
+    def __init__(self, annotations: Iterable[Annotation]) -> None:
+        by_concrete_class: dict[type[Annotation], list[Annotation]] = {}
+        for annotation in annotations:
+            by_concrete_class.setdefault(type(annotation), []).append(annotation)
+
+        self._by_concrete_class: dict[type[Annotation], tuple[Annotation, ...]] = {
+            klass: tuple(annotations) for klass, annotations in by_concrete_class.items()
+        }
+        self._by_class: dict[type, tuple[Annotation, ...]] = {}
+
+    def get[T: Annotation](self, cls: type[T]) -> tuple[T, ...]:
+        if (result := self._by_class.get(cls)) is None:
+            result = self._by_class[cls] = tuple(
+                annotation for klass, annotations in self._by_concrete_class.items() if issubclass(klass, cls) for annotation in annotations
+            )
+        return result  # pyright: ignore[reportReturnType]
+
+    def get_uids(self, cls: type[Annotation]) -> tuple[Uid, ...]:
+        return tuple(annotation.uid for annotation in self.get(cls))
+
+    def __len__(self) -> int:
+        return sum(len(annotations) for annotations in self._by_concrete_class.values())
+
+    @override
+    def __repr__(self) -> str:
+        return f"<{type(self).__name__} {len(self)} annotations, {len(self._by_concrete_class)} classes>"
@@ -4,6 +4,7 @@
 
 from collections.abc import Callable
 from typing import TYPE_CHECKING, Any, dataclass_transform
+from typing import cast as typing_cast
 
 from pydantic import Field, InstanceOf
 
@@ -14,6 +15,7 @@ from .....util.mixins import LoggableMixin
 if TYPE_CHECKING:
     from ....journal import Journal
     from ..entity_record import EntityRecord
+    from ..entity_record_base import EntityRecordBase
     from .protocols import EntityDependencyEventAttributeMatcher, EntityDependencyEventEntityMatcher, EntityDependencyEventHandler
     from .type_enum import EntityDependencyEventType
 
@@ -53,6 +55,30 @@ class EntityDependencyEventHandlerBase[
     def register(self, owner: type[T_Owner]) -> None:
         owner.register_dependency_event_handler(self)
 
+    # MARK: Indexing
+    @property
+    def indexed_attributes(self) -> frozenset[str] | None:
+        """Return the attribute names this handler matches, if its attribute matchers are all plain attribute names.
+
+        Returns ``None`` if the handler matches any attribute, or uses callable attribute matchers that must be called for every edited attribute.
+        """
+        matchers = self.attribute_matchers
+        if not matchers or isinstance(matchers, Callable):
+            return None
+        if isinstance(matchers, str):
+            return frozenset((matchers,))
+        if all(isinstance(matcher, str) for matcher in matchers):
+            return frozenset(typing_cast("tuple[str, ...]", matchers))
+        return None
+
+    def match_classes(self, owner_class: type[EntityRecordBase], record_class: type[EntityRecordBase], event: EntityDependencyEventType) -> bool:
+        """Return whether this handler may handle events of the given type, between any instances of the given owner and record classes."""
+        if not issubclass(owner_class, self.get_owner_class(owner=True)):
+            return False
+        if not issubclass(record_class, self.get_record_class()):
+            return False
+        return self.match_event(event)
+
     # MARK: Matching
     def match_event(self, event: EntityDependencyEventType) -> bool:
         if event.updated and self.on_updated:
@@ -0,0 +1,108 @@
+# SPDX-License-Identifier: GPLv3-or-later
+# Copyright © 2025 pygaindalf Rui Pinheiro
+
+
+from collections.abc import Iterable, Mapping
+from typing import TYPE_CHECKING, override
+
+
+if TYPE_CHECKING:
+    from ....journal import Journal
+    from ..entity_record import EntityRecord
+    from .base import EntityDependencyEventHandlerBase
+    from .type_enum import EntityDependencyEventType
+
+
+# MARK: Dispatch table
+class EntityDependencyEventDispatch:
+    """Pre-filtered dependency event handlers for a given (owner class, record class, event type) triple.
+
+    Handlers are filtered by owner class, record class and event type once, when the table is built. Handlers whose attribute matchers are plain
+    attribute names are additionally indexed by attribute name, so that an update only reaches the handlers interested in one of the edited
+    attributes. Handlers with callable attribute matchers still have them called for every edited attribute.
+
+    Every handler called during a session commit is counted in the commit's statistics.
+    """
+
+    __slots__ = ("attribute_index", "event", "handlers", "names", "unindexed")
+
+    def __init__(self, event: EntityDependencyEventType, handlers: Iterable[EntityDependencyEventHandlerBase]) -> None:
+        self.event = event
+        self.handlers: tuple[EntityDependencyEventHandlerBase, ...] = tuple(handlers)
+        self.names: tuple[str, ...] = tuple(getattr(handler.handler, "__qualname__", type(handler).__name__) for handler in self.handlers)
+
+        # Positions of the handlers that must be considered for every event, and of the handlers interested in each attribute name
+        unindexed: list[int] = []
+        attribute_index: dict[str, list[int]] = {}
+        for position, handler in enumerate(self.handlers):
+            if not event.updated or (names := handler.indexed_attributes) is None:
+                unindexed.append(position)
+                continue
+            for name in names:
+                attribute_index.setdefault(name, []).append(position)
+
+        self.unindexed: tuple[int, ...] = tuple(unindexed)
+        self.attribute_index: Mapping[str, tuple[int, ...]] = {name: tuple(positions) for name, positions in attribute_index.items()}
+
+    @staticmethod
+    def _get_edited_attributes(journal: Journal) -> frozenset[str]:
+        from ....collections.journalled.collection import JournalledCollection
+
+        return frozenset(attribute for attribute, value in journal.get_diff().items() if not isinstance(value, JournalledCollection) or value.edited)
+
+    def __call__(self, owner: EntityRecord, record: EntityRecord, journal: Journal) -> bool:
+        """Call every matching handler, returning whether any handler was called.
+
+        Stops early if one of the handlers marks the owner for deletion.
+        """
+        if not self.handlers:
+            return False
+
+        if owner is record:
+            msg = "An entity cannot handle its own dependency events."
+            raise ValueError(msg)
+
+        # Narrow down the candidates using the attribute index, keeping registration order
+        edited: frozenset[str] | None = None
+        if self.attribute_index:
+            assert journal is not None, "Journal must be provided when matching attributes."
+            edited = self._get_edited_attributes(journal)
+            candidates = set(self.unindexed)
+            for attribute in edited:
+                candidates.update(self.attribute_index.get(attribute, ()))
+            positions = sorted(candidates)
+        else:
+            positions = self.unindexed
+
+        event = self.event
+        statistics = journal.session.commit_statistics
+        matched = False
+        for position in positions:
+            handler = self.handlers[position]
+
+            if not handler.match_entity(owner, event, record):
+                continue
+
+            matched_attributes: frozenset[str] | None = None
+            if event.updated and handler.attribute_matchers:
+                if edited is not None and (names := handler.indexed_attributes) is not None:
+                    matched_attributes = (names & edited) or None
+                else:
+                    matched_attributes = handler.match_attributes(owner, record, journal)
+                if matched_attributes is None:
+                    continue
+
+            handler.call(owner, event, record, matched_attributes=matched_attributes)
+            matched = True
+            if statistics is not None:
+                statistics.on_handler(type(owner), self.names[position])
+
+            # Abort if one of the handlers marks this entity for deletion
+            if owner.marked_for_deletion:
+                break
+
+        return matched
+
+    @override
+    def __repr__(self) -> str:
+        return f"<{type(self).__name__} {self.event.value} with {len(self.handlers)} handlers, {len(self.attribute_index)} indexed attributes>"
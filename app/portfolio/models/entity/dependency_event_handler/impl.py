@@ -13,6 +13,10 @@ if TYPE_CHECKING:
     from .type_enum import EntityDependencyEventType
 
 
+def _match_any_attribute(owner: EntityRecord, record: EntityRecord, attribute: str, value: Any) -> bool:  # noqa: ARG001
+    return True
+
+
 # MARK: Implementation Record
 class EntityDependencyEventHandlerImpl[
     T_Owner: EntityRecord,
@@ -26,10 +30,8 @@ class EntityDependencyEventHandlerImpl[
     def entity_matchers(owner: T_Owner, record: T_Record) -> bool:
         return True
 
-    @staticmethod
-    @override
-    def attribute_matchers(owner: T_Owner, record: T_Record, attribute: str, value: Any) -> bool:
-        return True
+    # Subclasses override this with either a callable matcher, or plain attribute names that let the dependency event dispatch index them by attribute
+    attribute_matchers = staticmethod(_match_any_attribute)
 
     @staticmethod
     @override
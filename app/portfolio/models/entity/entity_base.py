@@ -6,7 +6,6 @@ import weakref
 
 from abc import ABCMeta, abstractmethod
 from collections.abc import Iterable, Mapping, MutableMapping
-from functools import lru_cache, partialmethod
 from typing import TYPE_CHECKING, Any, ClassVar, Self, final, override
 from typing import cast as typing_cast
 
@@ -31,6 +30,7 @@ from .entity_common import EntityCommon
 from .entity_dependents import EntityDependents
 from .entity_log import EntityLog
 from .entity_record import EntityRecord
+from .entity_record_attribute import EntityRecordAttribute
 
 
 if TYPE_CHECKING:
@@ -206,11 +206,7 @@ class EntityBase[
             msg = "The 'unsafe_hash' argument must always be 'True' for EntityBase subclasses."
             raise ValueError(msg)
 
-        # Seed the dunder methods from the record type.
-        record_type = cls.get_record_type(origin=True)
-        for name, _ in inspect.getmembers_static(record_type, predicate=inspect.isfunction):
-            if cls._should_copy_record_method_to_class(name):
-                setattr(cls, name, partialmethod(cls.call_record_method, name))
+        cls._install_record_attributes()
 
     # MARK: Lookup
     @classmethod
@@ -685,6 +681,7 @@ class EntityBase[
 
     def on_delete_record(self) -> None:
         self._set_record(None)
+        self._get_entity_store().unpin(self.uid)
 
     # MARK: Revertion
     def revert(self) -> None:
@@ -707,6 +704,7 @@ class EntityBase[
         if record is not None:
             record.revert()
             self._set_record(None)
+        self._get_entity_store().unpin(self.uid)
 
         if self.version != version - 1:
             msg = f"Expected entity log version to be {version - 1} after revert, got {self.version} instead."
@@ -727,6 +725,36 @@ class EntityBase[
         return self.__class__(**data)
 
     # MARK: Fields
+    __entity_record_attributes__: ClassVar[frozenset[str]] = frozenset()
+
+    @final
+    @classmethod
+    def _install_record_attributes(cls) -> None:
+        """Generate a forwarding descriptor for every record attribute that this entity class does not itself define.
+
+        This replaces a generic ``__getattribute__`` override, so that accessing e.g. ``entity.date`` costs a single descriptor call.
+        Attributes not known at class creation time are still forwarded through :meth:`__getattr__`.
+        """
+        record_type = cls.get_record_type(origin=True)
+
+        # Seed the dunder methods from the record type.
+        for name, _ in inspect.getmembers_static(record_type, predicate=inspect.isfunction):
+            if cls._should_copy_record_method_to_class(name):
+                setattr(cls, name, EntityRecordAttribute(name, journal_fallback=False))
+
+        # Forward all public record attributes, falling back to the journal while the record does not exist yet.
+        names: set[str] = set(getattr(record_type, "model_fields", ()))
+        names.update(name for name in dir(record_type) if not name.startswith("_"))
+
+        forwarded = set()
+        for name in names:
+            if name.startswith("_") or cls._is_entity_attribute(name):
+                continue
+            setattr(cls, name, EntityRecordAttribute(name))
+            forwarded.add(name)
+
+        cls.__entity_record_attributes__ = frozenset(forwarded)
+
     @final
     @classmethod
     def _should_copy_record_method_to_class(cls, name: str) -> bool:
@@ -753,8 +781,10 @@ class EntityBase[
 
     @final
     @classmethod
-    @lru_cache(maxsize=1024)
     def _should_redirect_attribute_to_record(cls, attr: str) -> bool:
+        if attr in cls.__entity_record_attributes__:
+            return True
+
         if attr.startswith("_"):
             return False
 
@@ -763,22 +793,32 @@ class EntityBase[
     @final
     @classmethod
     def _is_entity_attribute(cls, attr: str) -> bool:
-        return hasattr(cls, attr) or type_hints.get_type_hint(cls, attr) is not None
+        # Record attribute descriptors generated for a parent class do not make an attribute an entity attribute
+        for klass in cls.__mro__:
+            if attr in (namespace := vars(klass)):
+                if isinstance(namespace[attr], EntityRecordAttribute):
+                    break
+                return True
+        else:
+            if hasattr(cls, attr):
+                return True
+
+        return type_hints.get_type_hint(cls, attr) is not None
 
     if not TYPE_CHECKING:
 
-        @override
-        def __getattribute__(self, name: str) -> Any:
-            if name == "__class__" or not type(self)._should_redirect_attribute_to_record(name):  # noqa: SLF001
-                return super().__getattribute__(name)
+        def __getattr__(self, name: str) -> Any:
+            # Only reached for attributes not resolved through the generated record attribute descriptors
+            if not type(self)._should_redirect_attribute_to_record(name):  # noqa: SLF001
+                return super().__getattr__(name)
 
             if not self.exists:
                 if (journal := self.journal_or_none) is None:
                     msg = f"Cannot get attribute '{name}' on entity {self} without a record or journal."
                     raise AttributeError(msg)
-                return journal.__getattribute__(name)
+                return getattr(journal, name)
             else:
-                return self.record.__getattribute__(name)
+                return getattr(self.record, name)
 
         @override
         def __setattr__(self, name: str, value: object) -> None:
@@ -20,6 +20,7 @@ if TYPE_CHECKING:
     from ....util.logging import Logger
     from ..annotation import Annotation, AnnotationRecord
     from ..entity import Entity
+    from .annotation_index import AnnotationTypeIndex
 
 
 # MARK: Base
@@ -68,13 +69,24 @@ class EntityImpl[
         return self.context.get_forex_provider()
 
     # MARK: Annotations
+    @property
+    def annotation_index(self) -> AnnotationTypeIndex | None:
+        """Index of this entity's annotations by annotation class, or ``None`` if annotation lookups must scan ``annotations``."""
+        return None
+
     def iter_annotations[T: Annotation](self, cls: type[T]) -> Iterable[T]:
+        if (index := self.annotation_index) is not None:
+            yield from index.get(cls)
+            return
+
         for annotation in self.annotations:
             if not isinstance(annotation, cls):
                 continue
             yield annotation
 
     def get_annotations[T: Annotation](self, cls: type[T]) -> Sequence[T]:
+        if (index := self.annotation_index) is not None:
+            return index.get(cls)
         return tuple(self.iter_annotations(cls))
 
     def get_annotation[T: Annotation](self, cls: type[T]) -> T | None:
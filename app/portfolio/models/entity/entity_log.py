@@ -1,11 +1,12 @@
 # SPDX-License-Identifier: GPLv3-or-later
 # Copyright © 2025 pygaindalf Rui Pinheiro
 
+import bisect
 import datetime
 
 from collections.abc import Collection, Iterator, Sequence
 from enum import Enum
-from typing import TYPE_CHECKING, Any, ClassVar, Self, override
+from typing import TYPE_CHECKING, Any, ClassVar, NamedTuple, Self, overload, override
 from typing import cast as typing_cast
 
 from frozendict import frozendict
@@ -17,12 +18,14 @@ from ....util.helpers import script_info
 from ....util.helpers.frozendict import FrozenDict
 from ....util.mixins import HierarchicalMixinMinimal, LoggableMixin, NamedMixinMinimal
 from ....util.models import HierarchicalModel, SingleInitializationModel
+from ....util.profiling import PROFILER
 
 
 if TYPE_CHECKING:
     from ....util.models.uid import Uid
     from ...journal import Session, SessionManager
     from .entity import Entity
+    from .entity_log_config import EntityLogConfig
     from .entity_record import EntityRecord
 
 
@@ -88,14 +91,90 @@ class EntityLogEntry(SingleInitializationModel):
         return self.what.record_deleted
 
 
+# MARK: Compact EntityRecord Change class
+class CompactEntityLogEntry(NamedTuple):
+    """Compact encoding of an :class:`EntityLogEntry`, as stored by :class:`EntityLog`.
+
+    Entity logs live for the whole process and grow with every edit, so entries are kept as plain tuples (with the diff flattened into a tuple of
+    key/value pairs) and only decoded into :class:`EntityLogEntry` models when inspected.
+    """
+
+    what: EntityModificationType
+    when: datetime.datetime
+    who: str | None
+    why: str | None
+    diff: tuple[tuple[str, Any], ...] | None
+    version: int
+    reverted: bool = False
+
+    @classmethod
+    def encode(cls, entry: EntityLogEntry) -> CompactEntityLogEntry:
+        return cls(
+            what=entry.what,
+            when=entry.when,
+            who=entry.who,
+            why=entry.why,
+            diff=None if entry.diff is None else tuple(entry.diff.items()),
+            version=entry.version,
+            reverted=entry.reverted,
+        )
+
+    def decode(self) -> EntityLogEntry:
+        return EntityLogEntry(
+            what=self.what,
+            when=self.when,
+            who=self.who,
+            why=self.why,
+            diff=None if self.diff is None else frozendict(self.diff),
+            version=self.version,
+            reverted=self.reverted,
+        )
+
+    @property
+    def record_exists(self) -> bool:
+        return self.what.record_exists
+
+    @property
+    def record_deleted(self) -> bool:
+        return self.what.record_deleted
+
+
+# MARK: Retention policy enum
+class EntityLogRetention(Enum):
+    # fmt: off
+    ALL                 = "all"
+    LAST_N              = "last_n"
+    CREATION_AND_LATEST = "creation_and_latest"
+    # fmt: on
+
+    @override
+    def __str__(self) -> str:
+        return self.value
+
+    @override
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}.{self.name}"
+
+
 # MARK: EntityRecord Audit Log class
 @callguard_class()
 class EntityLog(Sequence, LoggableMixin, HierarchicalMixinMinimal, NamedMixinMinimal):
     TRACK_ENTITY_DIFF = script_info.enable_extra_sanity_checks()
 
+    # Which entries each entity log keeps around, see `_apply_retention` and `configure`
+    RETENTION: ClassVar[EntityLogRetention] = EntityLogRetention.ALL
+    RETENTION_LIMIT: ClassVar[PositiveInt] = 16
+
+    @classmethod
+    def configure(cls, config: EntityLogConfig) -> None:
+        """Apply the retention policy of the given configuration to every entity log."""
+        cls.RETENTION = config.retention
+        cls.RETENTION_LIMIT = config.retention_limit
+
     # MARK: EntityRecord
     _entity_uid: Uid
-    _entries: list[EntityLogEntry]
+    _entries: list[CompactEntityLogEntry]
+    _most_recent: EntityLogEntry | None
     _reverted: bool
 
     @classmethod
@@ -121,6 +200,7 @@ class EntityLog(Sequence, LoggableMixin, HierarchicalMixinMinimal, NamedMixinMin
     def _post_init(self, uid: Uid) -> None:
         self._entity_uid = uid
         self._entries = []
+        self._most_recent = None
         self._reverted = False
 
     @classmethod
@@ -215,9 +295,15 @@ class EntityLog(Sequence, LoggableMixin, HierarchicalMixinMinimal, NamedMixinMin
         return core_schema.is_instance_schema(cls)
 
     # MARK: List-like interface
+    @overload
+    def __getitem__(self, index: int) -> EntityLogEntry: ...
+    @overload
+    def __getitem__(self, index: slice) -> list[EntityLogEntry]: ...
     @override
-    def __getitem__(self, index) -> list[EntityLogEntry]:  # noqa: ANN001 to avoid a complex type hint
-        return self._entries[index]
+    def __getitem__(self, index: int | slice) -> EntityLogEntry | list[EntityLogEntry]:
+        if isinstance(index, slice):
+            return [entry.decode() for entry in self._entries[index]]
+        return self._entries[index].decode()
 
     @override
     def __len__(self) -> int:
@@ -225,7 +311,7 @@ class EntityLog(Sequence, LoggableMixin, HierarchicalMixinMinimal, NamedMixinMin
 
     @override
     def __iter__(self) -> Iterator[EntityLogEntry]:  # pyright: ignore[reportIncompatibleMethodOverride]
-        return iter(self._entries)
+        return (entry.decode() for entry in self._entries)
 
     # MARK: EntityRecord Diffing
     def _is_diffable_field(self, field_name: str) -> bool:
@@ -318,17 +404,40 @@ class EntityLog(Sequence, LoggableMixin, HierarchicalMixinMinimal, NamedMixinMin
         return frozendict(diff)
 
     # MARK: EntityRecord Registration
-    def _add_entry(self, entry: EntityLogEntry | None = None, /, **kwargs) -> None:
-        if entry is None:
-            entry = EntityLogEntry(**kwargs)
-
+    def _add_entry(self, entry: CompactEntityLogEntry) -> None:
         if entry.version != self.next_version:
             msg = f"Entry version {entry.version} does not match the expected next version {self.next_version}. The version should be incremented when the entity is cloned as part of an update action."
             raise ValueError(msg)
+        if entry.version == 1 and entry.what != EntityModificationType.CREATED:
+            msg = "The first audit entry must be of type 'CREATED'."
+            raise ValueError(msg)
         if entry.what == EntityModificationType.DELETED and not self.exists:
             msg = "Cannot add a DELETED entry to an entity that does not exist. The entity must be created first."
             raise ValueError(msg)
         self._entries.append(entry)
+        self._most_recent = None
+        self._apply_retention()
+
+    def _apply_retention(self) -> None:
+        """Drop the entries that fall outside the configured retention policy.
+
+        The most recent entry is always kept, as it determines the current version and state of the entity.
+        """
+        retention = self.RETENTION
+        if retention == EntityLogRetention.ALL:
+            return
+        elif retention == EntityLogRetention.LAST_N:
+            if (limit := self.RETENTION_LIMIT) < 1:
+                msg = f"Entity log retention limit must be at least 1, got {limit}."
+                raise ValueError(msg)
+            if (excess := len(self._entries) - limit) > 0:
+                del self._entries[:excess]
+        elif retention == EntityLogRetention.CREATION_AND_LATEST:
+            # No-op while there are at most two entries
+            del self._entries[1:-1]
+        else:
+            msg = f"Unsupported entity log retention policy {retention!r}."
+            raise ValueError(msg)
 
     def on_init_record(self, record: EntityRecord) -> None:
         from .entity_record import EntityRecord
@@ -346,6 +455,8 @@ class EntityLog(Sequence, LoggableMixin, HierarchicalMixinMinimal, NamedMixinMin
             raise ValueError(msg)
 
         what = EntityModificationType.CREATED if not self.exists else EntityModificationType.UPDATED
+        if PROFILER.enabled:
+            PROFILER.count(f"entities_{what.value}")
 
         session = record.session_or_none
 
@@ -355,13 +466,16 @@ class EntityLog(Sequence, LoggableMixin, HierarchicalMixinMinimal, NamedMixinMin
             diff = self._diff(old_record, record)
             self._reset_log_cache()
 
+        # Entries are stored in their compact form directly, and only decoded into EntityLogEntry models when inspected
         self._add_entry(
-            what=what,
-            when=datetime.datetime.now(tz=datetime.UTC),
-            who=session.actor if session is not None else None,
-            why=session.reason if session is not None else None,
-            diff=diff,
-            version=record.version,
+            CompactEntityLogEntry(
+                what=what,
+                when=datetime.datetime.now(tz=datetime.UTC),
+                who=session.actor if session is not None else None,
+                why=session.reason if session is not None else None,
+                diff=None if diff is None else tuple(diff.items()),
+                version=record.version,
+            )
         )
 
     def on_delete_record(self, record: EntityRecord, who: str | None = None, why: str | None = None) -> None:
@@ -398,16 +512,19 @@ class EntityLog(Sequence, LoggableMixin, HierarchicalMixinMinimal, NamedMixinMin
 
         session = record.session_or_none
         diff = self._diff(old_record, None)
+        PROFILER.count("entities_deleted")
 
         self._reset_log_cache()
 
         self._add_entry(
-            what=EntityModificationType.DELETED,
-            when=datetime.datetime.now(tz=datetime.UTC),
-            who=who or (session.actor if session is not None else None),
-            why=why or (session.reason if session is not None else None),
-            diff=diff,
-            version=self.next_version,
+            CompactEntityLogEntry(
+                what=EntityModificationType.DELETED,
+                when=datetime.datetime.now(tz=datetime.UTC),
+                who=who or (session.actor if session is not None else None),
+                why=why or (session.reason if session is not None else None),
+                diff=None if diff is None else tuple(diff.items()),
+                version=self.next_version,
+            )
         )
 
     def revert(self) -> None:
@@ -427,15 +544,12 @@ class EntityLog(Sequence, LoggableMixin, HierarchicalMixinMinimal, NamedMixinMin
         self._reverted = True
         version = self.version
         entry = self._entries.pop()
+        self._most_recent = None
         assert entry.version == version, f"Popped entry version {entry.version} does not match the expected version {version}."
         if self.version != version - 1:
             msg = f"Entity log version after revert is {self.version}, expected {version - 1}."
             raise ValueError(msg)
 
-        # Forcefully mark the entry as reverted
-        object.__setattr__(entry, "reverted", True)
-        assert entry.reverted, "Failed to mark the reverted entry as reverted."
-
     # MARK: Properties
     @computed_field(description="The most recent version of the entity")
     @property
@@ -457,8 +571,7 @@ class EntityLog(Sequence, LoggableMixin, HierarchicalMixinMinimal, NamedMixinMin
         return self.version + 1
 
     @property
-    def most_recent(self) -> EntityLogEntry:
-        """Returns the most recent audit entry for the entity, or None if there are no entries."""
+    def _most_recent_compact(self) -> CompactEntityLogEntry:
         if not self._entries:
             msg = "No audit entries available."
             raise ValueError(msg)
@@ -468,33 +581,40 @@ class EntityLog(Sequence, LoggableMixin, HierarchicalMixinMinimal, NamedMixinMin
             raise ValueError(msg)
         return entry
 
+    @property
+    def most_recent(self) -> EntityLogEntry:
+        """Returns the most recent audit entry for the entity, or None if there are no entries."""
+        entry = self._most_recent_compact
+        # The most recent entry is inspected on every record initialisation, so keep its decoded form around
+        if (decoded := self._most_recent) is None or decoded.version != entry.version:
+            decoded = self._most_recent = entry.decode()
+        return decoded
+
     @property
     def exists(self) -> bool:
         if not self._entries:
             return False
-        return self.most_recent.record_exists
+        return self._most_recent_compact.record_exists
 
     @property
     def deleted(self) -> bool:
         if not self._entries:
             return True
-        return self.most_recent.record_deleted
+        return self._most_recent_compact.record_deleted
 
     @property
     def reverted(self) -> bool:
         return self._reverted
 
     def get_entry_by_version(self, version: PositiveInt) -> EntityLogEntry | None:
-        """Return the audit entry for the given version, or None if no such entry exists."""
-        if (entry := self._entries[version - 1]) is None:
+        """Return the audit entry for the given version, or None if no such entry exists or it was dropped by the retention policy."""
+        index = bisect.bisect_left(self._entries, version, key=lambda entry: entry.version)
+        if index >= len(self._entries) or (entry := self._entries[index]).version != version:
             return None
-        if entry.version != version:
-            msg = f"Entry version {entry.version} does not match the requested version {version}."
-            raise ValueError(msg)
         if entry.reverted:
             msg = f"Entry version {entry.version} has been reverted."
             raise ValueError(msg)
-        return entry
+        return entry.decode()
 
     # MARK: Printing
     @override
@@ -510,14 +630,14 @@ class EntityLog(Sequence, LoggableMixin, HierarchicalMixinMinimal, NamedMixinMin
 
         This is useful for iterating over the entries.
         """
-        return tuple(self._entries)
+        return tuple(entry.decode() for entry in self._entries)
 
     def as_json(self) -> list[dict[str, Any]]:
         """Return the audit log entries as a JSON-serializable list of dictionaries.
 
         This is useful for exporting the audit log to JSON.
         """
-        return [entry.model_dump() for entry in self._entries]
+        return [entry.decode().model_dump() for entry in self._entries]
 
     def as_json_str(self, **kwargs) -> str:
         """Return the audit log entries as a JSON string.
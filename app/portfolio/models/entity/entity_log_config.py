@@ -0,0 +1,16 @@
+# SPDX-License-Identifier: GPLv3-or-later
+# Copyright © 2025 pygaindalf Rui Pinheiro
+
+from pydantic import Field, PositiveInt
+
+from ....util.config.models import BaseConfigModel
+from .entity_log import EntityLogRetention
+
+
+# MARK: Entity Log Configuration
+class EntityLogConfig(BaseConfigModel):
+    retention: EntityLogRetention = Field(
+        default=EntityLogRetention.ALL,
+        description="Which entries each entity log keeps: all of them, the last 'retention_limit' entries, or only the creation and the latest entry.",
+    )
+    retention_limit: PositiveInt = Field(default=16, description="Number of entries kept by each entity log when 'retention' is 'last_n'.")
@@ -0,0 +1,57 @@
+# SPDX-License-Identifier: GPLv3-or-later
+# Copyright © 2025 pygaindalf Rui Pinheiro
+
+from typing import TYPE_CHECKING, Any, Self, overload, override
+
+
+if TYPE_CHECKING:
+    from .entity_base import EntityBase
+
+
+class EntityRecordAttribute:
+    """Data descriptor that forwards an entity attribute to the entity's record.
+
+    These are generated by :class:`EntityBase` at class creation time for every attribute of the entity's record type that the entity itself does not define,
+    so that e.g. ``entity.date`` resolves through a single descriptor call rather than a generic ``__getattribute__`` override.
+
+    If ``journal_fallback`` is set and the entity does not have a record yet, the attribute is read from its journal instead.
+    """
+
+    __slots__ = ("journal_fallback", "name")
+
+    def __init__(self, name: str, *, journal_fallback: bool = True) -> None:
+        self.name = name
+        self.journal_fallback = journal_fallback
+
+    @overload
+    def __get__(self, instance: None, owner: type | None = None) -> Self: ...
+    @overload
+    def __get__(self, instance: EntityBase, owner: type | None = None) -> Any: ...
+    def __get__(self, instance: EntityBase | None, owner: type | None = None) -> Any:
+        if instance is None:
+            return self
+
+        if (record := instance.record_or_none) is not None:
+            return getattr(record, self.name)
+
+        if not self.journal_fallback:
+            return getattr(instance.record, self.name)
+
+        if (journal := instance.journal_or_none) is None:
+            msg = f"Cannot get attribute '{self.name}' on entity {instance} without a record or journal."
+            raise AttributeError(msg)
+        return getattr(journal, self.name)
+
+    def __set__(self, instance: EntityBase, value: Any) -> None:
+        if (record := instance.record_or_none) is None:
+            msg = f"Cannot set attribute '{self.name}' on entity {instance} without a record."
+            raise AttributeError(msg)
+        setattr(record, self.name, value)
+
+    def __delete__(self, instance: EntityBase) -> None:
+        msg = f"Cannot delete attribute '{self.name}' on entity {instance}."
+        raise AttributeError(msg)
+
+    @override
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}({self.name!r})"
@@ -2,15 +2,17 @@
 # Copyright © 2025 pygaindalf Rui Pinheiro
 
 import sys
+import threading
 
 from abc import ABCMeta
-from collections.abc import Iterable, MutableMapping, MutableSet
+from collections.abc import Iterable, Mapping, MutableMapping, MutableSet
 from collections.abc import Set as AbstractSet
+from contextvars import ContextVar
 from typing import TYPE_CHECKING, Any, ClassVar, Self, override
 from typing import cast as typing_cast
 
 from frozendict import frozendict
-from pydantic import ConfigDict, PositiveInt, PrivateAttr, ValidationInfo, field_serializer, field_validator, model_validator
+from pydantic import ConfigDict, PositiveInt, PrivateAttr, ValidationInfo, ValidatorFunctionWrapHandler, field_serializer, field_validator, model_validator
 
 from ....util.callguard import CallguardClassOptions
 from ....util.helpers import generics, script_info, type_hints
@@ -18,7 +20,9 @@ from ....util.mixins import HierarchicalMixinMinimal, HierarchicalProtocol, Name
 from ....util.models import LoggableHierarchicalModel
 from ....util.models.superseded import superseded_check
 from ....util.models.uid import Uid
+from .annotation_index import AnnotationTypeIndex
 from .dependency_event_handler.base import EntityDependencyEventHandlerBase
+from .dependency_event_handler.dispatch import EntityDependencyEventDispatch
 from .dependency_event_handler.type_enum import EntityDependencyEventType
 from .entity_common import EntityCommon
 from .entity_dependents import EntityDependents
@@ -39,6 +43,15 @@ if TYPE_CHECKING:
 ENTITY_RECORD_SUBCLASSES: MutableSet[type[EntityRecordBase]] = set()
 ENTITY_CLASSES: MutableMapping[type[EntityRecordBase], type[Entity]] = {}
 
+# Dependency event dispatch tables, keyed by (owner class, record class, event type) and invalidated whenever handlers are (un)registered
+DEPENDENCY_EVENT_DISPATCH: MutableMapping[tuple[type[EntityRecordBase], type[EntityRecordBase], EntityDependencyEventType], EntityDependencyEventDispatch] = {}
+
+# Field values carried over unchanged by the entity record update currently being validated, keyed by field name, alongside the UID of that entity
+SHARED_FIELD_VALUES: ContextVar[tuple[Uid, Mapping[str, Any]] | None] = ContextVar("SHARED_FIELD_VALUES", default=None)
+
+# Serialises the lazy construction of per-record annotation indices
+ANNOTATION_INDEX_LOCK = threading.Lock()
+
 
 # We need this class to swallow the 'init' kwarg in __init_subclass__ calls from EntityRecordBase
 class EntityRecordMeta(metaclass=ABCMeta):
@@ -125,6 +138,9 @@ class EntityRecordBase[
 
         superseding_log = self.entity_log.get_entry_by_version(self.version + 1)
         if superseding_log is None:
+            # Entries dropped by the entity log retention policy were never the most recent one, hence were not deletions
+            if self.version + 1 < self.entity_log.version:
+                return False
             msg = f"Entity record {self} is marked as superseded but no audit log entry found for version {self.version + 1}."
             raise ValueError(msg)
 
@@ -498,13 +514,16 @@ class EntityRecordBase[
             msg = "Cannot update the 'version' of an entity record. The version is managed by the entity record itself and should not be changed directly."
             raise ValueError(msg)
 
+        # Fields that are not being changed are shared with the new version as-is, see `_validate_shared_field`
         args = {}
+        shared = {}
         for field_name in type(self).model_fields:
             target_name = self.reverse_field_alias(field_name)
-            if field_name in kwargs:
+            current = self.__dict__[field_name]
+            if field_name in kwargs and kwargs[field_name] is not current:
                 args[target_name] = kwargs[field_name]
             else:
-                args[target_name] = self.__dict__[field_name]
+                args[target_name] = shared[field_name] = current
 
         args.update(kwargs)
         args["uid"] = self.uid
@@ -516,7 +535,11 @@ class EntityRecordBase[
             raise ValueError(msg)
 
         # Update entity record
-        new_record = type(self)(**args)
+        token = SHARED_FIELD_VALUES.set((self.uid, shared))
+        try:
+            new_record = type(self)(**args)
+        finally:
+            SHARED_FIELD_VALUES.reset(token)
 
         # Sanity check
         if not isinstance(new_record, type(self)):
@@ -529,6 +552,24 @@ class EntityRecordBase[
         # Return updated entity record
         return new_record
 
+    @field_validator("*", mode="wrap")
+    @classmethod
+    def _validate_shared_field(cls, value: Any, handler: ValidatorFunctionWrapHandler, info: ValidationInfo) -> Any:
+        """Skip re-validation of field values shared by identity with the entity record being superseded.
+
+        Those values were already validated when the previous version was created, and records are immutable, so the new version can reference
+        the very same objects. This keeps the cost of :meth:`update` proportional to the fields being changed rather than to the size of the record,
+        which matters for records holding large collections.
+        """
+        if (shared := SHARED_FIELD_VALUES.get()) is None or (name := info.field_name) is None:
+            return handler(value)
+
+        uid, values = shared
+        if name in values and values[name] is value and info.data.get("uid") == uid:
+            return value
+
+        return handler(value)
+
     # MARK: Journal
     @staticmethod
     def _is_entity_record_attribute(name: str) -> bool:
@@ -673,6 +714,19 @@ class EntityRecordBase[
 
         return annotations
 
+    _annotation_index: AnnotationTypeIndex | None = PrivateAttr(default=None)
+
+    @property
+    @override
+    def annotation_index(self) -> AnnotationTypeIndex:
+        # Records are immutable, so the index is built on first use and never invalidated
+        if (index := self._annotation_index) is None:
+            # Records may be read by concurrent agents, so the index is built under a lock to publish a single instance
+            with ANNOTATION_INDEX_LOCK:
+                if (index := self._annotation_index) is None:
+                    index = self._annotation_index = AnnotationTypeIndex(self.annotations)
+        return index
+
     # MARK: Dependents
     if TYPE_CHECKING:
         entity_dependents: EntityDependents
@@ -707,11 +761,14 @@ class EntityRecordBase[
     @classmethod
     def register_dependency_event_handler(cls, record: EntityDependencyEventHandlerBase) -> None:
         cls.__entity_dependency_event_handler_records__.add(record)
+        DEPENDENCY_EVENT_DISPATCH.clear()
 
     if script_info.is_unit_test():
 
         @classmethod
         def clear_dependency_event_handlers(cls) -> None:
+            DEPENDENCY_EVENT_DISPATCH.clear()
+
             if hasattr(cls, "__entity_dependency_event_handler_records__"):
                 cls.__entity_dependency_event_handler_records__.clear()
                 cls.__init_dependencies__()
@@ -731,22 +788,23 @@ class EntityRecordBase[
                 continue
             yield from subclass.__entity_dependency_event_handler_records__
 
+    @classmethod
+    def get_dependency_event_dispatch(cls, record_class: type[EntityRecordBase], event: EntityDependencyEventType) -> EntityDependencyEventDispatch:
+        """Return the dispatch table for dependency events of the given type raised by records of the given class, building it on first use."""
+        key = (cls, record_class, event)
+        if (dispatch := DEPENDENCY_EVENT_DISPATCH.get(key)) is None:
+            handlers = (handler for handler in cls.iter_dependency_event_handlers() if handler.match_classes(cls, record_class, event))
+            dispatch = DEPENDENCY_EVENT_DISPATCH[key] = EntityDependencyEventDispatch(event, handlers)
+        return dispatch
+
     def _call_dependency_event_handlers(self, event: EntityDependencyEventType, record: EntityRecordBase, journal: Journal) -> bool:
         from .entity_record import EntityRecord
 
         assert isinstance(self, EntityRecord), f"Expected EntityRecord, got {type(self).__name__} instead."
         assert isinstance(record, EntityRecord), f"Expected EntityRecord, got {type(record).__name__} instead."
 
-        matched = False
-        for ev_record in type(self).iter_dependency_event_handlers():
-            matched_current = ev_record(owner=self, event=event, record=record, journal=journal)
-            matched |= matched_current
-
-            # Abort if one of the handlers marks this entity for deletion
-            if matched_current and self.marked_for_deletion:
-                break
-
-        return matched
+        dispatch = type(self).get_dependency_event_dispatch(type(record), event)
+        return dispatch(owner=self, record=record, journal=journal)
 
     def on_dependency_updated(self, source: Journal) -> None:
         if self.marked_for_deletion:
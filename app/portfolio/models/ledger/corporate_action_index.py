@@ -0,0 +1,45 @@
+# SPDX-License-Identifier: GPLv3-or-later
+# Copyright © 2025 pygaindalf Rui Pinheiro
+
+from collections.abc import Iterable, Iterator, Sequence
+from typing import TYPE_CHECKING, override
+
+
+if TYPE_CHECKING:
+    import datetime
+
+    from decimal import Decimal
+
+    from ..transaction import Transaction
+
+
+# MARK: Corporate action index
+class CorporateActionIndex:
+    """Index of the corporate-action transactions of a ledger (e.g. stock splits), in ledger order.
+
+    Ledger records are immutable, so each record owns its own index, built on first use and dropped whenever the type or date of one of its
+    transactions is updated. Ledger journals reuse their record's index while their transactions are unedited, and otherwise keep their own
+    index which is dropped whenever the transactions are edited.
+    """
+
+    __slots__ = ("_transactions",)
+
+    def __init__(self, transactions: Iterable[Transaction]) -> None:
+        self._transactions: tuple[Transaction, ...] = tuple(txn for txn in transactions if txn.type.corporate_action)
+
+    @property
+    def stock_splits(self) -> Sequence[Transaction]:
+        return tuple(txn for txn in self._transactions if txn.type.stock_split)
+
+    def has_stock_split(self, date: datetime.date, ratio: Decimal) -> bool:
+        return any(txn.date == date and txn.quantity == ratio for txn in self._transactions if txn.type.stock_split)
+
+    def __iter__(self) -> Iterator[Transaction]:
+        return iter(self._transactions)
+
+    def __len__(self) -> int:
+        return len(self._transactions)
+
+    @override
+    def __repr__(self) -> str:
+        return f"<{type(self).__name__} {len(self._transactions)} corporate actions>"
@@ -4,7 +4,7 @@
 import datetime
 
 from abc import ABCMeta
-from collections.abc import Iterator
+from collections.abc import Iterator, Sequence
 from collections.abc import Set as AbstractSet
 from typing import TYPE_CHECKING, override
 
@@ -13,6 +13,7 @@ from ....util.models.uid import Uid
 from ...collections import OrderedViewSet
 from ..entity import EntityImpl
 from ..transaction import Transaction, TransactionRecord
+from .corporate_action_index import CorporateActionIndex
 from .ledger_schema import LedgerSchema
 
 
@@ -77,6 +78,16 @@ class LedgerImpl[
     def __repr__(self) -> str:
         return super().__repr__().replace(">", f", transactions={self.transactions!r}>")
 
+    # MARK: Corporate actions
+    @property
+    def corporate_action_index(self) -> CorporateActionIndex:
+        """Index of this ledger's corporate-action transactions, e.g. stock splits."""
+        return CorporateActionIndex(self.transactions)
+
+    @property
+    def stock_splits(self) -> Sequence[Transaction]:
+        return self.corporate_action_index.stock_splits
+
     # MARK: Instrument
     @property
     def ticker(self) -> str | None:
@@ -1,17 +1,22 @@
 # SPDX-License-Identifier: GPLv3-or-later
 # Copyright © 2025 pygaindalf Rui Pinheiro
 
-from collections.abc import MutableSet
+from collections.abc import Iterable, MutableSet
 from typing import TYPE_CHECKING, override
 
+from pydantic import PrivateAttr
+
 from ...collections import OrderedViewMutableSet
+from ...collections.journalled.set.ordered_view_set import JournalledOrderedViewSet
 from ...journal.journal import Journal
 from ..transaction import Transaction, TransactionRecord
+from .corporate_action_index import CorporateActionIndex
 from .ledger_impl import LedgerImpl
 
 
 if TYPE_CHECKING:
     from ....util.models.uid import Uid
+    from ...collections.journalled import JournalledCollection
 
 
 class LedgerJournal(
@@ -28,3 +33,42 @@ class LedgerJournal(
     @override
     def discard(self, value: Transaction | TransactionRecord | Uid) -> None:
         self.transactions.discard(Transaction.narrow_to_instance(value))
+
+    # MARK: Corporate actions
+    _corporate_action_index: CorporateActionIndex | None = PrivateAttr(default=None)
+
+    @property
+    @override
+    def corporate_action_index(self) -> CorporateActionIndex:
+        # While the transactions are unedited they match the record's, so reuse its index
+        if not self.is_field_edited("transactions") and (record := self.record_or_none) is not None:
+            return record.corporate_action_index  # pyright: ignore[reportAttributeAccessIssue]
+
+        if (index := self._corporate_action_index) is None:
+            index = self._corporate_action_index = CorporateActionIndex(self.transactions)
+        return index
+
+    @override
+    def on_journalled_collection_edit(self, collection: JournalledCollection) -> None:
+        super().on_journalled_collection_edit(collection)
+        self._corporate_action_index = None
+
+    # MARK: Dependents
+    @override
+    def _iter_dependent_uids(self) -> Iterable[Uid]:
+        yield from super()._iter_dependent_uids()
+
+        if self._marked_for_deletion or not self.is_field_edited("transactions"):
+            return
+
+        # Edits to the transactions invalidate the annotations of every transaction at or after the earliest edit (e.g. S104 holdings).
+        # That range is resolved with a single bisection of the sorted transactions, so that only the affected annotations are notified.
+        transactions = self.get_field("transactions")
+        assert isinstance(transactions, JournalledOrderedViewSet), f"Expected JournalledOrderedViewSet, got {type(transactions).__name__} instead."
+
+        committed = self.get_original_field("transactions")
+        for transaction in transactions.frontier_items:
+            # Transactions added in this session have no annotations predating the edit
+            if transaction not in committed:
+                continue
+            yield from (annotation.uid for annotation in transaction.record.annotations)
@@ -1,12 +1,16 @@
 # SPDX-License-Identifier: GPLv3-or-later
 # Copyright © 2025 pygaindalf Rui Pinheiro
 
+import threading
+
 from typing import TYPE_CHECKING, Any, override
 
-from pydantic import field_validator
+from pydantic import PrivateAttr, field_validator
 
 from ..entity import EntityRecord
 from ..instrument import Instrument
+from ..transaction import TransactionRecord
+from .corporate_action_index import CorporateActionIndex
 from .ledger_impl import LedgerImpl
 from .ledger_journal import LedgerJournal
 from .ledger_schema import LedgerSchema
@@ -15,6 +19,12 @@ from .ledger_schema import LedgerSchema
 if TYPE_CHECKING:
     from _typeshed import SupportsRichComparison
 
+    from ...journal.journal import Journal
+
+
+# Serialises the lazy construction of per-record corporate action indices
+CORPORATE_ACTION_INDEX_LOCK = threading.Lock()
+
 
 class LedgerRecord(
     LedgerImpl,
@@ -32,6 +42,30 @@ class LedgerRecord(
             raise TypeError(msg)
         return value
 
+    # MARK: Corporate actions
+    _corporate_action_index: CorporateActionIndex | None = PrivateAttr(default=None)
+
+    @property
+    @override
+    def corporate_action_index(self) -> CorporateActionIndex:
+        # Records are immutable, so the index is built on first use and only dropped when a child transaction is updated
+        if (index := self._corporate_action_index) is None:
+            # Records may be read by concurrent agents, so the index is built under a lock to publish a single instance
+            with CORPORATE_ACTION_INDEX_LOCK:
+                if (index := self._corporate_action_index) is None:
+                    index = self._corporate_action_index = CorporateActionIndex(self.transactions)
+        return index
+
+    @override
+    def on_dependency_updated(self, source: Journal) -> None:
+        super().on_dependency_updated(source)
+
+        # Transactions whose type or date changes may become or stop being corporate actions, or move within the ledger, without the
+        # transactions field itself being edited, so the index is rebuilt from the committed transactions on next use
+        if isinstance(source.record, TransactionRecord) and (source.is_field_edited("type") or source.is_field_edited("date")):
+            with CORPORATE_ACTION_INDEX_LOCK:
+                self._corporate_action_index = None
+
     # MARK: Utilities
     @override
     def sort_key(self) -> SupportsRichComparison:
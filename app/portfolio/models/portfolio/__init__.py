@@ -1,6 +1,7 @@
 # SPDX-License-Identifier: GPLv3-or-later
 # Copyright © 2025 pygaindalf Rui Pinheiro
 
+from .ledger_index import LedgerIndex
 from .portfolio import Portfolio
 from .portfolio_protocol import PortfolioProtocol
 from .portfolio_record import PortfolioRecord
@@ -8,6 +9,7 @@ from .portfolio_schema import PortfolioSchema
 
 
 __all__ = [
+    "LedgerIndex",
     "Portfolio",
     "PortfolioProtocol",
     "PortfolioRecord",
@@ -0,0 +1,59 @@
+# SPDX-License-Identifier: GPLv3-or-later
+# Copyright © 2025 pygaindalf Rui Pinheiro
+
+
+from collections.abc import Iterable
+from typing import TYPE_CHECKING, override
+
+
+if TYPE_CHECKING:
+    from ..ledger import Ledger
+
+
+# MARK: Ledger index
+class LedgerIndex:
+    """Index of a collection of ledgers by the ISIN and ticker of their instruments.
+
+    Portfolio records are immutable, so each record owns its own index, built on first use. Portfolio journals reuse their record's index while
+    their ledgers are unedited, and otherwise keep their own index which is updated as ledgers are added and discarded.
+    """
+
+    __slots__ = ("_by_isin", "_by_ticker")
+
+    def __init__(self, ledgers: Iterable[Ledger]) -> None:
+        self._by_isin: dict[str, Ledger] = {}
+        self._by_ticker: dict[str, Ledger] = {}
+
+        for ledger in ledgers:
+            self.add(ledger)
+
+    def add(self, ledger: Ledger) -> None:
+        instrument = ledger.instrument
+        if (isin := instrument.isin) is not None:
+            self._by_isin[isin] = ledger
+        if (ticker := instrument.ticker) is not None:
+            self._by_ticker[ticker] = ledger
+
+    def discard(self, ledger: Ledger) -> None:
+        instrument = ledger.instrument
+        if (isin := instrument.isin) is not None and self._by_isin.get(isin) is ledger:
+            del self._by_isin[isin]
+        if (ticker := instrument.ticker) is not None and self._by_ticker.get(ticker) is ledger:
+            del self._by_ticker[ticker]
+
+    def get(self, isin: str | None = None, ticker: str | None = None) -> Ledger | None:
+        by_isin = self._by_isin.get(isin) if isin else None
+        by_ticker = self._by_ticker.get(ticker) if ticker else None
+
+        if by_isin is not None and by_ticker is not None and by_isin is not by_ticker:
+            msg = f"Conflicting ledgers found for ISIN '{isin}' and ticker '{ticker}'."
+            raise ValueError(msg)
+
+        return by_isin if by_isin is not None else by_ticker
+
+    def __len__(self) -> int:
+        return len({id(ledger) for ledger in (*self._by_isin.values(), *self._by_ticker.values())})
+
+    @override
+    def __repr__(self) -> str:
+        return f"<{type(self).__name__} {len(self._by_isin)} ISINs, {len(self._by_ticker)} tickers>"
@@ -12,6 +12,7 @@ from ...collections.ordered_view import OrderedViewSet
 from ..entity import Entity, EntityImpl
 from ..instrument import Instrument, InstrumentRecord
 from ..ledger import Ledger, LedgerRecord
+from .ledger_index import LedgerIndex
 from .portfolio_schema import PortfolioSchema
 
 
@@ -52,6 +53,17 @@ class PortfolioImpl[
         msg = f"Index must be an int, Uid or InstrumentRecord, got {type(index).__name__}"
         raise KeyError(msg)
 
+    @property
+    def ledger_index(self) -> LedgerIndex:
+        """Index of this portfolio's ledgers by instrument ISIN and ticker."""
+        return LedgerIndex(self.ledgers)
+
+    def get_ledger(self, isin: str | None = None, ticker: str | None = None) -> Ledger | None:
+        """Return the ledger in this portfolio for the instrument with the given ISIN and/or ticker, if any."""
+        if not isin and not ticker:
+            return None
+        return self.ledger_index.get(isin=isin, ticker=ticker)
+
     # MARK: Set ABC
     @override
     def __contains__(self, value: object) -> bool:
@@ -4,9 +4,13 @@
 from collections.abc import MutableSet
 from typing import TYPE_CHECKING, override
 
+from pydantic import PrivateAttr
+
 from ...collections import OrderedViewMutableSet
+from ...collections.journalled import JournalledCollection, JournalledSetEditType
 from ...journal.journal import Journal
 from ..ledger import Ledger
+from .ledger_index import LedgerIndex
 from .portfolio_impl import PortfolioImpl
 
 
@@ -28,3 +32,41 @@ class PortfolioJournal(
     @override
     def discard(self, value: Ledger | Uid) -> None:
         self.ledgers.discard(Ledger.narrow_to_instance(value))
+
+    # MARK: Ledger index
+    _ledger_index: LedgerIndex | None = PrivateAttr(default=None)
+
+    # Number of edits to the ledgers that are reflected in the index
+    _ledger_index_edits: int = PrivateAttr(default=0)
+
+    @property
+    @override
+    def ledger_index(self) -> LedgerIndex:
+        # While the ledgers are unedited they match the record's, so reuse its index
+        if not self.is_field_edited("ledgers") and (record := self.record_or_none) is not None:
+            return record.ledger_index  # pyright: ignore[reportAttributeAccessIssue]
+
+        if (index := self._ledger_index) is None:
+            ledgers = self.get_field("ledgers")
+            index = self._ledger_index = LedgerIndex(ledgers)
+            self._ledger_index_edits = ledgers.edit_count if isinstance(ledgers, JournalledCollection) else 0
+        return index
+
+    @override
+    def on_journalled_collection_edit(self, collection: JournalledCollection) -> None:
+        super().on_journalled_collection_edit(collection)
+
+        if (index := self._ledger_index) is None or collection.instance_name != "ledgers":
+            return
+
+        # Apply the new edits to the index, rather than rebuilding it on the next lookup
+        edits = collection.journal_since(self._ledger_index_edits)
+        self._ledger_index_edits += len(edits)
+        for edit in edits:
+            if edit.type is JournalledSetEditType.ADD:
+                index.add(Ledger.narrow_to_instance(edit.value))
+            elif edit.type is JournalledSetEditType.DISCARD:
+                index.discard(Ledger.narrow_to_instance(edit.value))
+            else:
+                self._ledger_index = None
+                return
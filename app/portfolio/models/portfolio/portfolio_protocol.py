@@ -11,6 +11,7 @@ if TYPE_CHECKING:
     from ...journal import Session, SessionManager
     from ..instrument import Instrument, InstrumentRecord
     from ..ledger import Ledger
+    from .ledger_index import LedgerIndex
     from .portfolio_journal import PortfolioJournal
 
 
@@ -32,6 +33,8 @@ class PortfolioProtocol(Protocol):
     def journal(self) -> PortfolioJournal: ...
     @property
     def j(self) -> PortfolioJournal: ...
+    @property
+    def journal_or_none(self) -> PortfolioJournal | None: ...
 
     # MARK: Ledgers
     @property
@@ -40,6 +43,9 @@ class PortfolioProtocol(Protocol):
     def __contains__(self, value: object) -> bool: ...
     def __iter__(self) -> Iterator[Ledger]: ...
     def __len__(self) -> int: ...
+    @property
+    def ledger_index(self) -> LedgerIndex: ...
+    def get_ledger(self, isin: str | None = None, ticker: str | None = None) -> Ledger | None: ...
 
     # MARK: Dumping
     def model_dump(self, *args, **kwargs) -> dict[str, Any]: ...
@@ -1,8 +1,12 @@
 # SPDX-License-Identifier: GPLv3-or-later
 # Copyright © 2025 pygaindalf Rui Pinheiro
 
+from typing import override
+
+from pydantic import PrivateAttr
 
 from ..entity import EntityRecord
+from .ledger_index import LedgerIndex
 from .portfolio_impl import PortfolioImpl
 from .portfolio_journal import PortfolioJournal
 from .portfolio_schema import PortfolioSchema
@@ -15,4 +19,13 @@ class PortfolioRecord(
     init=False,
     unsafe_hash=True,
 ):
-    pass
+    # MARK: Ledger index
+    _ledger_index: LedgerIndex | None = PrivateAttr(default=None)
+
+    @property
+    @override
+    def ledger_index(self) -> LedgerIndex:
+        # Records are immutable, so the index is built on first use and never invalidated
+        if (index := self._ledger_index) is None:
+            index = self._ledger_index = LedgerIndex(self.ledgers)
+        return index
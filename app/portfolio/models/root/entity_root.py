@@ -5,13 +5,12 @@ from abc import ABCMeta
 from typing import TYPE_CHECKING, Any, ClassVar, override
 
 from pydantic import ConfigDict, Field, InstanceOf, field_validator
-from requests import Session
 
 from ....util.helpers import generics, script_info
 from ....util.models import LoggableHierarchicalRootModel
 from ...journal.session_manager import SessionManager
 from ..entity import Entity
-from ..store.entity_store import EntityStore
+from ..store.entity_store import EntityStore, EntityStoreSweep
 
 
 if TYPE_CHECKING:
@@ -125,7 +124,9 @@ class EntityRoot[E: Entity](LoggableHierarchicalRootModel, metaclass=ABCMeta):
             raise RuntimeError(msg)
 
     def on_session_apply(self, session: Session) -> None:
-        pass
+        # Entities created in this session that are still unreachable have been reverted by now, so the remaining ones can be pinned
+        if (store := self.entity_store).pinned_generation:
+            store.pin(session.created_uids)
 
     def on_session_commit(self, session: Session) -> None:  # noqa: ARG002
         if script_info.enable_extra_sanity_checks():
@@ -139,3 +140,12 @@ class EntityRoot[E: Entity](LoggableHierarchicalRootModel, metaclass=ABCMeta):
 
     # MARK: EntityRecord Store
     entity_store: InstanceOf[EntityStore] = Field(default_factory=EntityStore, description="The entity store associated with this manager's portfolio.")
+
+    def pin_entities(self) -> None:
+        """Hold every entity reachable from the root entity in the entity store's pinned generation, and keep pinning entities as they are created."""
+        roots = None if self.root is None else self.root.uid
+        self.entity_store.set_pinned_generation(True, roots=roots)
+
+    def sweep_entity_store(self, *, collect: bool = False) -> EntityStoreSweep:
+        roots = () if self.root is None else self.root.uid
+        return self.entity_store.sweep(roots, collect=collect)
@@ -1,11 +1,12 @@
 # SPDX-License-Identifier: GPLv3-or-later
 # Copyright © 2025 pygaindalf Rui Pinheiro
 
-from .entity_store import EntityStore
+from .entity_store import EntityStore, EntityStoreSweep
 from .string_uid_mapping import StringUidMapping
 
 
 __all__ = [
     "EntityStore",
+    "EntityStoreSweep",
     "StringUidMapping",
 ]
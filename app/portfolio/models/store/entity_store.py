@@ -1,12 +1,14 @@
 # SPDX-License-Identifier: GPLv3-or-later
 # Copyright © 2025 pygaindalf Rui Pinheiro
 
+import gc
+import itertools
 import weakref
 
 from collections import deque
 from collections.abc import Iterable, Iterator, Mapping, MutableMapping
 from collections.abc import Set as AbstractSet
-from typing import TYPE_CHECKING, ClassVar, override
+from typing import TYPE_CHECKING, ClassVar, NamedTuple, override
 
 from ....util.callguard import callguard_class
 from ....util.helpers import script_info
@@ -24,6 +26,12 @@ ENTITY_LOG_STORE_WEAKREF = False
 ENTITY_STORE_WEAKREF = True
 
 
+class EntityStoreSweep(NamedTuple):
+    pinned: int
+    unpinned: int
+    collected: int
+
+
 @callguard_class()
 class EntityStore(MutableMapping[Uid, Entity], LoggableHierarchicalMixin):
     # MARK: Global instance behaviour
@@ -73,6 +81,9 @@ class EntityStore(MutableMapping[Uid, Entity], LoggableHierarchicalMixin):
         self._entity_log_store        = (dict if not ENTITY_LOG_STORE_WEAKREF        else weakref.WeakValueDictionary)()
         # fmt: on
 
+        self._pinned = {}
+        self._pinned_generation = False
+
         self._uid_factory = IncrementingUidFactory()
         self._string_uid_mappings = {}
 
@@ -82,6 +93,7 @@ class EntityStore(MutableMapping[Uid, Entity], LoggableHierarchicalMixin):
     def reset(self) -> None:
         self._entity_log_store.clear()
         self._entity_store.clear()
+        self._pinned.clear()
         self._uid_factory.reset()
         for mapping in self._string_uid_mappings.values():
             mapping.reset()
@@ -128,9 +140,16 @@ class EntityStore(MutableMapping[Uid, Entity], LoggableHierarchicalMixin):
         return None if entity is None else entity.record_or_none
 
     # MARK: MutableMapping ABC
+    @override
+    def get(self, uid: Uid, default: Entity | None = None) -> Entity | None:  # pyright: ignore[reportIncompatibleMethodOverride]
+        # Avoid the KeyError round-trip of Mapping.get, as misses are common
+        if (entity := self._pinned.get(uid, None)) is not None:
+            return entity
+        return self._entity_store.get(uid, default)
+
     @override
     def __getitem__(self, uid: Uid) -> Entity:
-        if (entity := self._entity_store.get(uid, None)) is None:
+        if (entity := self.get(uid, None)) is None:
             msg = f"Entity with UID {uid} not found in store."
             raise KeyError(msg)
         return entity
@@ -147,7 +166,10 @@ class EntityStore(MutableMapping[Uid, Entity], LoggableHierarchicalMixin):
             msg = f"EntityRecord UID {entity.uid} does not match the key UID {uid}."
             raise ValueError(msg)
 
-        self._entity_store[uid] = entity
+        if uid in self._pinned:
+            self._pinned[uid] = entity
+        else:
+            self._entity_store[uid] = entity
         self._entity_log_store[uid] = entity.entity_log
 
     @override
@@ -156,7 +178,7 @@ class EntityStore(MutableMapping[Uid, Entity], LoggableHierarchicalMixin):
 
     def delete(self, value: Uid | Entity | EntityRecord, *, keep_log: bool = True) -> None:
         uid = Entity.narrow_to_uid(value)
-        entity = self._entity_store.get(uid, None)
+        entity = self.get(uid, None)
         if entity is None:
             return
 
@@ -164,33 +186,111 @@ class EntityStore(MutableMapping[Uid, Entity], LoggableHierarchicalMixin):
             msg = f"Cannot delete entity with UID {uid} because it still exists. Call entity.delete() instead."
             raise RuntimeError(msg)
 
-        del self._entity_store[uid]
+        if self._pinned.pop(uid, None) is None:
+            del self._entity_store[uid]
         if not keep_log:
             del self._entity_log_store[uid]
 
     @override
     def __iter__(self) -> Iterator[Uid]:  # pyright: ignore[reportIncompatibleMethodOverride] as we override MutableMapping not BaseModel
-        return iter(self._entity_store)
+        return itertools.chain(self._pinned, self._entity_store)
 
     @override
     def __len__(self) -> int:
-        return len(self._entity_store)
+        return len(self._pinned) + len(self._entity_store)
 
     @override
     def __contains__(self, value: object) -> bool:
-        if isinstance(value, Uid):
-            return value in self._entity_store
-        elif isinstance(value, (Entity, EntityRecord)):
-            return value.uid in self._entity_store
-        return False
+        if isinstance(value, (Entity, EntityRecord)):
+            value = value.uid
+        elif not isinstance(value, Uid):
+            return False
+        return value in self._pinned or value in self._entity_store
 
     @override
     def __str__(self) -> str:
-        return str(self._entity_store)
+        return str(dict(self.items()))
 
     @override
     def __repr__(self) -> str:
-        return f"EntityStore({self._entity_store!r})"
+        return f"EntityStore({dict(self.items())!r})"
+
+    # MARK: Pinned generation
+    # Entities reachable from the root are held strongly in a plain dictionary (the "pinned generation"), so that looking them up does not go
+    # through weak references. Transient entities (e.g. created in a session but not yet committed) are kept in the weak store as usual.
+    # Reachable entities are already kept alive by their parents, so pinning them does not extend their lifetime.
+    _pinned: MutableMapping[Uid, Entity]
+    _pinned_generation: bool
+
+    @property
+    def pinned_generation(self) -> bool:
+        return self._pinned_generation
+
+    @property
+    def pinned_count(self) -> int:
+        return len(self._pinned)
+
+    def is_pinned(self, key: Uid | Entity | EntityRecord) -> bool:
+        uid = key.uid if isinstance(key, (Entity, EntityRecord)) else key
+        return uid in self._pinned
+
+    def set_pinned_generation(self, enabled: bool, roots: Uid | Iterable[Uid] | None = None) -> None:  # noqa: FBT001
+        """Enable or disable the pinned generation.
+
+        When enabling, every entity reachable from ``roots`` is pinned. When disabling, every pinned entity is moved back to the weak store.
+        """
+        self._pinned_generation = enabled
+        if enabled:
+            if roots is not None:
+                self.pin(self.get_reachable_uids(roots))
+        else:
+            self.unpin(tuple(self._pinned))
+
+    def pin(self, uids: Iterable[Uid]) -> int:
+        """Move the given entities to the pinned generation. Returns the number of newly-pinned entities."""
+        if not self._pinned_generation:
+            return 0
+
+        count = 0
+        for uid in uids:
+            if uid in self._pinned or (entity := self._entity_store.get(uid, None)) is None or not entity.exists:
+                continue
+            self._pinned[uid] = entity
+            del self._entity_store[uid]
+            count += 1
+        return count
+
+    def unpin(self, uids: Uid | Iterable[Uid]) -> int:
+        """Move the given entities back to the weak store. Returns the number of unpinned entities."""
+        if isinstance(uids, Uid):
+            uids = (uids,)
+
+        count = 0
+        for uid in uids:
+            if (entity := self._pinned.pop(uid, None)) is None:
+                continue
+            self._entity_store[uid] = entity
+            count += 1
+        return count
+
+    def sweep(self, roots: Uid | Iterable[Uid], *, collect: bool = False) -> EntityStoreSweep:
+        """Re-synchronise the pinned generation with the entities reachable from ``roots``.
+
+        Pinned entities that are no longer reachable (or no longer exist) are moved back to the weak store, where they are released as soon as
+        nothing else references them, and reachable entities that are not yet pinned are pinned. If ``collect`` is true, a full garbage collection
+        is then run so that released entities are dropped from the weak store immediately.
+        """
+        reachable = self.get_reachable_uids(roots)
+
+        unpinned = self.unpin([uid for uid in self._pinned if uid not in reachable])
+        pinned = self.pin(uid for uid in reachable if uid not in self._pinned)
+
+        collected = gc.collect() if collect else 0
+
+        self.log.debug(
+            t"Swept entity store: {pinned} pinned, {unpinned} unpinned, {collected} objects collected, {len(self._pinned)}/{len(self)} entities pinned"
+        )
+        return EntityStoreSweep(pinned=pinned, unpinned=unpinned, collected=collected)
 
     # MARK: Garbage Collection / Reachability
     def get_reachable_uids(self, roots: Uid | Iterable[Uid], *, use_journal: bool = False) -> AbstractSet[Uid]:
@@ -225,7 +325,7 @@ class EntityStore(MutableMapping[Uid, Entity], LoggableHierarchicalMixin):
         return reachable
 
     def get_entity_uids(self) -> AbstractSet[Uid]:
-        return {entity.uid for entity in self._entity_store.values() if entity.exists}
+        return {entity.uid for entity in itertools.chain(self._pinned.values(), self._entity_store.values()) if entity.exists}
 
     def get_unreachable_uids(self, roots: Uid | Iterable[Uid], *, use_journal: bool = False) -> AbstractSet[Uid]:
         reachable = self.get_reachable_uids(roots, use_journal=use_journal)
@@ -76,6 +76,11 @@ class TransactionType(StrEnum):
     def stock_split(self) -> bool:
         return self is TransactionType.SPLIT
 
+    # MARK: Corporate actions
+    @property
+    def corporate_action(self) -> bool:
+        return self.stock_split
+
     # MARK: S104
     @property
     def affects_s104_holdings(self) -> bool:
@@ -9,8 +9,12 @@ from frozendict import frozendict
 from ..components.providers import Provider, ProviderType
 from ..components.providers.forex import ForexProvider
 from ..context import DirectContext
+from ..portfolio.journal.commit_statistics import COMMIT_STATISTICS
+from ..portfolio.models.entity import EntityLog
 from ..portfolio.models.root import PortfolioRoot
+from ..util.helpers import generics, type_hints
 from ..util.mixins import LoggableHierarchicalNamedMixin, ParentType
+from ..util.profiling import PROFILER
 
 
 if TYPE_CHECKING:
@@ -42,6 +46,7 @@ class Runtime(LoggableHierarchicalNamedMixin):
             return
 
         self._initialize_config()
+        self._initialize_introspection()
         self._initialize_portfolio()
         self._initialize_providers()
         self._initialize_context()
@@ -50,12 +55,21 @@ class Runtime(LoggableHierarchicalNamedMixin):
 
     def _initialize_config(self) -> None:
         self.config.initialize()
+        COMMIT_STATISTICS.configure(slow_threshold_ms=self.config.profiling.slow_commit_threshold_ms)
+        EntityLog.configure(self.config.entity_log)
+
+    def _initialize_introspection(self) -> None:
+        # Resolve generic arguments and type hints now that every module has been imported, rather than lazily in hot paths
+        methods = generics.resolve_introspection_methods()
+        classes = type_hints.resolve_cached_type_hints()
+        self.log.debug(t"Resolved {methods} generic arguments and the type hints of {classes} classes")
 
     def _initialize_portfolio(self) -> None:
         self.portfolio_root = root = PortfolioRoot()
         root.set_as_global_root()
         with root.session_manager(actor=self.instance_hierarchy, reason="Initialize portfolio root"):
             root.create_root_entity()
+        root.pin_entities()
 
     def _initialize_providers(self) -> None:
         providers = {}
@@ -76,11 +90,26 @@ class Runtime(LoggableHierarchicalNamedMixin):
         if not self.initialized:
             self.initialize()
 
-        orchestrator_config = RuntimeOrchestratorConfig(package="app.runtime", components=self.config.agents)
+        orchestrator_config = RuntimeOrchestratorConfig(package="app.runtime", components=self.config.agents, max_workers=self.config.max_workers)
         orchestrator = RuntimeOrchestrator(orchestrator_config, instance_name="orchestrator", instance_parent=self)
-        with self.context as ctx:
+        with PROFILER.span(self.instance_hierarchy, category="runtime"), self.context as ctx:
             orchestrator.run(ctx)
 
+        if PROFILER.enabled:
+            self._report_profiling()
+
+    def _report_profiling(self) -> None:
+        config = self.config.profiling
+
+        if config.trace_file is not None:
+            PROFILER.write_chrome_trace(config.trace_file)
+            self.log.info(t"Wrote profiling trace to {config.trace_file}")
+            if dropped := PROFILER.dropped_spans:
+                self.log.warning(t"Dropped the {dropped} oldest spans from the profiling trace, increase 'max_spans' to keep them")
+
+        if config.summary:
+            PROFILER.log_summary(self.log)
+
     # MARK: Providers
     def has_provider(self, key: ProviderType | str) -> bool:
         return key in self.providers
@@ -2,6 +2,7 @@
 # Copyright © 2025 pygaindalf Rui Pinheiro
 
 
+import atexit
 import os
 import pathlib
 import sys
@@ -11,8 +12,10 @@ from typing import TYPE_CHECKING, Any
 import yaml
 
 from ..helpers import script_info, script_version
+from ..helpers.instance_lru_cache import INSTANCE_CACHE_REGISTRY
 from ..logging.manager import LoggingManager
 from ..mixins import LoggableMixin
+from ..profiling import PROFILER
 from ..requests import RequestsManager
 from .models import ConfigBase, ConfigLoggingOnly
 from .models.config_path import ConfigFilePath
@@ -143,6 +146,8 @@ class ConfigFileLoader[C: ConfigBase](LoggableMixin):
 
         # Initialize any other managers that depend on the configuration
         self._init_requests_manager()
+        self._init_instance_cache_registry()
+        self._init_profiler()
 
         # Done
         return self.config
@@ -169,3 +174,21 @@ class ConfigFileLoader[C: ConfigBase](LoggableMixin):
         if manager.initialized:
             return
         manager.initialize(self.config.requests, install=True)
+
+    def _init_instance_cache_registry(self) -> None:
+        if self.config is None:
+            msg = "Configuration not loaded. Call 'load()' first."
+            raise RuntimeError(msg)
+
+        config = self.config.instance_cache
+        INSTANCE_CACHE_REGISTRY.configure(maxsize=config.maxsize, method_maxsize=config.method_maxsize)
+
+        if config.report_at_exit and not script_info.is_unit_test():
+            atexit.register(INSTANCE_CACHE_REGISTRY.log_statistics, self.log)
+
+    def _init_profiler(self) -> None:
+        if self.config is None:
+            msg = "Configuration not loaded. Call 'load()' first."
+            raise RuntimeError(msg)
+
+        PROFILER.configure(self.config.profiling)
@@ -9,9 +9,11 @@ from typing import ClassVar
 from pydantic import Field
 
 from ...logging.config import LoggingConfig
+from ...profiling.config import ProfilingConfig
 from ...requests.config import RequestsConfig
 from .app_info import AppInfo
 from .base_model import BaseConfigModel
+from .instance_cache import InstanceCacheConfig
 
 
 class ConfigLoggingOnly(BaseConfigModel):
@@ -34,6 +36,10 @@ class ConfigBase(ConfigLoggingOnly):
 
     requests: RequestsConfig = Field(default_factory=RequestsConfig, description="HTTP requests configuration, including rate limiting and caching")
 
+    instance_cache: InstanceCacheConfig = Field(default_factory=InstanceCacheConfig, description="Limits and statistics of per-instance method caches")
+
+    profiling: ProfilingConfig = Field(default_factory=ProfilingConfig, description="Per-component profiling and tracing configuration")
+
     def debug(self) -> None:
         model_dump = None
 
@@ -25,6 +25,7 @@ def delete_file_path(v: Path) -> Path:
     return v
 
 
+EnvPath = Annotated[Path, AfterValidator(expand_path)]
 EnvFilePath = Annotated[Path, AfterValidator(expand_path), PathType("file")]
 EnvDirectoryPath = Annotated[Path, AfterValidator(expand_path), PathType("dir")]
 EnvNewPath = Annotated[Path, AfterValidator(expand_path), PathType("new")]
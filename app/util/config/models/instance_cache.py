@@ -0,0 +1,22 @@
+# SPDX-License-Identifier: GPLv3-or-later
+# Copyright © 2025 pygaindalf Rui Pinheiro
+
+
+from frozendict import frozendict
+from pydantic import Field, NonNegativeInt
+
+from ...helpers.frozendict import FrozenDict
+from ...helpers.instance_lru_cache import DEFAULT_GLOBAL_MAXSIZE
+from .base_model import BaseConfigModel
+
+
+# MARK: Instance Cache Configuration
+class InstanceCacheConfig(BaseConfigModel):
+    maxsize: NonNegativeInt | None = Field(
+        default=DEFAULT_GLOBAL_MAXSIZE, description="Maximum number of cached method results across all instances, or null for no global limit."
+    )
+    method_maxsize: FrozenDict[str, NonNegativeInt | None] = Field(
+        default_factory=frozendict,
+        description="Maximum number of cached results per method across all instances, keyed by fully qualified method name (e.g. 'app.module.Class.method').",
+    )
+    report_at_exit: bool = Field(default=True, description="Whether to log the cache hit and miss statistics when the application exits.")
@@ -117,12 +117,13 @@ import functools
 import types
 import typing
 import warnings
+import weakref
 
 from functools import lru_cache
 
 from frozendict import frozendict
 
-from . import type_hints
+from . import mro, type_hints
 from .instance_lru_cache import instance_lru_cache
 
 
@@ -1000,12 +1001,17 @@ def get_concrete_parent_argument_origin(
 
 
 # MARK: introspection method descriptor
+#: Every :class:`GenericIntrospectionMethod` attached to a class, held weakly so that the descriptors of discarded classes are dropped with them.
+INTROSPECTION_METHODS: weakref.WeakSet[GenericIntrospectionMethod] = weakref.WeakSet()
+
+
 class GenericIntrospectionMethod[R: object](classmethod[typing.Any, ..., type[R]]):
     """Descriptor that resolves generic parent arguments on demand."""
 
     __callguarded__: typing.ClassVar[bool] = True  # Prevent callguard from acting on this descriptor
     _parent: type | None = None
     _param: typing.TypeVar
+    _attribute: str = ""
 
     @typing.override
     def __class_getitem__(cls, arg: typing.TypeVar) -> GenericAlias:
@@ -1045,6 +1051,8 @@ class GenericIntrospectionMethod[R: object](classmethod[typing.Any, ..., type[R]
         self._parent = origin
         self.__name__ = name
         self.__qualname__ = f"{origin.__qualname__}.{name}"
+        self._attribute = f"__{name}_resolved__"
+        INTROSPECTION_METHODS.add(self)
 
     def _update_kwargs(self, kwargs: GetConcreteParentArgumentKwargs) -> GetConcreteParentArgumentKwargs:
         """Merge instance defaults and enforce ``TypeVar`` bounds on *kwargs*."""
@@ -1058,20 +1066,77 @@ class GenericIntrospectionMethod[R: object](classmethod[typing.Any, ..., type[R]
 
         return kwargs
 
+    def _resolve(self, cls: type, source: type | None = None, **kwargs: typing.Unpack[GetConcreteParentArgumentKwargs]) -> type[R]:
+        if self._parent is None:
+            msg = "GenericIntrospectionMethod must be used as a class or instance attribute"
+            raise TypeError(msg)
+        return typing.cast("type[R]", get_concrete_parent_argument(source or cls, self._parent, self._param, **self._update_kwargs(kwargs)))
+
     @instance_lru_cache
+    def _introspect_with_arguments(self, cls: type, source: type | None = None, **kwargs: typing.Unpack[GetConcreteParentArgumentKwargs]) -> type[R]:
+        return self._resolve(cls, source, **kwargs)
+
     def introspect[T: type](self, cls: type[T], source: type[T] | None = None, **kwargs: typing.Unpack[GetConcreteParentArgumentKwargs]) -> type[R]:
         """Resolve and cache the concrete parent argument defined by the descriptor.
 
-        The descriptor caches the result per owning class via
-        :func:`instance_lru_cache` so repeated introspections remain constant
-        time.
+        Plain calls (without ``source`` or keyword arguments) store their result as a class attribute of ``cls``, so that repeated
+        introspections are a single attribute load. See :func:`resolve_introspection_methods` to populate these eagerly. Calls with
+        arguments are cached per descriptor via :func:`instance_lru_cache`.
 
         Raises:
             GenericsError: If the underlying parent argument cannot be
                 resolved to a concrete type.
 
         """
-        if self._parent is None:
-            msg = "GenericIntrospectionMethod must be used as a class or instance attribute"
-            raise TypeError(msg)
-        return typing.cast("type[R]", get_concrete_parent_argument(source or cls, self._parent, self._param, **self._update_kwargs(kwargs)))
+        if source is not None or kwargs:
+            return self._introspect_with_arguments(cls, source, **kwargs)
+
+        # Only trust values stored on cls itself, as subclasses inherit their parents' class attributes
+        if (result := cls.__dict__.get(self._attribute)) is None:
+            result = self._resolve(cls)
+            setattr(cls, self._attribute, result)
+        return result
+
+    def resolve_eagerly(self, cls: type) -> bool:
+        """Resolve and store the result of a plain call for ``cls``, checking it against any previously stored value.
+
+        Returns whether the argument could be resolved; classes that still leave the parameter unresolved (e.g. generic subclasses) are skipped.
+
+        Raises:
+            GenericsError: If a previously stored value does not match the freshly resolved one.
+
+        """
+        try:
+            result = self._resolve(cls)
+        except GenericsError:
+            return False
+        except Exception as e:  # noqa: BLE001 as eager resolution must not abort startup, and plain calls will resolve lazily instead
+            warnings.warn(f"{cls.__name__}.{self.__name__}(): eager resolution failed, falling back to lazy resolution: {e!r}", stacklevel=2)
+            return False
+
+        if (stored := cls.__dict__.get(self._attribute)) is not None and stored != result:
+            msg = f"{cls.__name__}.{self.__name__}() resolved to {result}, but {stored} was previously stored."
+            raise GenericsError(msg)
+
+        setattr(cls, self._attribute, result)
+        return True
+
+
+def resolve_introspection_methods() -> int:
+    """Eagerly resolve every :class:`GenericIntrospectionMethod` for every subclass of its owning class.
+
+    This is meant to be called once all modules have been imported, so that forward references can be resolved and any warnings about
+    unresolvable ones surface at startup rather than on first use.
+
+    Returns:
+        The number of (method, class) pairs resolved.
+
+    """
+    resolved = 0
+    for method in tuple(INTROSPECTION_METHODS):
+        if (parent := method._parent) is None:  # noqa: SLF001
+            continue
+        for klass in mro.iter_subclasses(parent):
+            if method.resolve_eagerly(klass):
+                resolved += 1
+    return resolved
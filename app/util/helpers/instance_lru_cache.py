@@ -1,27 +1,312 @@
 # SPDX-License-Identifier: GPLv3-or-later
 # Copyright © 2025 pygaindalf Rui Pinheiro
 
+"""Per-instance method memoization whose memory is bounded by a single, global cache registry.
+
+Methods decorated with :func:`instance_lru_cache` get one :func:`functools.lru_cache` per instance, so that cache hits never leave C code.
+Every such cache reports its misses to :data:`INSTANCE_CACHE_REGISTRY` before their result is inserted. This is when the registry enforces its
+global entry limit, and optionally a per-method limit, by clearing the caches that were least recently filled.
+
+The registry holds a single weak reference per instance, and forgets the caches of an instance once it is garbage collected. Hit and miss
+statistics are aggregated per method. Misses are counted by the registry as they happen, while hits are read from the caches themselves, so
+the hits of a cache are lost if its ``cache_clear()`` is called directly.
+"""
+
+import collections
 import functools
+import threading
+import weakref
 
-from typing import TYPE_CHECKING, Concatenate, overload
+from collections import OrderedDict
+from collections.abc import Mapping
+from typing import TYPE_CHECKING, Any, Concatenate, NamedTuple, Self, overload
 
 
 if TYPE_CHECKING:
     from collections.abc import Callable
+    from functools import _lru_cache_wrapper
+
+    from ..logging import Logger
+
+
+#: Default limit for the total number of cached entries across every decorated method and instance.
+DEFAULT_GLOBAL_MAXSIZE = 65536
+
+#: Default per-instance limit, matching :func:`functools.lru_cache`.
+DEFAULT_INSTANCE_MAXSIZE = 128
+
+
+type _Cache = _lru_cache_wrapper[Any]
+
+
+# MARK: Statistics
+class InstanceCacheInfo(NamedTuple):
+    hits: int
+    misses: int
+    maxsize: int | None
+    currsize: int
+
+    @property
+    def hit_ratio(self) -> float:
+        return self.hits / total if (total := self.hits + self.misses) else 0.0
+
+
+# MARK: Per-method state
+class InstanceCacheMethod:
+    """Registry state shared by every instance of a method decorated with :func:`instance_lru_cache`."""
+
+    __slots__ = ("caches", "currsize", "evictions", "hits", "instance_maxsize", "maxsize", "misses", "name", "typed")
+
+    def __init__(self, name: str, *, instance_maxsize: int | None, maxsize: int | None, typed: bool) -> None:
+        self.name = name
+        self.instance_maxsize = instance_maxsize
+        self.maxsize = maxsize
+        self.typed = typed
+
+        # Caches of this method holding entries, in the order they were last filled, with their (estimated) number of entries
+        self.caches: OrderedDict[_Cache, int] = OrderedDict()
+        self.currsize = 0
+
+        # Hits of caches that have since been cleared by the registry, and misses of every cache
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def cache_info(self) -> InstanceCacheInfo:
+        infos = tuple(cache.cache_info() for cache in self.caches)
+        return InstanceCacheInfo(
+            hits=self.hits + sum(info.hits for info in infos),
+            misses=self.misses,
+            maxsize=self.maxsize,
+            currsize=sum(info.currsize for info in infos),
+        )
+
+
+# MARK: Per-instance state
+class _InstanceRef(weakref.ref):
+    """Weak reference to an instance with cached methods, holding its caches so that the registry can forget them once it is collected."""
+
+    __slots__ = ("caches", "key")
+
+    caches: list[tuple[_Cache, InstanceCacheMethod]]
+    key: int
+
+    def __new__(cls, instance: object, callback: Callable[[_InstanceRef], Any]) -> Self:
+        self = super().__new__(cls, instance, callback)
+        self.caches = []
+        self.key = id(instance)
+        return self
+
+
+# MARK: Registry
+class InstanceCacheRegistry:
+    """Thread-safe tracker of every :func:`instance_lru_cache` cache.
+
+    Whenever the per-method or global limits are exceeded, whole per-instance caches are cleared in least-recently-filled order.
+    """
+
+    def __init__(self, maxsize: int | None = DEFAULT_GLOBAL_MAXSIZE) -> None:
+        self._lock = threading.RLock()
+        self._maxsize = maxsize
+        self._methods: dict[str, InstanceCacheMethod] = {}
+        self._method_limits: dict[str, int | None] = {}
+
+        # Caches holding entries across all methods, in the order they were last filled
+        self._caches: OrderedDict[_Cache, InstanceCacheMethod] = OrderedDict()
+        self._currsize = 0
+
+        # Instances with caches, by id, and the references of those that have been collected since the registry was last used
+        self._instances: dict[int, _InstanceRef] = {}
+        self._collected: collections.deque[_InstanceRef] = collections.deque()
 
+    @property
+    def maxsize(self) -> int | None:
+        return self._maxsize
 
+    @property
+    def currsize(self) -> int:
+        with self._lock:
+            self._forget_collected()
+            return sum(cache.cache_info().currsize for cache in self._caches)
+
+    # MARK: Registration & configuration
+    def register(self, name: str, *, instance_maxsize: int | None, maxsize: int | None = None, typed: bool = False) -> InstanceCacheMethod:
+        with self._lock:
+            if (method := self._methods.get(name)) is None:
+                method = self._methods[name] = InstanceCacheMethod(name, instance_maxsize=instance_maxsize, maxsize=maxsize, typed=typed)
+            if name in self._method_limits:
+                method.maxsize = self._method_limits[name]
+            return method
+
+    def configure(self, *, maxsize: int | None = DEFAULT_GLOBAL_MAXSIZE, method_maxsize: Mapping[str, int | None] | None = None) -> None:
+        """Set the global limit and per-method limits (by fully qualified method name), clearing caches as needed."""
+        with self._lock:
+            self._maxsize = maxsize
+
+            if method_maxsize is not None:
+                self._method_limits.update(method_maxsize)
+                for name, limit in method_maxsize.items():
+                    if (method := self._methods.get(name)) is not None:
+                        method.maxsize = limit
+                        self._enforce_method_limit(method)
+
+            self._enforce_global_limit()
+
+    # MARK: Caches
+    def create(self, method: InstanceCacheMethod, wrapped: Callable[..., Any], instance: object) -> _Cache:
+        """Create the cache of ``method`` for ``instance``, which holds the instance weakly so that it does not outlive it.
+
+        Threads racing to create the same cache all receive the cache created by the first of them.
+        """
+        with self._lock:
+            self._forget_collected()
+            if (ref := self._instances.get(id(instance))) is None or ref() is not instance:
+                ref = self._instances[id(instance)] = _InstanceRef(instance, self._collected.append)
+            else:
+                for cache, cache_method in ref.caches:
+                    if cache_method is method:
+                        return cache
+
+            def miss(*args: Any, **kwargs: Any) -> Any:
+                self._on_miss(cache, method)
+                return wrapped(ref(), *args, **kwargs)
+
+            cache = functools.lru_cache(maxsize=method.instance_maxsize, typed=method.typed)(miss)
+            functools.update_wrapper(cache, wrapped)
+            ref.caches.append((cache, method))
+            return cache
+
+    def _on_miss(self, cache: _Cache, method: InstanceCacheMethod) -> None:
+        with self._lock:
+            self._forget_collected()
+            method.misses += 1
+
+            # The result is inserted once the miss returns, replacing the least recently used entry if the cache is already full
+            size = cache.cache_info().currsize + 1
+            if (limit := method.instance_maxsize) is not None:
+                size = min(size, limit)
+
+            previous = method.caches.pop(cache, 0)
+            self._caches.pop(cache, None)
+            if size:
+                method.caches[cache] = size
+                self._caches[cache] = method
+            method.currsize += size - previous
+            self._currsize += size - previous
+
+            self._enforce_method_limit(method, keep=cache)
+            self._enforce_global_limit(keep=cache)
+
+    def _enforce_method_limit(self, method: InstanceCacheMethod, *, keep: _Cache | None = None) -> None:
+        if (limit := method.maxsize) is None:
+            return
+        while method.currsize > limit and (cache := next(iter(method.caches))) is not keep:
+            self._forget(cache, evict=True)
+
+    def _enforce_global_limit(self, *, keep: _Cache | None = None) -> None:
+        if (limit := self._maxsize) is None:
+            return
+        while self._currsize > limit and (cache := next(iter(self._caches))) is not keep:
+            self._forget(cache, evict=True)
+
+    def _forget(self, cache: _Cache, *, evict: bool) -> None:
+        """Stop tracking the entries of ``cache``, folding its hits into its method's statistics, and clear it if it is being evicted."""
+        if (method := self._caches.pop(cache, None)) is None:
+            return
+
+        size = method.caches.pop(cache)
+        method.currsize -= size
+        self._currsize -= size
+
+        info = cache.cache_info()
+        method.hits += info.hits
+        if evict:
+            method.evictions += info.currsize
+            cache.cache_clear()
+
+    def _forget_collected(self) -> None:
+        while self._collected:
+            ref = self._collected.popleft()
+            if self._instances.get(ref.key) is ref:
+                del self._instances[ref.key]
+            for cache, _ in ref.caches:
+                self._forget(cache, evict=False)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._forget_collected()
+            for cache in tuple(self._caches):
+                self._forget(cache, evict=True)
+            for method in self._methods.values():
+                method.hits = method.misses = method.evictions = 0
+
+    # MARK: Statistics
+    def cache_info(self) -> Mapping[str, InstanceCacheInfo]:
+        """Return the aggregated statistics of every registered method, by fully qualified method name."""
+        with self._lock:
+            self._forget_collected()
+            return {name: method.cache_info() for name, method in self._methods.items()}
+
+    def total_info(self) -> InstanceCacheInfo:
+        infos = tuple(self.cache_info().values())
+        return InstanceCacheInfo(
+            hits=sum(info.hits for info in infos),
+            misses=sum(info.misses for info in infos),
+            maxsize=self._maxsize,
+            currsize=sum(info.currsize for info in infos),
+        )
+
+    def log_statistics(self, log: Logger) -> None:
+        total = self.total_info()
+        log.info(t"Instance caches: {total.hits}/{total.hits + total.misses} hits ({total.hit_ratio:.1%}), {total.currsize} entries")
+
+        for name, info in sorted(self.cache_info().items(), key=lambda item: item[1].misses, reverse=True):
+            if not info.hits and not info.misses:
+                continue
+            log.info(t"  {name}: {info.hits} hits, {info.misses} misses ({info.hit_ratio:.1%}), {info.currsize} entries")
+
+
+#: Registry shared by every :func:`instance_lru_cache` method.
+INSTANCE_CACHE_REGISTRY = InstanceCacheRegistry()
+
+
+# MARK: Decorator
 @overload
-def instance_lru_cache[T: object, **P, R](wrapped: Callable[Concatenate[T, P], R], **lru_cache_kwargs) -> functools.cached_property: ...
+def instance_lru_cache[T: object, **P, R](
+    wrapped: Callable[Concatenate[T, P], R],
+    *,
+    maxsize: int | None = ...,
+    method_maxsize: int | None = ...,
+    typed: bool = ...,
+    registry: InstanceCacheRegistry | None = ...,
+) -> functools.cached_property: ...
 @overload
-def instance_lru_cache(**lru_cache_kwargs) -> Callable: ...
+def instance_lru_cache(
+    *, maxsize: int | None = ..., method_maxsize: int | None = ..., typed: bool = ..., registry: InstanceCacheRegistry | None = ...
+) -> Callable: ...
+
 
+def instance_lru_cache[T: object, **P, R](
+    wrapped: Callable[Concatenate[T, P], R] | None = None,
+    *,
+    maxsize: int | None = DEFAULT_INSTANCE_MAXSIZE,
+    method_maxsize: int | None = None,
+    typed: bool = False,
+    registry: InstanceCacheRegistry | None = None,
+) -> Callable | functools.cached_property:
+    """Memoize a method per instance, with a :func:`functools.lru_cache` per instance.
 
-def instance_lru_cache[T: object, **P, R](wrapped: Callable[Concatenate[T, P], R] | None = None, **lru_cache_kwargs) -> Callable | functools.cached_property:
+    ``maxsize`` bounds the entries of each instance, ``method_maxsize`` the entries of this method across all instances, and the registry bounds
+    the entries across all methods.
+    """
     if wrapped is None:
-        return functools.partial(instance_lru_cache, **lru_cache_kwargs)
+        return functools.partial(instance_lru_cache, maxsize=maxsize, method_maxsize=method_maxsize, typed=typed, registry=registry)
+
+    _registry = registry if registry is not None else INSTANCE_CACHE_REGISTRY
+    method = _registry.register(f"{wrapped.__module__}.{wrapped.__qualname__}", instance_maxsize=maxsize, maxsize=method_maxsize, typed=typed)
 
     @functools.wraps(wrapped)
     def wrapper(self: T) -> Callable[..., R]:
-        return functools.lru_cache(**lru_cache_kwargs)(functools.update_wrapper(functools.partial(wrapped, self), wrapped))
+        return _registry.create(method, wrapped, self)
 
     return functools.cached_property(wrapper)
@@ -2,11 +2,12 @@
 # Copyright © 2025 pygaindalf Rui Pinheiro
 
 
+from collections import deque
 from typing import TYPE_CHECKING
 
 
 if TYPE_CHECKING:
-    from collections.abc import Iterable
+    from collections.abc import Iterable, Iterator
 
 
 def _ensure_mro_order(final: type, target: type, others: type | Iterable[type], *, before: bool = True, fail: bool = True) -> bool:
@@ -45,3 +46,16 @@ def ensure_mro_order(
             return False
 
     return True
+
+
+def iter_subclasses(cls: type, *, include_self: bool = True) -> Iterator[type]:
+    """Iterate breadth-first over every (transitive) subclass of ``cls``, visiting each class once."""
+    seen: set[type] = set()
+    pending = deque((cls,) if include_self else type.__subclasses__(cls))
+    while pending:
+        klass = pending.popleft()
+        if klass in seen:
+            continue
+        seen.add(klass)
+        yield klass
+        pending.extend(type.__subclasses__(klass))
@@ -8,7 +8,7 @@ import warnings
 
 from frozendict import frozendict
 
-from . import script_info
+from . import mro, script_info
 from .classproperty import cached_classproperty
 
 
@@ -44,6 +44,37 @@ class CachedTypeHintsMixin:
     def __cached_type_hints__(cls) -> typing.Mapping[str, typing.Any]:
         return _get_type_hints(cls, format=cls.__cached_type_hints_format__)
 
+    def __init_subclass__(cls, **kwargs) -> None:
+        super().__init_subclass__(**kwargs)
+
+        # The cached hints are stored as a plain attribute of the class they were computed for, so each subclass needs its own descriptor,
+        # otherwise it would inherit the hints of the first parent class they were computed for
+        if "__cached_type_hints__" not in cls.__dict__:
+            setattr(cls, "__cached_type_hints__", CachedTypeHintsMixin.__dict__["__cached_type_hints__"])
+
+
+def resolve_cached_type_hints() -> int:
+    """Eagerly compute and store the cached type hints of every :class:`CachedTypeHintsMixin` subclass.
+
+    This is meant to be called once all modules have been imported, so that forward references that could not be resolved when the hints
+    were first requested are resolved now. Classes whose hints still cannot be resolved are skipped with a warning, and keep computing them lazily.
+
+    Returns:
+        The number of classes whose type hints were stored.
+
+    """
+    resolved = 0
+    for klass in mro.iter_subclasses(CachedTypeHintsMixin, include_self=False):
+        # Bypass the _get_type_hints cache, as it may hold hints computed before every forward reference could be resolved
+        try:
+            hints = frozendict(typing.get_type_hints(klass, format=klass.__cached_type_hints_format__))
+        except (NameError, TypeError, AttributeError) as e:
+            warnings.warn(f"{klass.__name__}: eager type hint resolution failed, falling back to lazy resolution: {e!r}", stacklevel=2)
+            continue
+        setattr(klass, "__cached_type_hints__", hints)
+        resolved += 1
+    return resolved
+
 
 # MARK: get_type_hints
 def get_type_hints(obj: typing.Any) -> typing.Mapping[str, typing.Any]:
@@ -0,0 +1,14 @@
+# SPDX-License-Identifier: GPLv3-or-later
+# Copyright © 2025 pygaindalf Rui Pinheiro
+
+from .profiler import CURRENT_SPAN, PROFILER, Profiler, ProfilingSummaryRow
+from .span import ProfilingSpan
+
+
+__all__ = [
+    "CURRENT_SPAN",
+    "PROFILER",
+    "Profiler",
+    "ProfilingSpan",
+    "ProfilingSummaryRow",
+]
@@ -0,0 +1,29 @@
+# SPDX-License-Identifier: GPLv3-or-later
+# Copyright © 2025 pygaindalf Rui Pinheiro
+
+import pathlib
+
+from pydantic import Field, NonNegativeFloat, PositiveInt
+
+from ..config.models import BaseConfigModel
+from .profiler import DEFAULT_MAX_SPANS
+
+
+# MARK: Profiling Configuration
+class ProfilingConfig(BaseConfigModel):
+    enabled: bool = Field(default=False, description="Whether to record profiling spans for component entrypoints and agent runs.")
+    trace_allocations: bool = Field(
+        default=False, description="Whether to trace memory allocations with tracemalloc, recording the allocation delta of each span. This is expensive."
+    )
+    trace_file: pathlib.Path | None = Field(
+        default=None, description="Path of a Chrome trace-event JSON file to write when the runtime finishes, loadable in Perfetto or speedscope."
+    )
+    max_spans: PositiveInt = Field(
+        default=DEFAULT_MAX_SPANS,
+        description="Maximum number of spans kept for the trace file, dropping the oldest ones. The summary always covers every span.",
+    )
+    summary: bool = Field(default=True, description="Whether to log a per-component summary table when the runtime finishes.")
+    slow_commit_threshold_ms: NonNegativeFloat | None = Field(
+        default=None,
+        description="Session commits taking at least this many milliseconds are logged as warnings with a per-phase breakdown, or null to disable. Independent of 'enabled'.",
+    )
@@ -0,0 +1,230 @@
+# SPDX-License-Identifier: GPLv3-or-later
+# Copyright © 2025 pygaindalf Rui Pinheiro
+
+import contextlib
+import io
+import json
+import logging
+import os
+import threading
+import time
+import tracemalloc
+
+from collections import Counter, deque
+from contextvars import ContextVar
+from typing import TYPE_CHECKING, Any, NamedTuple, Self
+
+from .span import ProfilingSpan
+
+
+if TYPE_CHECKING:
+    import pathlib
+
+    from collections.abc import Iterator, Sequence
+
+    from rich.table import Table
+
+    from ..logging import Logger
+    from .config import ProfilingConfig
+
+
+#: Default maximum number of finished spans kept for the trace.
+DEFAULT_MAX_SPANS = 100_000
+
+
+# MARK: Current span
+CURRENT_SPAN: ContextVar[ProfilingSpan | None] = ContextVar("CURRENT_SPAN", default=None)
+
+
+# MARK: Summary
+class ProfilingSummaryRow(NamedTuple):
+    name: str
+    category: str
+    calls: int
+    wall_ns: int
+    cpu_ns: int
+    allocated: int | None
+    counters: Counter[str]
+
+
+# MARK: Profiler
+class Profiler:
+    """Process-wide recorder of :class:`ProfilingSpan` objects.
+
+    Spans nest following the :data:`CURRENT_SPAN` context variable, so nested component entrypoints (e.g. an agent run inside an orchestrator
+    run) produce nested spans. While disabled, :meth:`span` and :meth:`count` are no-ops.
+
+    Finished spans are aggregated into the summary as they finish, while only the most recent ``max_spans`` of them are kept for the trace.
+    """
+
+    _instance = None
+
+    enabled: bool
+    _lock: threading.Lock
+    _spans: deque[ProfilingSpan]
+    _dropped: int
+    _summary: dict[str, ProfilingSummaryRow]
+    _summary_start_ns: dict[str, int]
+    _origin_ns: int
+    _started_tracemalloc: bool
+
+    def __new__(cls, *args, **kwargs) -> Self:
+        if not cls._instance:
+            cls._instance = instance = super().__new__(cls, *args, **kwargs)
+            instance.enabled = False
+            instance._lock = threading.Lock()
+            instance._spans = deque(maxlen=DEFAULT_MAX_SPANS)
+            instance._dropped = 0
+            instance._summary = {}
+            instance._summary_start_ns = {}
+            instance._origin_ns = time.perf_counter_ns()
+            instance._started_tracemalloc = False
+        return cls._instance
+
+    def __init__(self) -> None:
+        pass
+
+    # MARK: Configuration
+    def configure(self, config: ProfilingConfig) -> None:
+        self.enabled = config.enabled
+
+        with self._lock:
+            if self._spans.maxlen != config.max_spans:
+                self._spans = deque(self._spans, maxlen=config.max_spans)
+
+        if config.enabled and config.trace_allocations:
+            if not tracemalloc.is_tracing():
+                tracemalloc.start()
+                self._started_tracemalloc = True
+        elif self._started_tracemalloc:
+            tracemalloc.stop()
+            self._started_tracemalloc = False
+
+    def reset(self) -> None:
+        with self._lock:
+            self._spans.clear()
+            self._dropped = 0
+            self._summary.clear()
+            self._summary_start_ns.clear()
+            self._origin_ns = time.perf_counter_ns()
+
+    # MARK: Recording
+    @contextlib.contextmanager
+    def span(self, name: str, category: str = "component") -> Iterator[ProfilingSpan | None]:
+        if not self.enabled:
+            yield None
+            return
+
+        span = ProfilingSpan(name, category, parent=CURRENT_SPAN.get())
+        token = CURRENT_SPAN.set(span)
+        span.start()
+        try:
+            yield span
+        finally:
+            span.stop()
+            CURRENT_SPAN.reset(token)
+            self._record(span)
+
+    def _record(self, span: ProfilingSpan) -> None:
+        with self._lock:
+            if len(self._spans) == self._spans.maxlen:
+                self._dropped += 1
+            self._spans.append(span)
+
+            if (row := self._summary.get(span.name)) is None:
+                self._summary_start_ns[span.name] = span.start_ns
+                self._summary[span.name] = ProfilingSummaryRow(
+                    name=span.name,
+                    category=span.category,
+                    calls=1,
+                    wall_ns=span.wall_ns,
+                    cpu_ns=span.cpu_ns,
+                    allocated=span.allocated,
+                    counters=Counter(span.counters),
+                )
+                return
+
+            self._summary_start_ns[span.name] = min(self._summary_start_ns[span.name], span.start_ns)
+            allocated = row.allocated if span.allocated is None else (row.allocated or 0) + span.allocated
+            row.counters.update(span.counters)
+            self._summary[span.name] = row._replace(
+                calls=row.calls + 1,
+                wall_ns=row.wall_ns + span.wall_ns,
+                cpu_ns=row.cpu_ns + span.cpu_ns,
+                allocated=allocated,
+            )
+
+    def count(self, counter: str, n: int = 1) -> None:
+        """Increment ``counter`` on the innermost active span, if any."""
+        if self.enabled and (span := CURRENT_SPAN.get()) is not None:
+            span.count(counter, n)
+
+    @property
+    def spans(self) -> Sequence[ProfilingSpan]:
+        with self._lock:
+            return tuple(self._spans)
+
+    @property
+    def dropped_spans(self) -> int:
+        """Number of finished spans dropped from the trace because more than ``max_spans`` spans were recorded."""
+        with self._lock:
+            return self._dropped
+
+    # MARK: Chrome trace
+    def as_chrome_trace(self) -> dict[str, Any]:
+        pid = os.getpid()
+        events = [span.as_trace_event(origin_ns=self._origin_ns, pid=pid) for span in sorted(self.spans, key=lambda span: span.start_ns)]
+        return {"traceEvents": events, "displayTimeUnit": "ms"}
+
+    def write_chrome_trace(self, path: pathlib.Path) -> None:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        with path.open("w", encoding="utf-8") as f:
+            json.dump(self.as_chrome_trace(), f)
+
+    # MARK: Summary
+    def summarize(self) -> Sequence[ProfilingSummaryRow]:
+        """Aggregate every finished span by name, in order of first appearance, including spans dropped from the trace."""
+        with self._lock:
+            rows = sorted(self._summary.values(), key=lambda row: self._summary_start_ns[row.name])
+            return tuple(row._replace(counters=Counter(row.counters)) for row in rows)
+
+    def summary_table(self) -> Table:
+        from rich.table import Table
+
+        rows = self.summarize()
+        counters = sorted({counter for row in rows for counter in row.counters})
+        show_allocated = any(row.allocated is not None for row in rows)
+
+        table = Table(title="Profiling summary")
+        table.add_column("Span")
+        table.add_column("Category")
+        table.add_column("Calls", justify="right")
+        table.add_column("Wall (ms)", justify="right")
+        table.add_column("CPU (ms)", justify="right")
+        if show_allocated:
+            table.add_column("Allocated (KiB)", justify="right")
+        for counter in counters:
+            table.add_column(counter.replace("_", " ").capitalize(), justify="right")
+
+        for row in rows:
+            cells = [row.name, row.category, str(row.calls), f"{row.wall_ns / 1e6:.1f}", f"{row.cpu_ns / 1e6:.1f}"]
+            if show_allocated:
+                cells.append("" if row.allocated is None else f"{row.allocated / 1024:.1f}")
+            cells.extend(str(row.counters.get(counter, 0)) for counter in counters)
+            table.add_row(*cells)
+
+        return table
+
+    def log_summary(self, log: Logger, level: int = logging.INFO) -> None:
+        from rich.console import Console
+
+        if not self.summarize():
+            return
+
+        output = io.StringIO()
+        Console(file=output, width=160, force_terminal=False, color_system=None).print(self.summary_table())
+        log.log(level, output.getvalue().rstrip(), extra={"simple": True})
+
+
+#: Process-wide profiler.
+PROFILER = Profiler()
@@ -0,0 +1,99 @@
+# SPDX-License-Identifier: GPLv3-or-later
+# Copyright © 2025 pygaindalf Rui Pinheiro
+
+import threading
+import time
+import tracemalloc
+
+from collections import Counter
+from typing import Any, override
+
+
+# MARK: Span
+class ProfilingSpan:
+    """Wall time, CPU time, allocation delta and event counters recorded for a single profiled call.
+
+    CPU time is measured for the calling thread. Allocation deltas are only recorded while :mod:`tracemalloc` is tracing, and are the net
+    change in traced memory between the start and the end of the span. Counters are inclusive, i.e. a span's counters include those of its
+    children. Children may finish in other threads than their parent, so counters are only updated under the span's lock.
+    """
+
+    __slots__ = (
+        "_cpu_start_ns",
+        "_lock",
+        "_memory_start",
+        "allocated",
+        "category",
+        "counters",
+        "cpu_ns",
+        "depth",
+        "name",
+        "parent",
+        "start_ns",
+        "thread_id",
+        "wall_ns",
+    )
+
+    def __init__(self, name: str, category: str, parent: ProfilingSpan | None = None) -> None:
+        self.name = name
+        self.category = category
+        self.parent = parent
+        self.depth: int = 0 if parent is None else parent.depth + 1
+        self.thread_id = threading.get_ident()
+
+        self.counters: Counter[str] = Counter()
+        self._lock = threading.Lock()
+
+        self.start_ns = 0
+        self.wall_ns = 0
+        self.cpu_ns = 0
+        self.allocated: int | None = None
+
+        self._cpu_start_ns = 0
+        self._memory_start: int | None = None
+
+    def start(self) -> None:
+        self._memory_start = tracemalloc.get_traced_memory()[0] if tracemalloc.is_tracing() else None
+        self._cpu_start_ns = time.thread_time_ns()
+        self.start_ns = time.perf_counter_ns()
+
+    def stop(self) -> None:
+        self.wall_ns = time.perf_counter_ns() - self.start_ns
+        self.cpu_ns = time.thread_time_ns() - self._cpu_start_ns
+        if self._memory_start is not None and tracemalloc.is_tracing():
+            self.allocated = tracemalloc.get_traced_memory()[0] - self._memory_start
+
+        if self.parent is not None:
+            with self._lock:
+                counters = Counter(self.counters)
+            self.parent.merge(counters)
+
+    def count(self, counter: str, n: int = 1) -> None:
+        with self._lock:
+            self.counters[counter] += n
+
+    def merge(self, counters: Counter[str]) -> None:
+        with self._lock:
+            self.counters.update(counters)
+
+    # MARK: Export
+    def as_trace_event(self, *, origin_ns: int, pid: int) -> dict[str, Any]:
+        """Return this span as a Chrome trace-event "complete" event, as understood by Perfetto and speedscope."""
+        args: dict[str, Any] = {"cpu_ms": self.cpu_ns / 1e6, **self.counters}
+        if self.allocated is not None:
+            args["allocated_bytes"] = self.allocated
+
+        return {
+            "name": self.name,
+            "cat": self.category,
+            "ph": "X",
+            "ts": (self.start_ns - origin_ns) / 1e3,
+            "dur": self.wall_ns / 1e3,
+            "pid": pid,
+            "tid": self.thread_id,
+            "args": args,
+        }
+
+    @override
+    def __repr__(self) -> str:
+        return f"<{type(self).__name__} {self.name!r} ({self.category}) {self.wall_ns / 1e6:.3f}ms>"
@@ -2,8 +2,11 @@
 # Copyright © 2025 pygaindalf Rui Pinheiro
 
 from .manager import RequestsManager
+from .stats import RequestsCacheStats, RequestsCacheStatsSnapshot
 
 
 __all__ = [
+    "RequestsCacheStats",
+    "RequestsCacheStatsSnapshot",
     "RequestsManager",
 ]
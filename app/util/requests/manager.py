@@ -13,15 +13,19 @@ from .config.cache import RequestsCacheBackend
 from .config.requests import RequestsConfig
 from .filecache import CustomFileCache
 from .session import CustomSession
+from .stats import RequestsCacheStats
 
 
 class RequestsManager:
     _instance = None
 
+    cache_stats: RequestsCacheStats
+
     def __new__(cls, *args, **kwargs) -> Self:
         if not cls._instance:
             cls._instance = super().__new__(cls, *args, **kwargs)
             cls._instance.initialized = False
+            cls._instance.cache_stats = RequestsCacheStats()
         return cls._instance
 
     def __init__(self) -> None:
@@ -69,6 +73,13 @@ class RequestsManager:
     def session(self) -> Any:
         return CustomSession(**self._get_config_kwargs())
 
+    def compact(self) -> None:
+        """Drop expired and unreadable responses from the active cache backend."""
+        cache = requests_cache.get_cache()
+        if cache is None:
+            cache = self.session().cache
+        cache.delete(expired=True, invalid=True)
+
     # MARK: Cache methods
     def human_readable_key_fn(
         self,
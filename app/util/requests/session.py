@@ -36,4 +36,6 @@ class CustomSession(CacheMixin, LimiterMixin, Session):  # pyright: ignore [repo
     @override
     def request(self, *args, **kwargs) -> OriginalResponse | CachedResponse:
         kwargs.setdefault("timeout", self._requests_config.timeout)
-        return super().request(*args, **kwargs)
+        response = super().request(*args, **kwargs)
+        self._requests_manager.cache_stats.record(response)
+        return response
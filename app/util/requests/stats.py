@@ -0,0 +1,85 @@
+# SPDX-License-Identifier: GPLv3-or-later
+# Copyright © 2025 pygaindalf Rui Pinheiro
+
+import threading
+import urllib.parse
+
+from collections import Counter
+from collections.abc import Mapping
+from typing import Any, NamedTuple, override
+
+
+# MARK: Snapshot
+class RequestsCacheStatsSnapshot(NamedTuple):
+    hits: Mapping[str, int]
+    misses: Mapping[str, int]
+
+    @property
+    def total_hits(self) -> int:
+        return sum(self.hits.values())
+
+    @property
+    def total_misses(self) -> int:
+        return sum(self.misses.values())
+
+    @property
+    def total(self) -> int:
+        return self.total_hits + self.total_misses
+
+    @property
+    def hit_ratio(self) -> float:
+        return self.total_hits / total if (total := self.total) else 0.0
+
+    @property
+    def hosts(self) -> frozenset[str]:
+        return frozenset(self.hits) | frozenset(self.misses)
+
+    def host_hit_ratio(self, host: str) -> float:
+        hits = self.hits.get(host, 0)
+        total = hits + self.misses.get(host, 0)
+        return hits / total if total else 0.0
+
+    def __sub__(self, other: RequestsCacheStatsSnapshot) -> RequestsCacheStatsSnapshot:
+        return RequestsCacheStatsSnapshot(
+            hits={host: count for host in self.hits if (count := self.hits[host] - other.hits.get(host, 0))},
+            misses={host: count for host in self.misses if (count := self.misses[host] - other.misses.get(host, 0))},
+        )
+
+    @override
+    def __str__(self) -> str:
+        return f"{self.total_hits}/{self.total} cache hits ({self.hit_ratio:.1%})"
+
+
+# MARK: Statistics
+class RequestsCacheStats:
+    """Thread-safe per-host cache hit/miss counters, fed by :class:`CustomSession` for every response it returns."""
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._hits: Counter[str] = Counter()
+        self._misses: Counter[str] = Counter()
+
+    def record(self, response: Any) -> None:
+        host = urllib.parse.urlparse(getattr(response, "url", None) or "").netloc
+        with self._lock:
+            if getattr(response, "from_cache", False):
+                self._hits[host] += 1
+            else:
+                self._misses[host] += 1
+
+    def reset(self) -> None:
+        with self._lock:
+            self._hits.clear()
+            self._misses.clear()
+
+    def snapshot(self) -> RequestsCacheStatsSnapshot:
+        with self._lock:
+            return RequestsCacheStatsSnapshot(hits=dict(self._hits), misses=dict(self._misses))
+
+    @property
+    def hit_ratio(self) -> float:
+        return self.snapshot().hit_ratio
+
+    @override
+    def __str__(self) -> str:
+        return str(self.snapshot())
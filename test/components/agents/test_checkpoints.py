@@ -0,0 +1,164 @@
+# SPDX-License-Identifier: GPLv3-or-later
+# Copyright © 2025 pygaindalf Rui Pinheiro
+
+from __future__ import annotations
+
+import datetime
+import timeit
+
+from typing import TYPE_CHECKING, Any
+
+import pytest
+
+from pydantic import ValidationError
+
+from app.components.agents.orchestrators import ConfigOrchestratorConfig
+from app.components.agents.orchestrators.checkpoint import get_stage_keys
+
+from ..fixture import RuntimeFixture
+from .lib.portfolio_validation import validate_portfolio
+
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+    from pathlib import Path
+
+
+LEDGERS: list[dict[str, Any]] = [
+    {
+        "instrument": {"ticker": "APPL", "type": "equity", "currency": "USD"},
+        "transactions": [
+            {"type": "buy", "date": "2023-01-01", "quantity": 100, "consideration": 2000},
+            {"type": "sell", "date": "2023-01-02", "quantity": 40, "consideration": 900, "fees": 5},
+        ],
+    },
+    {
+        "instrument": {"ticker": "MSFT", "type": "equity", "currency": "USD"},
+        "transactions": [
+            {"type": "buy", "date": "2023-02-10", "quantity": 50, "consideration": 5000},
+        ],
+    },
+]
+
+
+def _pipeline(tmp_path: Path, ledgers: list[dict[str, Any]], export: str = "portfolio.yaml") -> dict[str, Any]:
+    return {
+        "agents": [
+            {
+                "package": "orchestrators.config",
+                "title": "pipeline",
+                "checkpoints": {"directory": str(tmp_path / "checkpoints")},
+                "components": [
+                    {"package": "importers.config", "title": "import-ledgers", "ledgers": ledgers},
+                    {"package": "exporters.yaml", "title": "export-portfolio-yaml", "filepath": str(tmp_path / export)},
+                ],
+            }
+        ]
+    }
+
+
+@pytest.mark.components
+@pytest.mark.agents
+@pytest.mark.runtime
+@pytest.mark.orchestrators
+class TestCheckpoints:
+    def test_stage_keys_only_change_on_writers(self, runtime: RuntimeFixture, tmp_path: Path):
+        config = runtime.create(_pipeline(tmp_path, LEDGERS)).config.agents[0]
+        assert isinstance(config, ConfigOrchestratorConfig)
+        keys = get_stage_keys(config.components)
+        assert keys[0] == keys[1]
+
+        other = runtime.create(_pipeline(tmp_path, LEDGERS[:1], export="other.yaml")).config.agents[0]
+        assert isinstance(other, ConfigOrchestratorConfig)
+        assert get_stage_keys(other.components)[0] != keys[0]
+
+    def test_checkpoints_require_sequential_runs(self, runtime: RuntimeFixture, tmp_path: Path):
+        data = _pipeline(tmp_path, LEDGERS)
+        data["agents"][0]["max_workers"] = 2
+        with pytest.raises(ValidationError, match="max_workers"):
+            runtime.create(data)
+
+    def test_restart_restores_checkpoint(self, runtime: RuntimeFixture, tmp_path: Path, caplog: pytest.LogCaptureFixture):
+        first = runtime.create(_pipeline(tmp_path, LEDGERS))
+        with caplog.at_level("INFO"):
+            first.run()
+        assert not any("Restoring checkpoint" in record.getMessage() for record in caplog.records)
+        assert len(list((tmp_path / "checkpoints").glob("*.json"))) == 1
+
+        caplog.clear()
+        second = runtime.create(_pipeline(tmp_path, LEDGERS, export="restored.yaml"))
+        with caplog.at_level("INFO"):
+            second.run()
+
+        messages = [record.getMessage() for record in caplog.records]
+        assert any("Restoring checkpoint" in message for message in messages)
+        assert not any("import-ledgers" in message for message in messages if message.startswith("Running"))
+        assert (tmp_path / "restored.yaml").read_text() == (tmp_path / "portfolio.yaml").read_text()
+
+        validate_portfolio(second, LEDGERS)
+
+    def test_changed_inputs_invalidate_checkpoint(self, runtime: RuntimeFixture, tmp_path: Path, caplog: pytest.LogCaptureFixture):
+        runtime.create(_pipeline(tmp_path, LEDGERS)).run()
+
+        changed = runtime.create(_pipeline(tmp_path, LEDGERS[:1], export="changed.yaml"))
+        with caplog.at_level("INFO"):
+            changed.run()
+
+        assert not any("Restoring checkpoint" in record.getMessage() for record in caplog.records)
+        assert len(list((tmp_path / "checkpoints").glob("*.json"))) == 2
+        validate_portfolio(changed, LEDGERS[:1])
+
+    def test_glob_inputs_invalidate_checkpoint(self, runtime: RuntimeFixture, tmp_path: Path):
+        statements = tmp_path / "statements"
+        statements.mkdir()
+        (statements / "2023.csv").write_text("Action,Time\n", encoding="utf-8")
+
+        def _keys() -> tuple[str, ...]:
+            config = runtime.create(
+                {
+                    "agents": [
+                        {
+                            "package": "orchestrators.config",
+                            "title": "pipeline",
+                            "checkpoints": {"directory": str(tmp_path / "checkpoints")},
+                            "components": [{"package": "importers.trading212", "title": "import-trading212", "glob": str(statements / "*.csv")}],
+                        }
+                    ]
+                }
+            ).config.agents[0]
+            assert isinstance(config, ConfigOrchestratorConfig)
+            return tuple(get_stage_keys(config.components))
+
+        original = _keys()
+        assert _keys() == original
+
+        # A new file matching the glob changes the key, even though the configuration is unchanged
+        (statements / "2024.csv").write_text("Action,Time\n", encoding="utf-8")
+        added = _keys()
+        assert added != original
+
+        # As does modifying one of the matched files
+        (statements / "2024.csv").write_text("Action,Time\nMarket buy,2024-01-02 10:00:00\n", encoding="utf-8")
+        assert _keys() != added
+
+    @pytest.mark.benchmark
+    def test_restart_latency(self, runtime: RuntimeFixture, tmp_path: Path, record_property: Callable[[str, object], None]):
+        start = datetime.date(2020, 1, 1)
+        ledgers = [
+            {
+                "instrument": {"ticker": f"T{i:03d}", "type": "equity", "currency": "USD"},
+                "transactions": [
+                    {"type": "buy", "date": (start + datetime.timedelta(days=day)).isoformat(), "quantity": 10, "consideration": 100 + day}
+                    for day in range(200)
+                ],
+            }
+            for i in range(20)
+        ]
+
+        # The first run imports the ledgers and writes a checkpoint, which the second run restores instead of importing them again
+        full = timeit.timeit(lambda: runtime.create(_pipeline(tmp_path, ledgers)).run(), number=1)
+        resumed = timeit.timeit(lambda: runtime.create(_pipeline(tmp_path, ledgers, export="resumed.yaml")).run(), number=1)
+        assert (tmp_path / "resumed.yaml").read_text() == (tmp_path / "portfolio.yaml").read_text()
+
+        record_property("full_run_s", full)
+        record_property("resumed_run_s", resumed)
@@ -0,0 +1,87 @@
+# SPDX-License-Identifier: GPLv3-or-later
+# Copyright © 2025 pygaindalf Rui Pinheiro
+
+import datetime
+
+from decimal import Decimal
+from typing import TYPE_CHECKING, Any
+
+import pytest
+
+from ..fixture import RuntimeFixture
+
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+
+pa = pytest.importorskip("pyarrow")
+pq = pytest.importorskip("pyarrow.parquet")
+
+
+def _read(path: Path) -> Any:
+    if path.suffix == ".parquet":
+        return pq.read_table(path)
+    with pa.ipc.open_file(path) as reader:
+        return reader.read_all()
+
+
+@pytest.mark.components
+@pytest.mark.agents
+@pytest.mark.runtime
+@pytest.mark.exporters
+class TestColumnarExporter:
+    @pytest.mark.parametrize("file_format", ["parquet", "arrow"])
+    def test_export(self, runtime: RuntimeFixture, tmp_path: Path, file_format: str):
+        runtime_instance = runtime.create(
+            {
+                "agents": [
+                    {
+                        "package": "importers.config",
+                        "title": "import-ledgers",
+                        "ledgers": [
+                            {
+                                "instrument": {"ticker": "ACME", "type": "equity", "currency": "GBP"},
+                                "transactions": [
+                                    {"type": "buy", "date": "2023-01-10", "quantity": 1000, "consideration": 4000, "fees": 5},
+                                    {"type": "sell", "date": "2023-09-01", "quantity": 500, "consideration": "1500.25"},
+                                ],
+                            },
+                            {
+                                "instrument": {"ticker": "INIT", "type": "equity", "currency": "GBP"},
+                                "transactions": [
+                                    {"type": "buy", "date": "2023-02-01", "quantity": 10, "consideration": 100},
+                                ],
+                            },
+                        ],
+                    },
+                    {"package": "transformers.s104.full", "title": "s104"},
+                    {"package": "exporters.columnar", "title": "export", "directory": str(tmp_path), "file_format": file_format, "decimal_scale": 4},
+                ]
+            }
+        )
+        runtime_instance.run()
+
+        instruments = _read(tmp_path / f"instruments.{file_format}")
+        assert sorted(instruments.column("ticker").to_pylist()) == ["ACME", "INIT"]
+        assert pa.types.is_dictionary(instruments.schema.field("currency").type)
+
+        ledgers = _read(tmp_path / f"ledgers.{file_format}")
+        assert sorted(ledgers.column("transactions").to_pylist()) == [1, 2]
+
+        transactions = _read(tmp_path / f"transactions.{file_format}")
+        assert transactions.num_rows == sum(ledgers.column("transactions").to_pylist())
+        assert pa.types.is_dictionary(transactions.schema.field("type").type)
+        assert transactions.schema.field("consideration").type == pa.decimal128(38, 4)
+
+        rows = {(row["type"], row["date"]): row for row in transactions.to_pylist()}
+        sell = rows[("sell", datetime.date(2023, 9, 1))]
+        assert sell["consideration"] == Decimal("1500.2500")
+        assert sell["currency"] == "GBP"
+        assert sell["s104_quantity"] == Decimal(500)
+
+        pools = _read(tmp_path / f"s104_pools.{file_format}")
+        assert pools.num_rows == 1
+        assert pools.column("disposal_uid").to_pylist() == [sell["transaction_uid"]]
+        assert pools.column("total_proceeds").to_pylist() == [Decimal("1500.2500")]
+        assert pools.column("total_cost").to_pylist() == [Decimal("2002.5000")]
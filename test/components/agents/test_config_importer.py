@@ -5,6 +5,9 @@ from typing import Any
 
 import pytest
 
+from app.components.agents.importers.importer.schema import resolve_annotation_class
+from app.portfolio.models.annotation.forex.forex_annotation import ForexAnnotation
+
 from ..fixture import RuntimeFixture
 from .lib.portfolio_validation import validate_portfolio
 
@@ -134,3 +137,14 @@ class TestConfigImporter:
         ]
 
         self._run_import_and_validate(runtime, ledgers_data)
+
+    def test_resolve_annotation_class_is_cached(self) -> None:
+        resolve_annotation_class.cache_clear()
+        assert resolve_annotation_class("portfolio.models.annotation.forex.forex_annotation.ForexAnnotation") is ForexAnnotation
+        assert resolve_annotation_class("portfolio.models.annotation.forex.forex_annotation.ForexAnnotation") is ForexAnnotation
+        assert resolve_annotation_class.cache_info().hits == 1
+
+        with pytest.raises(KeyError, match="not found"):
+            resolve_annotation_class("portfolio.models.annotation.forex.forex_annotation.MissingAnnotation")
+        with pytest.raises(TypeError, match="not a subclass of Annotation"):
+            resolve_annotation_class("portfolio.models.transaction.Transaction")
@@ -0,0 +1,114 @@
+# SPDX-License-Identifier: GPLv3-or-later
+# Copyright © 2025 pygaindalf Rui Pinheiro
+
+import pytest
+
+from app.components.agents import AgentAccess, PortfolioAccess
+from app.components.agents.orchestrators import ConfigOrchestratorConfig
+from app.components.agents.orchestrators.config import get_agent_dependencies
+
+from ..fixture import RuntimeFixture
+
+
+@pytest.mark.components
+@pytest.mark.agents
+@pytest.mark.orchestrators
+class TestAgentAccess:
+    def test_readers_do_not_conflict(self):
+        reader = AgentAccess(portfolio=PortfolioAccess.READ)
+        assert not reader.conflicts_with(reader)
+        assert not reader.conflicts_with(AgentAccess(portfolio=PortfolioAccess.NONE))
+
+    def test_writers_conflict_with_portfolio_access(self):
+        writer = AgentAccess()
+        assert writer.portfolio is PortfolioAccess.WRITE
+        assert writer.conflicts_with(writer)
+        assert writer.conflicts_with(AgentAccess(portfolio=PortfolioAccess.READ))
+        assert AgentAccess(portfolio=PortfolioAccess.READ).conflicts_with(writer)
+        assert not writer.conflicts_with(AgentAccess(portfolio=PortfolioAccess.NONE))
+
+    def test_shared_providers_conflict(self):
+        a = AgentAccess(portfolio=PortfolioAccess.NONE, providers=frozenset({"forex"}))
+        b = AgentAccess(portfolio=PortfolioAccess.NONE, providers=frozenset({"forex", "other"}))
+        c = AgentAccess(portfolio=PortfolioAccess.NONE, providers=frozenset({"other"}))
+        assert a.conflicts_with(b)
+        assert not a.conflicts_with(c)
+
+
+@pytest.mark.components
+@pytest.mark.agents
+@pytest.mark.runtime
+@pytest.mark.orchestrators
+class TestConfigOrchestratorConcurrency:
+    def test_dependencies_follow_declared_accesses(self, runtime: RuntimeFixture, tmp_path):
+        runtime_instance = runtime.create(
+            {
+                "agents": [
+                    {
+                        "package": "orchestrators.config",
+                        "title": "parallel",
+                        "max_workers": 4,
+                        "components": [
+                            {"package": "hello_world", "title": "hello"},
+                            {"package": "exporters.yaml", "title": "export-1", "filepath": str(tmp_path / "1.yaml")},
+                            {"package": "exporters.yaml", "title": "export-2", "filepath": str(tmp_path / "2.yaml")},
+                            {"package": "transformers.propagate_stock_splits", "title": "splits"},
+                            {"package": "exporters.yaml", "title": "export-3", "filepath": str(tmp_path / "3.yaml")},
+                        ],
+                    }
+                ],
+            }
+        )
+
+        orchestrator_config = runtime_instance.config.agents[0]
+        assert isinstance(orchestrator_config, ConfigOrchestratorConfig)
+
+        dependencies = get_agent_dependencies(orchestrator_config.components)
+        assert dependencies == (frozenset(), frozenset(), frozenset(), frozenset({1, 2}), frozenset({3}))
+
+        runtime_instance.run()
+
+        for name in ("1.yaml", "2.yaml", "3.yaml"):
+            assert (tmp_path / name).exists()
+
+    def test_forex_exporters_do_not_run_concurrently(self, runtime: RuntimeFixture, tmp_path):
+        runtime_instance = runtime.create(
+            {
+                "agents": [
+                    {
+                        "package": "orchestrators.config",
+                        "title": "parallel",
+                        "max_workers": 4,
+                        "components": [
+                            {"package": "exporters.yaml", "title": "export", "filepath": str(tmp_path / "export.yaml")},
+                            {"package": "exporters.s104_report", "title": "report-1", "filepath": str(tmp_path / "1.txt")},
+                            {"package": "exporters.s104_report", "title": "report-2", "filepath": str(tmp_path / "2.txt")},
+                        ],
+                    }
+                ],
+            }
+        )
+
+        orchestrator_config = runtime_instance.config.agents[0]
+        assert isinstance(orchestrator_config, ConfigOrchestratorConfig)
+
+        # Both reports may fetch exchange rates through the forex provider, so they run one after the other
+        dependencies = get_agent_dependencies(orchestrator_config.components)
+        assert dependencies == (frozenset(), frozenset(), frozenset({1}))
+
+    def test_independent_agents_run_concurrently(self, runtime: RuntimeFixture, caplog: pytest.LogCaptureFixture):
+        messages = [f"Concurrent agent {i}" for i in range(4)]
+
+        runtime_instance = runtime.create(
+            {
+                "max_workers": 2,
+                "agents": [{"package": "hello_world", "title": f"hello-{i}", "message": message} for i, message in enumerate(messages)],
+            }
+        )
+
+        with caplog.at_level("INFO"):
+            runtime_instance.run()
+
+        observed = [record.getMessage() for record in caplog.records if record.levelname == "INFO"]
+        for message in messages:
+            assert message in observed
@@ -0,0 +1,183 @@
+# SPDX-License-Identifier: GPLv3-or-later
+# Copyright © 2025 pygaindalf Rui Pinheiro
+
+import datetime
+import json
+import threading
+import time
+import urllib.parse
+
+from collections.abc import Generator
+from decimal import Decimal
+from http import HTTPStatus
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, override
+
+import pytest
+import requests_cache
+
+from app.util.helpers.currency import Currency
+from app.util.requests import RequestsManager
+from app.util.requests.config.rate import RequestRateConfig
+from app.util.requests.session import CustomSession
+
+from ..fixture import RuntimeFixture
+
+
+# MARK: Local OANDA stand-in
+class OandaStandIn:
+    def __init__(self) -> None:
+        self.queries: list[dict[str, list[str]]] = []
+        self.delay = 0.0
+        self.in_flight = 0
+        self.max_in_flight = 0
+        self.lock = threading.Lock()
+
+        standin = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_GET(self) -> None:
+                query = urllib.parse.parse_qs(urllib.parse.urlparse(self.path).query)
+                with standin.lock:
+                    standin.queries.append(query)
+                    standin.in_flight += 1
+                    standin.max_in_flight = max(standin.max_in_flight, standin.in_flight)
+
+                time.sleep(standin.delay)
+                with standin.lock:
+                    standin.in_flight -= 1
+
+                body = json.dumps({"response": [{"average_bid": "0.5" if query["base"] == ["USD"] else "2"}]}).encode()
+                self.send_response(HTTPStatus.OK)
+                self.send_header("Content-Type", "application/json")
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            @override
+            def log_message(self, format: str, *args: Any) -> None:
+                pass
+
+        self.server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+        self.thread = threading.Thread(target=self.server.serve_forever, daemon=True)
+
+    @property
+    def url(self) -> str:
+        host, port = self.server.server_address[:2]
+        return f"http://{host!s}:{port}/cc-api/currencies"
+
+
+@pytest.fixture
+def oanda_standin() -> Generator[OandaStandIn]:
+    standin = OandaStandIn()
+    standin.thread.start()
+    yield standin
+    standin.server.shutdown()
+    standin.server.server_close()
+
+
+@pytest.fixture
+def memory_requests_cache() -> Generator[None]:
+    # Keep stand-in responses out of the checked-in test cache, and share a single generous limiter between all sessions
+    limiter = RequestRateConfig(limit=1000).limiter
+
+    class StandInSession(CustomSession):
+        def __init__(self, *args, **kwargs) -> None:
+            kwargs.setdefault("limiter", limiter)
+            super().__init__(*args, **kwargs)
+
+    requests_cache.install_cache(backend="memory", session_factory=StandInSession)
+    yield
+    RequestsManager().install()
+
+
+# MARK: Tests
+@pytest.mark.components
+@pytest.mark.agents
+@pytest.mark.runtime
+@pytest.mark.forex
+class TestForexCacheWarmupAgent:
+    def _create_runtime(self, runtime: RuntimeFixture, url: str, max_concurrency: int = 1, **warmup: Any):
+        return runtime.create(
+            {
+                "providers": {
+                    "forex": {
+                        "package": "forex.oanda",
+                        "url": url,
+                        "max_concurrency": max_concurrency,
+                    }
+                },
+                "agents": [
+                    {
+                        "package": "forex_cache_warmup",
+                        "title": "forex-cache-warmup",
+                        "currencies": ["USD", "GBP", "GBX"],
+                        "start_date": "2025-01-03",
+                        "end_date": "2025-01-06",
+                        **warmup,
+                    },
+                ],
+            }
+        )
+
+    @pytest.mark.usefixtures("memory_requests_cache")
+    def test_warmup_populates_http_cache(self, runtime: RuntimeFixture, oanda_standin: OandaStandIn) -> None:
+        stats = RequestsManager().cache_stats
+
+        # First run: every rate is a cache miss (GBX is served from GBP rates, so only USD<->GBP is fetched)
+        before = stats.snapshot()
+        self._create_runtime(runtime, oanda_standin.url).run()
+        first = stats.snapshot() - before
+
+        assert len(oanda_standin.queries) == 2 * 4
+        assert first.total_misses == 2 * 4
+        assert first.total_hits == 0
+        assert first.hit_ratio == 0.0
+
+        # Second run with a fresh provider: everything is served from the HTTP cache
+        before = stats.snapshot()
+        runtime_instance = self._create_runtime(runtime, oanda_standin.url)
+        runtime_instance.run()
+        second = stats.snapshot() - before
+
+        assert len(oanda_standin.queries) == 2 * 4
+        assert second.total_hits == 2 * 4
+        assert second.total_misses == 0
+        assert second.hit_ratio == 1.0
+
+        with runtime_instance.context as context:
+            rates = context.get_forex_provider().prefetch_daily_rates(
+                currencies=("USD", "GBX"), start_date=datetime.date(2025, 1, 3), end_date=datetime.date(2025, 1, 6)
+            )
+        assert len(oanda_standin.queries) == 2 * 4
+        assert rates[(Currency("USD"), Currency("GBP"), datetime.date(2025, 1, 6))] == Decimal("0.5")
+        assert rates[(Currency("GBP"), Currency("USD"), datetime.date(2025, 1, 6))] == Decimal(2)
+
+    @pytest.mark.usefixtures("memory_requests_cache")
+    def test_warmup_skips_weekends(self, runtime: RuntimeFixture, oanda_standin: OandaStandIn) -> None:
+        self._create_runtime(runtime, oanda_standin.url, weekdays_only=True).run()
+
+        # 2025-01-04 and 2025-01-05 are a Saturday and Sunday
+        assert sorted({query["end_date"][0] for query in oanda_standin.queries}) == ["2025-01-03", "2025-01-06"]
+
+    @pytest.mark.usefixtures("memory_requests_cache")
+    def test_warmup_fetches_cache_misses_concurrently(self, runtime: RuntimeFixture, oanda_standin: OandaStandIn) -> None:
+        oanda_standin.delay = 0.1
+        stats = RequestsManager().cache_stats
+
+        before = stats.snapshot()
+        self._create_runtime(runtime, oanda_standin.url, max_concurrency=4).run()
+        first = stats.snapshot() - before
+
+        assert len(oanda_standin.queries) == 2 * 4
+        assert 1 < oanda_standin.max_in_flight <= 4
+        assert first.total_misses == 2 * 4
+
+        # Cache semantics are unchanged: a second concurrent run is served entirely from the HTTP cache
+        before = stats.snapshot()
+        self._create_runtime(runtime, oanda_standin.url, max_concurrency=4).run()
+        second = stats.snapshot() - before
+
+        assert len(oanda_standin.queries) == 2 * 4
+        assert second.total_hits == 2 * 4
+        assert second.total_misses == 0
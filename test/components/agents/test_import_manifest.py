@@ -0,0 +1,132 @@
+# SPDX-License-Identifier: GPLv3-or-later
+# Copyright © 2025 pygaindalf Rui Pinheiro
+
+from __future__ import annotations
+
+import json
+
+from typing import TYPE_CHECKING, Any
+
+import pytest
+
+from ..fixture import RuntimeFixture
+
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable, Sequence
+    from pathlib import Path
+
+    from app.runtime import Runtime
+
+
+HEADER = "Action,Time,ISIN,Ticker,No. of shares,Price / share,Currency (Price / share)\n"
+
+
+def _write_statement(path: Path, rows: Iterable[Sequence[str]]) -> None:
+    path.write_text(HEADER + "".join(",".join(row) + "\n" for row in rows), encoding="utf-8")
+
+
+def _config(tmp_path: Path) -> dict[str, Any]:
+    return {
+        "agents": [
+            {
+                "package": "importers.trading212",
+                "title": "import-trading212",
+                "glob": str(tmp_path / "statements" / "*.csv"),
+                "create_ledger": True,
+                "manifest": str(tmp_path / "manifest.json"),
+            }
+        ]
+    }
+
+
+def _transactions(runtime_instance: Runtime) -> list[tuple[Any, ...]]:
+    return sorted(
+        (ledger.instrument.ticker, txn.type, txn.date, txn.quantity, txn.consideration)
+        for ledger in runtime_instance.context.portfolio
+        for txn in ledger.transactions
+    )
+
+
+def _restore_message(caplog: pytest.LogCaptureFixture) -> str:
+    return next(record.getMessage() for record in caplog.records if record.getMessage().startswith("Restored"))
+
+
+@pytest.mark.components
+@pytest.mark.agents
+@pytest.mark.runtime
+@pytest.mark.importers
+class TestImportManifest:
+    @pytest.fixture(autouse=True)
+    def statements(self, tmp_path: Path) -> Path:
+        directory = tmp_path / "statements"
+        directory.mkdir()
+        _write_statement(
+            directory / "2024-01.csv",
+            [
+                ("Market buy", "2024-01-02 10:00:00", "US0378331005", "AAPL", "10", "180.5", "USD"),
+                ("Market buy", "2024-01-15 10:00:00", "US5949181045", "MSFT", "5", "370", "USD"),
+            ],
+        )
+        _write_statement(
+            directory / "2024-02.csv",
+            [
+                ("Market sell", "2024-02-05 10:00:00", "US0378331005", "AAPL", "4", "188", "USD"),
+            ],
+        )
+        return directory
+
+    def test_unchanged_files_are_restored(self, runtime: RuntimeFixture, tmp_path: Path, statements: Path, caplog: pytest.LogCaptureFixture):
+        first = runtime.create(_config(tmp_path))
+        first.run()
+        expected = _transactions(first)
+        assert len(expected) == 3
+
+        manifest = json.loads((tmp_path / "manifest.json").read_text())
+        assert set(manifest["files"]) == {str(statements / "2024-01.csv"), str(statements / "2024-02.csv")}
+        ledgers = manifest["files"][str(statements / "2024-01.csv")]["ledgers"]
+        assert sorted(ledger["instrument"]["ticker"] for ledger in ledgers) == ["AAPL", "MSFT"]
+        assert sum(len(ledger["transactions"]) for ledger in ledgers) == 2
+
+        # A new monthly statement is the only file that needs parsing
+        _write_statement(statements / "2024-03.csv", [("Market buy", "2024-03-01 10:00:00", "US5949181045", "MSFT", "1", "410", "USD")])
+
+        second = runtime.create(_config(tmp_path))
+        with caplog.at_level("INFO"):
+            second.run()
+
+        assert "Restored 2 unchanged files" in _restore_message(caplog)
+        assert "processed 1 new or modified files" in _restore_message(caplog)
+
+        transactions = _transactions(second)
+        assert len(transactions) == 4
+        assert set(expected).issubset(transactions)
+
+    def test_modified_files_are_reparsed(self, runtime: RuntimeFixture, tmp_path: Path, statements: Path, caplog: pytest.LogCaptureFixture):
+        runtime.create(_config(tmp_path)).run()
+
+        _write_statement(statements / "2024-02.csv", [("Market sell", "2024-02-05 10:00:00", "US0378331005", "AAPL", "6", "188", "USD")])
+
+        second = runtime.create(_config(tmp_path))
+        with caplog.at_level("INFO"):
+            second.run()
+
+        assert "Restored 1 unchanged files" in _restore_message(caplog)
+        quantities = {(ticker, quantity) for ticker, _, date, quantity, _ in _transactions(second) if date.month == 2}
+        assert quantities == {("AAPL", 6)}
+
+    def test_stale_manifest_is_discarded(self, runtime: RuntimeFixture, tmp_path: Path, caplog: pytest.LogCaptureFixture):
+        runtime.create(_config(tmp_path)).run()
+
+        # Manifests written by a different version or importer configuration have a different key
+        manifest_path = tmp_path / "manifest.json"
+        manifest = json.loads(manifest_path.read_text())
+        manifest["key"] = "stale"
+        manifest_path.write_text(json.dumps(manifest))
+
+        second = runtime.create(_config(tmp_path))
+        with caplog.at_level("INFO"):
+            second.run()
+
+        assert "Restored 0 unchanged files" in _restore_message(caplog)
+        assert len(_transactions(second)) == 3
@@ -0,0 +1,144 @@
+# SPDX-License-Identifier: GPLv3-or-later
+# Copyright © 2025 pygaindalf Rui Pinheiro
+
+from __future__ import annotations
+
+import datetime
+
+from decimal import Decimal
+from typing import TYPE_CHECKING, Any
+
+import pytest
+
+from app.components.agents.importers.importer.csv_sections import iter_section_rows
+from app.portfolio.models.transaction import TransactionType
+
+from ..fixture import RuntimeFixture
+
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+
+STATEMENT = """\ufeffStatement,Header,Field Name,Field Value
+Statement,Data,BrokerName,Interactive Brokers
+Trades,Header,DataDiscriminator,Asset Category,Currency,Symbol,Date/Time,Quantity,T. Price,Proceeds,Comm/Fee,Code
+Trades,Data,Trade,Stocks,USD,AAPL,"2020-01-02, 10:00:00",10,300,-3000,-1,O
+Trades,Data,Trade,Stocks,USD,AAPL,"2021-03-01, 10:00:00",-8,120,960,-1,C
+Trades,SubTotal,,Stocks,USD,AAPL,,2,,-2040,-2,
+Trades,Header,DataDiscriminator,Asset Category,Currency,Symbol,Date/Time,Quantity,T. Price,Proceeds,Comm/Fee,Code
+Trades,Data,Trade,Forex,GBP,GBP.USD,"2020-01-02, 09:00:00",1000,1.3,-1300,0,
+Deposits & Withdrawals,Header,Currency,Settle Date,Description,Amount
+Deposits & Withdrawals,Data,USD,2020-01-01,Electronic Fund Transfer,5000
+Dividends,Header,Currency,Date,Description,Amount
+Dividends,Data,USD,2020-05-14,AAPL(US0378331005) Cash Dividend USD 0.82 per Share (Ordinary Dividend),8.2
+Dividends,Data,Total,,,8.2
+Corporate Actions,Header,Asset Category,Currency,Report Date,Date/Time,Description,Quantity,Proceeds,Value,Realized P/L,Code
+Corporate Actions,Data,Stocks,USD,2020-08-31,"2020-08-28, 20:25:00","AAPL(US0378331005) Split 4 for 1 (AAPL, APPLE INC, US0378331005)",30,0,0,0,
+Corporate Actions,Data,Total,,,,,,0,0,0,
+"""
+
+
+def _config(tmp_path: Path, sections: list[str]) -> dict[str, Any]:
+    return {
+        "agents": [
+            {
+                "package": "importers.interactive_brokers",
+                "title": "import-ibkr",
+                "glob": str(tmp_path / "*.csv"),
+                "create_ledger": True,
+                "sections": sections,
+            }
+        ]
+    }
+
+
+@pytest.mark.importers
+class TestCsvSections:
+    def test_rows_are_routed_by_section_header(self):
+        rows = [
+            ["Trades", "Header", "Symbol", "Quantity"],
+            ["Trades", "Data", "AAPL", "10"],
+            ["Dividends", "Header", "Currency", "Amount"],
+            ["Dividends", "Data", "USD", "8.2"],
+            ["Trades", "Header", "Symbol", "Quantity", "Code"],
+            ["Trades", "Data", "MSFT", "5", "O"],
+            ["Trades", "Total", "", "15", ""],
+        ]
+
+        routed = [(row.section, row.data) for row in iter_section_rows(rows, {"Trades"})]
+        assert routed == [
+            ("Trades", {"Symbol": "AAPL", "Quantity": "10"}),
+            ("Trades", {"Symbol": "MSFT", "Quantity": "5", "Code": "O"}),
+        ]
+
+    def test_rows_are_consumed_lazily(self):
+        def _rows():
+            yield ["Trades", "Header", "Symbol"]
+            yield ["Trades", "Data", "AAPL"]
+            msg = "The statement should not be read past the first row"
+            raise AssertionError(msg)
+
+        assert next(iter_section_rows(_rows(), {"Trades"})).data == {"Symbol": "AAPL"}
+
+    def test_mismatched_row_raises(self):
+        rows = [["Trades", "Header", "Symbol", "Quantity"], ["Trades", "Data", "AAPL"]]
+        with pytest.raises(ValueError, match="has 1 columns, expected 2"):
+            list(iter_section_rows(rows, {"Trades"}))
+
+
+@pytest.mark.components
+@pytest.mark.agents
+@pytest.mark.runtime
+@pytest.mark.importers
+class TestInteractiveBrokersImporter:
+    @pytest.fixture(autouse=True)
+    def statement(self, tmp_path: Path) -> Path:
+        path = tmp_path / "statement.csv"
+        path.write_text(STATEMENT, encoding="utf-8")
+        return path
+
+    def test_trades_only_by_default(self, runtime: RuntimeFixture, tmp_path: Path):
+        config = _config(tmp_path, ["Trades"])
+        del config["agents"][0]["sections"]
+        runtime_instance = runtime.create(config)
+        runtime_instance.run()
+
+        ledger = runtime_instance.context.get_ledger(ticker="AAPL")
+        assert ledger is not None
+        assert [txn.type for txn in ledger.transactions] == [TransactionType.BUY, TransactionType.SELL]
+        assert runtime_instance.context.get_ledger(ticker="GBP.USD") is None
+
+    def test_multiple_sections_in_one_pass(self, runtime: RuntimeFixture, tmp_path: Path):
+        runtime_instance = runtime.create(_config(tmp_path, ["Trades", "Dividends", "Corporate Actions"]))
+        runtime_instance.run()
+
+        ledger = runtime_instance.context.get_ledger(ticker="AAPL")
+        assert ledger is not None
+
+        transactions = {txn.type: txn for txn in ledger.transactions}
+        assert set(transactions) == {TransactionType.BUY, TransactionType.SELL, TransactionType.DIVIDEND, TransactionType.SPLIT}
+
+        dividend = transactions[TransactionType.DIVIDEND]
+        assert dividend.date == datetime.date(2020, 5, 14)
+        assert Decimal(dividend.consideration) == Decimal("8.2")
+
+        split = transactions[TransactionType.SPLIT]
+        assert split.date == datetime.date(2020, 8, 28)
+        assert split.quantity == Decimal(4)
+
+    def test_unsupported_corporate_actions_are_skipped(self, runtime: RuntimeFixture, tmp_path: Path, statement: Path, caplog: pytest.LogCaptureFixture):
+        merger = (
+            'Corporate Actions,Data,Stocks,USD,2020-09-30,"2020-09-29, 20:25:00","AAPL(US0378331005) Merged(Acquisition) FOR USD 1.00 PER SHARE",-30,30,0,0,\n'
+        )
+        statement.write_text(STATEMENT.replace("Corporate Actions,Data,Total", merger + "Corporate Actions,Data,Total"), encoding="utf-8")
+
+        runtime_instance = runtime.create(_config(tmp_path, ["Corporate Actions"]))
+        with caplog.at_level("WARNING"):
+            runtime_instance.run()
+
+        assert any("Skipping unsupported corporate action" in record.getMessage() and "Merged" in record.getMessage() for record in caplog.records)
+
+        ledger = runtime_instance.context.get_ledger(ticker="AAPL")
+        assert ledger is not None
+        assert [txn.type for txn in ledger.transactions] == [TransactionType.SPLIT]
@@ -0,0 +1,250 @@
+# SPDX-License-Identifier: GPLv3-or-later
+# Copyright © 2025 pygaindalf Rui Pinheiro
+
+import csv
+import datetime
+import io
+import timeit
+
+from decimal import Decimal
+from typing import TYPE_CHECKING
+
+import pytest
+
+from app.components.agents.exporters.s104_report import (
+    S104Aggregates,
+    S104ReportExporter,
+    S104ReportExporterConfig,
+    S104Summary,
+    S104TaxYear,
+    format_currency_column,
+)
+from app.portfolio.models.ledger import Ledger
+from app.util.helpers.currency import S104_CURRENCY
+from app.util.helpers.decimal_currency import DecimalCurrency
+
+from ..fixture import RuntimeFixture
+
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+    from pathlib import Path
+
+
+def _gbp(value: int | str) -> DecimalCurrency:
+    return DecimalCurrency(Decimal(value), currency="GBP")
+
+
+def _reference_rows(ledger: Ledger, precision: int, start_date: str) -> str:
+    """Render the rows of a ledger section one row at a time through ``csv.DictWriter``, as the report used to."""
+    f = io.StringIO()
+    w = csv.DictWriter(f, fieldnames=S104ReportExporter.HEADERS, extrasaction="raise", restval="")
+    w.writeheader()
+
+    txns = [txn for txn in ledger if txn.type.affects_s104_holdings and txn.date.isoformat() >= start_date]
+    holdings = txns[0].get_previous_s104_holdings()
+    w.writerow(
+        {
+            "Symbol": ledger.symbol,
+            "Type": "INITIAL",
+            "Date": start_date,
+            "S104 Holdings": holdings.quantity,
+            "S104 Cumulative Cost": round(holdings.cumulative_cost, precision),
+        }
+    )
+
+    for txn in txns:
+        row = {
+            "Symbol": ledger.symbol,
+            "ID": f"#{txn.uid.id}",
+            "Type": txn.type.name,
+            "Date": txn.date.strftime("%Y-%m-%d"),
+            "Quantity": txn.quantity,
+            "S104 Holdings": txn.get_s104_holdings().quantity,
+            "S104 Cumulative Cost": round(txn.get_s104_holdings().cumulative_cost, precision),
+        }
+        if txn.type.trade:
+            row["Fees"] = round(txn.get_fees(currency=S104_CURRENCY), precision)
+        if txn.type.acquisition:
+            row["FMV"] = round(txn.get_consideration(currency=S104_CURRENCY), precision)
+        if txn.type.disposal:
+            row["S104 Total Cost"] = round(txn.get_s104_total_cost(), precision)
+            row["Disposal Proceeds"] = round(txn.get_s104_total_proceeds(), precision)
+            row["Gain"] = round(txn.get_s104_capital_gain(), precision)
+        w.writerow(row)
+
+        ann = txn.s104_pool_annotation_or_none
+        for pool in ann.pools if ann is not None else ():
+            other = pool.acquisition if txn is pool.disposal else pool.disposal
+            w.writerow(
+                {
+                    "Symbol": ledger.symbol,
+                    "Match ID": f"#{other.uid.id}",
+                    "Match Date": other.date.strftime("%Y-%m-%d"),
+                    "Match Quantity": pool.get_quantity(txn),
+                    "Match Cost": round(pool.total_cost, precision),
+                    "Match Proceeds": round(pool.total_proceeds, precision),
+                }
+            )
+
+    return f.getvalue()
+
+
+@pytest.mark.components
+@pytest.mark.agents
+@pytest.mark.exporters
+class TestS104TaxYearAggregates:
+    def test_aggregates_add_and_merge(self):
+        a = S104Aggregates()
+        a.add_disposal(_gbp(600), _gbp(400), 2)
+        a.add_disposal(_gbp(200), _gbp(300), 2)
+
+        b = S104Aggregates()
+        b.add_disposal(_gbp("150.004"), _gbp(100), 2)
+
+        a.merge(b)
+        assert a.disposals == 3
+        assert a.proceeds == _gbp(950)
+        assert a.allowable_cost == _gbp(800)
+        assert a.gains == _gbp(250)
+        assert a.losses == _gbp(100)
+        assert a.result == _gbp(150)
+
+    def test_format_currency_column_matches_str_round(self):
+        values = [_gbp("1.005"), _gbp("-2.5"), _gbp("1E+3"), _gbp("0.004"), DecimalCurrency(0), _gbp("123456789.987654")]
+        assert format_currency_column(values, 2) == [str(round(value, 2)) for value in values]
+        assert format_currency_column(values, 0) == [str(round(value, 0)) for value in values]
+
+    def test_rate_change_only_applies_to_2024(self):
+        assert S104TaxYear(start_year=2024).has_rate_change
+        assert not S104TaxYear(start_year=2023).has_rate_change
+        assert not S104TaxYear(start_year=2025).has_rate_change
+
+
+@pytest.mark.components
+@pytest.mark.agents
+@pytest.mark.runtime
+@pytest.mark.exporters
+class TestS104ReportExporter:
+    def test_summary_per_tax_year(self, runtime: RuntimeFixture, tmp_path: Path):
+        filepath = tmp_path / "s104.csv"
+        transactions = [
+            {"type": "buy", "date": "2024-05-01", "quantity": 100, "consideration": 1000},
+            {"type": "sell", "date": "2024-08-01", "quantity": 40, "consideration": 600},
+            {"type": "sell", "date": "2024-12-01", "quantity": 30, "consideration": 200},
+            {"type": "sell", "date": "2025-05-01", "quantity": 10, "consideration": 150},
+        ]
+
+        runtime_instance = runtime.create(
+            {
+                "agents": [
+                    {
+                        "package": "importers.config",
+                        "title": "import-ledgers",
+                        "ledgers": [{"instrument": {"ticker": "ACME", "type": "equity", "currency": "GBP"}, "transactions": transactions}],
+                    },
+                    {"package": "transformers.s104.full", "title": "s104"},
+                    {"package": "exporters.s104_report", "title": "report", "filepath": str(filepath)},
+                ]
+            }
+        )
+        runtime_instance.run()
+
+        summary = filepath.read_text(encoding="utf-8").split("========================================\n", maxsplit=1)[1]
+        tax_years = {section.splitlines()[0]: section for section in summary.split("----------------------------------------\n")[1:]}
+
+        ty2024 = tax_years["Tax Year 2024-25 (2024-04-06 : 2025-04-05)"]
+        assert "    Disposals: 2\n" in ty2024
+        assert "  Disposal Proceeds: 800.00 GBP\n" in ty2024
+        assert "  Allowable Costs: 700.00 GBP\n" in ty2024
+        assert "    Gains: 200.00 GBP\n" in ty2024
+        assert "    Losses: 100.00 GBP\n" in ty2024
+        assert "    Gains until 29/10/2024: 200.00 GBP\n" in ty2024
+        assert "    Losses from 30/10/2024: 100.00 GBP\n" in ty2024
+
+        ty2025 = tax_years["Tax Year 2025-26 (2025-04-06 : 2026-04-05)"]
+        assert "    Disposals: 1\n" in ty2025
+        assert "    Gains: 50.00 GBP\n" in ty2025
+        assert "Gains Split" not in ty2025
+
+    def test_rows_match_reference_rendering(self, runtime: RuntimeFixture, tmp_path: Path):
+        filepath = tmp_path / "s104.csv"
+        transactions = [
+            {"type": "buy", "date": "2023-01-10", "quantity": 1000, "consideration": 4000, "fees": 5},
+            {"type": "sell", "date": "2023-05-25", "quantity": 400, "consideration": "2000.555", "fees": "7.5"},
+            {"type": "split", "date": "2023-06-01", "quantity": 2, "consideration": 0},
+            {"type": "buy", "date": "2023-06-04", "quantity": 1000, "consideration": 3000, "fees": 3},
+            {"type": "sell", "date": "2023-09-01", "quantity": 333, "consideration": 1000},
+        ]
+
+        runtime_instance = runtime.create(
+            {
+                "agents": [
+                    {
+                        "package": "importers.config",
+                        "title": "import-ledgers",
+                        "ledgers": [{"instrument": {"ticker": "ACME", "type": "equity", "currency": "GBP"}, "transactions": transactions}],
+                    },
+                    {"package": "transformers.s104.full", "title": "s104"},
+                    {"package": "exporters.s104_report", "title": "report", "filepath": str(filepath), "start_date": "2023-02-01"},
+                ]
+            }
+        )
+        runtime_instance.run()
+
+        ledger = runtime_instance.context.portfolio.get_ledger(ticker="ACME")
+        assert ledger is not None
+
+        # Compare bytes, as csv rows end in '\r\n' which a text-mode read would translate
+        expected = _reference_rows(ledger, 2, "2023-02-01")
+        assert expected.count("\r\n") == 8
+        assert f"\n\n{expected}\n".encode() in filepath.read_bytes()
+
+    @pytest.mark.benchmark
+    def test_columnar_export_latency(self, runtime: RuntimeFixture, tmp_path: Path, record_property: Callable[[str, object], None]):
+        # Alternate buys and sells a day apart, so that every disposal is matched under the same-day or 30-day rules
+        start = datetime.date(2020, 1, 1)
+        transactions = [
+            {
+                "type": "buy" if i % 2 == 0 else "sell",
+                "date": (start + datetime.timedelta(days=i)).isoformat(),
+                "quantity": 10 if i % 2 == 0 else 5,
+                "consideration": 100 + i,
+            }
+            for i in range(1000)
+        ]
+
+        runtime_instance = runtime.create(
+            {
+                "agents": [
+                    {
+                        "package": "importers.config",
+                        "title": "import-ledgers",
+                        "ledgers": [{"instrument": {"ticker": "ACME", "type": "equity", "currency": "GBP"}, "transactions": transactions}],
+                    },
+                    {"package": "transformers.s104.full", "title": "s104"},
+                ]
+            }
+        )
+        runtime_instance.run()
+
+        ledger = runtime_instance.context.portfolio.get_ledger(ticker="ACME")
+        assert ledger is not None
+
+        # Both renderings start after the first acquisition, so that they cover the same transactions
+        start_date = transactions[1]["date"]
+        config = S104ReportExporterConfig.model_validate(
+            {"package": "exporters.s104_report", "title": "report", "filepath": str(tmp_path / "s104.csv"), "start_date": start_date}
+        )
+        exporter = S104ReportExporter(config=config)
+        txns = exporter._get_transactions(ledger)
+
+        def _columnar() -> None:
+            columns = exporter._extract_columns(ledger, txns, S104Summary())
+            csv.writer(io.StringIO()).writerows(columns.rows)
+
+        columnar = min(timeit.repeat(_columnar, number=1, repeat=3))
+        per_row = min(timeit.repeat(lambda: _reference_rows(ledger, 2, start_date), number=1, repeat=3))
+
+        record_property("columnar_export_s", columnar)
+        record_property("per_row_export_s", per_row)
@@ -0,0 +1,139 @@
+# SPDX-License-Identifier: GPLv3-or-later
+# Copyright © 2025 pygaindalf Rui Pinheiro
+
+"""S104 matching and holdings across stock splits, checked against hand-computed examples following the HMRC share identification rules.
+
+More information: https://www.gov.uk/hmrc-internal-manuals/capital-gains-manual/cg51555
+"""
+
+from decimal import Decimal
+from typing import Any
+
+import pytest
+
+from app.portfolio.models.ledger import Ledger
+from app.portfolio.models.transaction import Transaction, TransactionType
+from app.util.helpers.decimal_currency import DecimalCurrency
+
+from ..fixture import RuntimeFixture
+
+
+def _gbp(value: int) -> DecimalCurrency:
+    return DecimalCurrency(value, currency="GBP")
+
+
+@pytest.mark.components
+@pytest.mark.agents
+@pytest.mark.runtime
+class TestS104StockSplits:
+    @staticmethod
+    def _run(runtime: RuntimeFixture, transactions: list[dict[str, Any]]) -> Ledger:
+        runtime_instance = runtime.create(
+            {
+                "agents": [
+                    {
+                        "package": "importers.config",
+                        "title": "import-ledgers",
+                        "ledgers": [{"instrument": {"ticker": "ACME", "type": "equity", "currency": "GBP"}, "transactions": transactions}],
+                    },
+                    {"package": "transformers.s104.full", "title": "s104"},
+                ]
+            }
+        )
+        runtime_instance.run()
+
+        ledger = runtime_instance.context.portfolio.get_ledger(ticker="ACME")
+        assert ledger is not None
+        return ledger
+
+    @staticmethod
+    def _get(ledger: Ledger, type: TransactionType, date: str) -> Transaction:  # noqa: A002
+        matches = [txn for txn in ledger if txn.type is type and txn.date.isoformat() == date]
+        assert len(matches) == 1
+        return matches[0]
+
+    def test_split_rescales_pool_and_preserves_cost(self, runtime: RuntimeFixture):
+        # Buy 1,000 shares for £4,000, 2-for-1 split, sell 500 shares for £1,500.
+        # The pool holds 2,000 shares costing £4,000 after the split, so the allowable cost is 4,000 x 500 / 2,000 = £1,000 and the gain is £500.
+        ledger = self._run(
+            runtime,
+            [
+                {"type": "buy", "date": "2023-01-10", "quantity": 1000, "consideration": 4000},
+                {"type": "split", "date": "2023-06-01", "quantity": 2, "consideration": 0},
+                {"type": "sell", "date": "2023-09-01", "quantity": 500, "consideration": 1500},
+            ],
+        )
+
+        split = self._get(ledger, TransactionType.SPLIT, "2023-06-01")
+        assert split.get_s104_holdings().quantity == Decimal(2000)
+        assert split.get_s104_holdings().cumulative_cost == _gbp(4000)
+
+        sell = self._get(ledger, TransactionType.SELL, "2023-09-01")
+        assert sell.s104_quantity_matched == 0
+        assert sell.get_s104_total_cost() == _gbp(1000)
+        assert sell.get_s104_capital_gain() == _gbp(500)
+
+        assert ledger.s104_shares == Decimal(1500)
+        assert ledger.s104_cost_basis == _gbp(2)
+
+    def test_30_day_rule_matches_post_split_acquisition(self, runtime: RuntimeFixture):
+        # Buy 1,000 shares for £4,000, sell 400 shares for £2,000, 2-for-1 split 7 days later, buy 300 post-split shares for £900 3 days after.
+        # The 300 post-split shares are 150 of the disposed shares, matched under the 30-day rule at a cost of £900. The remaining 250 shares
+        # come from the pool at 4,000 x 250 / 1,000 = £1,000, so the allowable cost is £1,900 and the gain is 2,000 - 1,900 = £100.
+        ledger = self._run(
+            runtime,
+            [
+                {"type": "buy", "date": "2023-01-10", "quantity": 1000, "consideration": 4000},
+                {"type": "sell", "date": "2023-05-25", "quantity": 400, "consideration": 2000},
+                {"type": "split", "date": "2023-06-01", "quantity": 2, "consideration": 0},
+                {"type": "buy", "date": "2023-06-04", "quantity": 300, "consideration": 900},
+            ],
+        )
+
+        sell = self._get(ledger, TransactionType.SELL, "2023-05-25")
+        buy = self._get(ledger, TransactionType.BUY, "2023-06-04")
+
+        (pool,) = sell.s104_pool_annotation.pools
+        assert pool.acquisition is buy
+        assert pool.quantity == Decimal(150)
+        assert pool.get_quantity(buy) == Decimal(300)
+        assert pool.split_ratio == Decimal(2)
+        assert pool.total_cost == _gbp(900)
+        assert pool.total_proceeds == _gbp(750)
+
+        assert sell.s104_quantity_unmatched == Decimal(250)
+        assert buy.s104_fully_matched
+        assert sell.get_s104_total_cost() == _gbp(1900)
+        assert sell.get_s104_capital_gain() == _gbp(100)
+
+        # The pool is 750 shares costing £3,000 after the disposal, 1,500 shares after the split, and unchanged by the fully matched acquisition
+        assert sell.get_s104_holdings().quantity == Decimal(750)
+        assert sell.get_s104_holdings().cumulative_cost == _gbp(3000)
+        assert ledger.s104_shares == Decimal(1500)
+        assert ledger.s104_cost_basis == _gbp(2)
+
+    def test_30_day_rule_partially_matches_larger_post_split_acquisition(self, runtime: RuntimeFixture):
+        # Buy 1,000 shares for £4,000, sell 400 shares for £2,000, 2-for-1 split, buy 1,000 post-split shares for £3,000.
+        # All 400 disposed shares are matched with 800 of the acquired shares, costing £2,400, for a loss of £400. The pool is never reduced
+        # by the fully matched disposal, so its 1,000 shares costing £4,000 become 2,000 shares after the split, and the other 200 acquired
+        # shares, costing £600, join it, i.e. 2,200 shares costing £4,600.
+        ledger = self._run(
+            runtime,
+            [
+                {"type": "buy", "date": "2023-01-10", "quantity": 1000, "consideration": 4000},
+                {"type": "sell", "date": "2023-05-25", "quantity": 400, "consideration": 2000},
+                {"type": "split", "date": "2023-06-01", "quantity": 2, "consideration": 0},
+                {"type": "buy", "date": "2023-06-04", "quantity": 1000, "consideration": 3000},
+            ],
+        )
+
+        sell = self._get(ledger, TransactionType.SELL, "2023-05-25")
+        buy = self._get(ledger, TransactionType.BUY, "2023-06-04")
+
+        assert sell.s104_fully_matched
+        assert buy.s104_quantity_matched == Decimal(800)
+        assert buy.s104_quantity_unmatched == Decimal(200)
+        assert sell.get_s104_capital_gain() == _gbp(-400)
+
+        assert ledger.s104_shares == Decimal(2200)
+        assert ledger.s104_cost_basis == _gbp(4600) / 2200
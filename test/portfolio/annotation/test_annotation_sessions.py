@@ -5,6 +5,8 @@ from typing import TYPE_CHECKING
 
 import pytest
 
+from app.portfolio.models.annotation import Annotation
+
 from .annotation_types import HostEntity, NonChildDependencyAnnotation, SampleIncrementingAnnotation, SampleUniqueAnnotation
 
 
@@ -106,3 +108,41 @@ class TestAnnotationSessions:
         assert ann.uid in dependents
 
         assert referenced.uid not in ann.children_uids
+
+    def test_annotation_index_follows_commits_and_rollbacks(self, entity_root: EntityRoot, session_manager: SessionManager):
+        with session_manager(actor="tester", reason="create-host"):
+            host = entity_root.root = HostEntity()
+
+        with session_manager(actor="tester", reason="add-annotations"):
+            unique = SampleUniqueAnnotation.create(host, payload=1)
+            incrementing = SampleIncrementingAnnotation.create(host, payload=2)
+
+            # Edited annotations are not indexed by the journal
+            assert host.journal.annotation_index is None
+
+        record = host.record
+        index = record.annotation_index
+        assert record.annotation_index is index
+        assert index.get(SampleUniqueAnnotation) == (unique,)
+        assert index.get_uids(SampleIncrementingAnnotation) == (incrementing.uid,)
+        assert set(index.get_uids(Annotation)) == {unique.uid, incrementing.uid}
+        assert SampleUniqueAnnotation.get(host) is unique
+
+        # Unedited journals reuse the record index
+        with session_manager(actor="tester", reason="read-only"):
+            assert host.journal.annotation_index is index
+
+        # Rolled back annotations never reach the record index
+        with session_manager(actor="tester", reason="rollback") as s:
+            SampleIncrementingAnnotation.create(host, payload=3)
+            s.abort()
+        assert host.record is record
+        assert host.get_annotations(SampleIncrementingAnnotation) == (incrementing,)
+
+        # Committed deletions produce a new record with a new index
+        with session_manager(actor="tester", reason="remove-annotation"):
+            unique.delete()
+        assert host.record is not record
+        assert host.record.annotation_index is not index
+        assert SampleUniqueAnnotation.get(host) is None
+        assert host.get_annotations(SampleIncrementingAnnotation) == (incrementing,)
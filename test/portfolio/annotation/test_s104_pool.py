@@ -0,0 +1,106 @@
+# SPDX-License-Identifier: GPLv3-or-later
+# Copyright © 2025 pygaindalf Rui Pinheiro
+
+import datetime
+
+from decimal import Decimal
+from typing import TYPE_CHECKING
+
+import pytest
+
+from app.portfolio.models.annotation.s104.s104_pool_annotation import S104Pool
+from app.portfolio.models.instrument import Instrument
+from app.portfolio.models.instrument.instrument_type import InstrumentType
+from app.portfolio.models.ledger import Ledger
+from app.portfolio.models.transaction import Transaction, TransactionType
+from app.util.helpers.currency import Currency
+from app.util.helpers.decimal_currency import DecimalCurrency
+
+
+if TYPE_CHECKING:
+    from app.portfolio.journal.session_manager import SessionManager
+    from app.portfolio.models.root import EntityRoot
+
+
+@pytest.mark.portfolio
+@pytest.mark.annotation
+class TestS104Pool:
+    def test_pool_aggregates_are_computed_once(self):
+        acquisition = Transaction(
+            type=TransactionType.BUY,
+            date=datetime.date(2025, 1, 2),
+            quantity=Decimal(10),
+            consideration=DecimalCurrency(1000, currency="GBP"),
+            fees=DecimalCurrency(10, currency="GBP"),
+        )
+        disposal = Transaction(
+            type=TransactionType.SELL,
+            date=datetime.date(2025, 1, 3),
+            quantity=Decimal(4),
+            consideration=DecimalCurrency(600, currency="GBP"),
+            fees=DecimalCurrency(4, currency="GBP"),
+        )
+        pool = S104Pool(acquisition=acquisition, disposal=disposal, quantity=Decimal(4))
+
+        aggregates = pool.aggregates
+        assert pool.aggregates is aggregates
+
+        assert pool.unit_cost == DecimalCurrency(101, currency="GBP")
+        assert pool.total_cost == DecimalCurrency(404, currency="GBP")
+        assert pool.unit_proceeds == DecimalCurrency(149, currency="GBP")
+        assert pool.total_proceeds == DecimalCurrency(596, currency="GBP")
+        assert pool.total_gain == DecimalCurrency(192, currency="GBP")
+        assert pool.unit_gain == DecimalCurrency(48, currency="GBP")
+
+    def test_pool_across_stock_split(self):
+        disposal = Transaction(
+            type=TransactionType.SELL,
+            date=datetime.date(2025, 1, 2),
+            quantity=Decimal(10),
+            consideration=DecimalCurrency(1000, currency="GBP"),
+        )
+        acquisition = Transaction(
+            type=TransactionType.BUY,
+            date=datetime.date(2025, 1, 10),
+            quantity=Decimal(30),
+            consideration=DecimalCurrency(900, currency="GBP"),
+        )
+        # After a 3-for-1 split, 5 disposed shares are matched with 15 acquired shares
+        pool = S104Pool(acquisition=acquisition, disposal=disposal, quantity=Decimal(5), acquisition_quantity=Decimal(15))
+
+        assert pool.split_ratio == Decimal(3)
+        assert pool.get_quantity(disposal) == Decimal(5)
+        assert pool.get_quantity(acquisition) == Decimal(15)
+
+        assert pool.unit_cost == DecimalCurrency(90, currency="GBP")
+        assert pool.total_cost == DecimalCurrency(450, currency="GBP")
+        assert pool.total_proceeds == DecimalCurrency(500, currency="GBP")
+        assert pool.unit_gain == DecimalCurrency(10, currency="GBP")
+
+    def test_pool_aggregates_follow_transaction_updates(self, entity_root: EntityRoot, session_manager: SessionManager):
+        with session_manager(actor="tester", reason="create ledger"):
+            acquisition = Transaction(
+                type=TransactionType.BUY,
+                date=datetime.date(2025, 1, 2),
+                quantity=Decimal(10),
+                consideration=DecimalCurrency(1000, currency="GBP"),
+                fees=DecimalCurrency(10, currency="GBP"),
+            )
+            disposal = Transaction(
+                type=TransactionType.SELL,
+                date=datetime.date(2025, 1, 3),
+                quantity=Decimal(4),
+                consideration=DecimalCurrency(600, currency="GBP"),
+            )
+            instrument = Instrument(ticker="VOD", type=InstrumentType.EQUITY, currency=Currency("GBP"))
+            entity_root.root = Ledger(instrument=instrument, transactions={acquisition, disposal})
+
+        pool = S104Pool(acquisition=acquisition, disposal=disposal, quantity=Decimal(4))
+        assert pool.total_cost == DecimalCurrency(404, currency="GBP")
+
+        # Updating a transaction replaces its record, which invalidates the cached aggregates
+        with session_manager(actor="tester", reason="update consideration"):
+            acquisition.journal.consideration = DecimalCurrency(2000, currency="GBP")
+
+        assert pool.total_cost == DecimalCurrency(804, currency="GBP")
+        assert pool.total_proceeds == DecimalCurrency(600, currency="GBP")
@@ -85,3 +85,39 @@ class TestJournalledOrderedViewSet:
         assert j.journal == ()
         assert j.frontier_sort_key is None
         assert original.sort.cache_info().misses == 1
+
+    def test_frontier_items_resolve_invalidated_range(self):
+        original = _FrozenInts({1, 3, 5, 7, 9})
+        j = _JournalledInts(original)
+
+        # No edits -> nothing is invalidated
+        assert tuple(j.frontier_items) == ()
+
+        # Back-dated insert invalidates everything from the inserted item onwards
+        j.add(4)
+        assert tuple(j.frontier_items) == (4, 5, 7, 9)
+
+        # An earlier edit widens the range, even though the discarded item is no longer part of it
+        j.discard(3)
+        assert j.frontier_sort_key == 3
+        assert tuple(j.frontier_items) == (4, 5, 7, 9)
+
+        j.discard(1)
+        assert tuple(j.frontier_items) == (4, 5, 7, 9)
+        j.add(2)
+        assert tuple(j.frontier_items) == (2, 4, 5, 7, 9)
+
+    def test_update_adds_values_as_a_single_edit(self):
+        original = _FrozenInts({1, 3, 5})
+        j = _JournalledInts(original)
+
+        # Values already in the set and duplicates are skipped
+        j.update([6, 2, 3, 6])
+        assert j.edited is True
+        assert [(edit.type.name, edit.value) for edit in j.journal] == [("ADD", 6), ("ADD", 2)]
+        assert j.frontier_sort_key == 2
+        assert list(j.sorted) == [1, 2, 3, 5, 6]
+
+        # Nothing new -> no edit
+        j.update([1, 2])
+        assert len(j.journal) == 2
@@ -34,6 +34,18 @@ class TestOrderedViewMutableSet:
         assert info_after_discard.misses == 0 and info_after_discard.hits == 0
         assert list(s.sorted) == [1, 2]
 
+    def test_bisect_sort_key_and_from_sort_key(self):
+        s = _MutableInts([7, 1, 5, 3])
+        assert s.bisect_sort_key(0) == 0
+        assert s.bisect_sort_key(3) == 1
+        assert s.bisect_sort_key(4) == 2
+        assert s.bisect_sort_key(8) == 4
+        assert list(s.from_sort_key(4)) == [5, 7]
+
+        # Range queries follow edits to the set
+        s.add(4)
+        assert list(s.from_sort_key(4)) == [4, 5, 7]
+
     def test_clear(self):
         s = _MutableInts([1, 4, 2])
         _ = s.sorted  # build cache
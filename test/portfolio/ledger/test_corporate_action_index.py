@@ -0,0 +1,91 @@
+# SPDX-License-Identifier: GPLv3-or-later
+# Copyright © 2025 pygaindalf Rui Pinheiro
+
+import datetime
+
+from decimal import Decimal
+
+import pytest
+
+from app.portfolio.journal.session_manager import SessionManager
+from app.portfolio.models.instrument import Instrument
+from app.portfolio.models.instrument.instrument_type import InstrumentType
+from app.portfolio.models.ledger import Ledger
+from app.portfolio.models.root import EntityRoot
+from app.portfolio.models.transaction import Transaction, TransactionType
+from app.util.helpers.currency import Currency
+from app.util.helpers.decimal_currency import DecimalCurrency
+
+
+def _create_transaction(type: TransactionType, date: datetime.date, quantity: int) -> Transaction:  # noqa: A002
+    consideration = DecimalCurrency(0 if type.stock_split else 100, currency="USD")
+    return Transaction(type=type, date=date, quantity=Decimal(quantity), consideration=consideration)
+
+
+@pytest.mark.portfolio
+@pytest.mark.ledger
+class TestCorporateActionIndex:
+    def test_index_contains_stock_splits_in_ledger_order(self, entity_root: EntityRoot, session_manager: SessionManager):
+        with session_manager(actor="tester", reason="create ledger"):
+            late_split = _create_transaction(TransactionType.SPLIT, datetime.date(2025, 6, 1), 4)
+            early_split = _create_transaction(TransactionType.SPLIT, datetime.date(2024, 6, 1), 2)
+            buy = _create_transaction(TransactionType.BUY, datetime.date(2024, 1, 1), 10)
+            ledger = Ledger(
+                instrument=Instrument(ticker="NVDA", type=InstrumentType.EQUITY, currency=Currency("USD")), transactions={late_split, buy, early_split}
+            )
+            entity_root.root = ledger
+
+        record = ledger.record
+        index = record.corporate_action_index
+        assert record.corporate_action_index is index
+        assert list(index) == [early_split, late_split]
+        assert len(index) == 2
+        assert tuple(ledger.stock_splits) == (early_split, late_split)
+
+        assert index.has_stock_split(datetime.date(2024, 6, 1), Decimal(2))
+        assert not index.has_stock_split(datetime.date(2024, 6, 1), Decimal(4))
+        assert not index.has_stock_split(datetime.date(2024, 1, 1), Decimal(10))
+
+    def test_index_follows_sessions(self, entity_root: EntityRoot, session_manager: SessionManager):
+        with session_manager(actor="tester", reason="create ledger"):
+            ledger = Ledger(instrument=Instrument(ticker="AMD", type=InstrumentType.EQUITY, currency=Currency("USD")))
+            entity_root.root = ledger
+
+        record = ledger.record
+        index = record.corporate_action_index
+        assert len(index) == 0
+
+        with session_manager(actor="tester", reason="add split"):
+            # Unedited journals reuse the record's index
+            assert ledger.journal.corporate_action_index is index
+
+            split = _create_transaction(TransactionType.SPLIT, datetime.date(2025, 1, 1), 3)
+            ledger.journal.transactions.update([split, _create_transaction(TransactionType.BUY, datetime.date(2024, 1, 1), 1)])
+
+            # Edited journals see the session's transactions, while the record is unchanged
+            assert list(ledger.journal.corporate_action_index) == [split]
+            assert len(record.corporate_action_index) == 0
+
+            ledger.journal.transactions.discard(split)
+            assert len(ledger.journal.corporate_action_index) == 0
+            ledger.journal.transactions.add(split)
+
+        assert list(ledger.record.corporate_action_index) == [split]
+
+    def test_index_follows_transaction_updates(self, entity_root: EntityRoot, session_manager: SessionManager):
+        with session_manager(actor="tester", reason="create ledger"):
+            split = _create_transaction(TransactionType.SPLIT, datetime.date(2024, 6, 1), 2)
+            dividend = _create_transaction(TransactionType.DIVIDEND, datetime.date(2024, 3, 1), 1)
+            ledger = Ledger(instrument=Instrument(ticker="INTC", type=InstrumentType.EQUITY, currency=Currency("USD")), transactions={split, dividend})
+            entity_root.root = ledger
+
+        assert list(ledger.record.corporate_action_index) == [split]
+
+        # Neither transaction is a trade, so retyping them does not reorder nor edit the ledger's transactions
+        with session_manager(actor="tester", reason="retype transactions"):
+            split.journal.type = TransactionType.DIVIDEND
+            dividend.journal.type = TransactionType.SPLIT
+
+        assert list(ledger.record.corporate_action_index) == [dividend]
+        assert tuple(ledger.stock_splits) == (dividend,)
+        assert ledger.corporate_action_index.has_stock_split(datetime.date(2024, 3, 1), Decimal(1))
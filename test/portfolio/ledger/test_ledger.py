@@ -97,6 +97,36 @@ class TestLedgerEntity:
         assert len(ledger.transactions) == 2
         assert list(ledger.transactions) == [t1, t2]
 
+    def test_entity_update_shares_unchanged_fields(self):
+        instrument = Instrument(
+            ticker="AMZN",
+            type=InstrumentType.EQUITY,
+            currency=Currency("USD"),
+        )
+        txn = Transaction(
+            type=TransactionType.BUY,
+            date=datetime.date(2025, 2, 1),
+            quantity=Decimal(2),
+            consideration=DecimalCurrency(200, currency="USD"),
+        )
+        ledger = Ledger(
+            instrument=instrument,
+            transactions={txn},
+        )
+
+        original_record = ledger.record
+        ledger.update(extra_dependency_uids=frozenset({instrument.uid}))
+        updated_record = ledger.record
+
+        assert updated_record is not original_record
+        assert updated_record.version == original_record.version + 1
+        assert updated_record.extra_dependency_uids == frozenset({instrument.uid})
+
+        # Unchanged fields are structurally shared with the superseded version rather than copied and re-validated
+        assert updated_record.transactions is original_record.transactions
+        assert updated_record.annotations is original_record.annotations
+        assert list(ledger.transactions) == [txn]
+
     def test_entity_refreshes_after_superseding_record(self):
         instrument = Instrument(
             ticker="MSFT",
@@ -20,6 +20,7 @@ import pytest
 from app.portfolio.collections.journalled.set import JournalledSetEdit, JournalledSetEditType
 from app.portfolio.journal.session import Session
 from app.portfolio.journal.session_manager import SessionManager
+from app.portfolio.models.annotation.s104 import S104HoldingsAnnotation, S104PoolAnnotation
 from app.portfolio.models.instrument import Instrument
 from app.portfolio.models.instrument.instrument_type import InstrumentType
 from app.portfolio.models.ledger import Ledger
@@ -28,6 +29,8 @@ from app.portfolio.models.transaction import Transaction, TransactionType
 from app.util.helpers.currency import Currency
 from app.util.helpers.decimal_currency import DecimalCurrency
 
+from ..annotation.annotation_types import SampleUniqueAnnotation
+
 
 # --- Tests -----------------------------------------------------------------------
 @pytest.mark.portfolio
@@ -144,3 +147,68 @@ class TestLedgerJournalPropagationSessions:
             # Still no diff because child isn't in the parent's OrderedViewMutableSet
             assert lj.get_diff() == {"transactions": (JournalledSetEdit(type=JournalledSetEditType.DISCARD, value=t1.uid),)}
             s.abort()
+
+    def test_transaction_edits_notify_annotations_from_frontier(self, entity_root: EntityRoot, session_manager: SessionManager):
+        def buy(day: int) -> Transaction:
+            return Transaction(
+                type=TransactionType.BUY,
+                date=datetime.date(2025, 4, day),
+                quantity=Decimal(1),
+                consideration=DecimalCurrency(1, currency="USD"),
+            )
+
+        with session_manager(actor="tester", reason="create ledger"):
+            t1, t3, t5 = buy(1), buy(3), buy(5)
+            ledg = Ledger(instrument=Instrument(ticker="INTC", type=InstrumentType.EQUITY, currency=Currency("USD")), transactions={t1, t3, t5})
+            entity_root.root = ledg
+
+        with session_manager(actor="tester", reason="annotate"):
+            a1, a3, a5 = (SampleUniqueAnnotation.create(txn, payload=i) for i, txn in enumerate((t1, t3, t5)))
+
+        with session_manager(actor="tester", reason="back-dated insert") as s:
+            lj = ledg.journal
+            assert a3.uid not in set(lj._iter_dependent_uids())
+
+            # Only the annotations of transactions at or after the inserted transaction are notified
+            lj.transactions.add(buy(2))
+            dependents = set(lj._iter_dependent_uids())
+            assert {a3.uid, a5.uid} <= dependents
+            assert a1.uid not in dependents
+            s.abort()
+
+    def test_transaction_edits_invalidate_s104_annotations_from_frontier(self, entity_root: EntityRoot, session_manager: SessionManager):
+        def trade(type: TransactionType, day: int, quantity: int) -> Transaction:  # noqa: A002
+            return Transaction(
+                type=type,
+                date=datetime.date(2025, 4, day),
+                quantity=Decimal(quantity),
+                consideration=DecimalCurrency(10 * quantity, currency="GBP"),
+            )
+
+        with session_manager(actor="tester", reason="create ledger"):
+            b1, s3, b5 = trade(TransactionType.BUY, 1, 10), trade(TransactionType.SELL, 3, 4), trade(TransactionType.BUY, 5, 4)
+            ledg = Ledger(instrument=Instrument(ticker="VOD", type=InstrumentType.EQUITY, currency=Currency("GBP")), transactions={b1, s3, b5})
+            entity_root.root = ledg
+
+        # The disposal is matched with the later acquisition under the 30-day rule, so neither changes the pool
+        with session_manager(actor="tester", reason="annotate"):
+            S104PoolAnnotation.get_or_create(s3).journal.create_pool(b5, quantity=Decimal(4))
+            for txn in (b1, s3, b5):
+                S104HoldingsAnnotation.create(txn, quantity=Decimal(10), cumulative_cost=DecimalCurrency(100, currency="GBP"))
+
+        # A back-dated insert invalidates the annotations from the inserted transaction onwards, and the pools of matched transactions
+        with session_manager(actor="tester", reason="back-dated insert"):
+            b4 = trade(TransactionType.BUY, 4, 1)
+            ledg.journal.transactions.add(b4)
+
+        assert S104HoldingsAnnotation.get(b1) is not None
+        assert S104HoldingsAnnotation.get(s3) is not None
+        assert S104HoldingsAnnotation.get(b5) is None
+        assert S104PoolAnnotation.get(b5) is None
+        assert S104PoolAnnotation.get(s3) is None
+
+        # Discarding an earlier transaction invalidates every later annotation
+        with session_manager(actor="tester", reason="discard"):
+            ledg.journal.transactions.discard(b1)
+
+        assert S104HoldingsAnnotation.get(s3) is None
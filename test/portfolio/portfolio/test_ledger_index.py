@@ -0,0 +1,100 @@
+# SPDX-License-Identifier: GPLv3-or-later
+# Copyright © 2025 pygaindalf Rui Pinheiro
+
+import timeit
+
+from collections.abc import Callable
+
+import pytest
+
+from app.portfolio.journal.session_manager import SessionManager
+from app.portfolio.models.instrument import Instrument
+from app.portfolio.models.instrument.instrument_type import InstrumentType
+from app.portfolio.models.ledger import Ledger
+from app.portfolio.models.root.portfolio_root import PortfolioRoot
+from app.util.helpers.currency import Currency
+
+
+def _create_ledger(ticker: str, isin: str | None = None) -> Ledger:
+    return Ledger(instrument=Instrument(ticker=ticker, isin=isin, type=InstrumentType.EQUITY, currency=Currency("USD")))
+
+
+@pytest.mark.portfolio
+@pytest.mark.ledger
+class TestLedgerIndex:
+    def test_lookup_by_isin_and_ticker(self, portfolio_root: PortfolioRoot, session_manager: SessionManager):
+        portfolio = portfolio_root.portfolio
+        with session_manager(actor="tester", reason="add ledgers"):
+            aapl = _create_ledger("AAPL", isin="US0378331005")
+            msft = _create_ledger("MSFT")
+            portfolio.journal.ledgers.add(aapl)
+            portfolio.journal.ledgers.add(msft)
+
+        assert portfolio.get_ledger(ticker="AAPL") is aapl
+        assert portfolio.get_ledger(isin="US0378331005") is aapl
+        assert portfolio.get_ledger(isin="US0378331005", ticker="AAPL") is aapl
+        assert portfolio.get_ledger(ticker="MSFT") is msft
+        assert portfolio.get_ledger(ticker="GOOG") is None
+        assert portfolio.get_ledger() is None
+
+        with pytest.raises(ValueError, match="Conflicting ledgers"):
+            portfolio.get_ledger(isin="US0378331005", ticker="MSFT")
+
+    def test_index_follows_sessions(self, portfolio_root: PortfolioRoot, session_manager: SessionManager):
+        portfolio = portfolio_root.portfolio
+        record = portfolio.record
+        index = record.ledger_index
+        assert record.ledger_index is index
+
+        with session_manager(actor="tester", reason="add ledger"):
+            # Unedited journals reuse the record's index
+            assert portfolio.journal.ledger_index is index
+
+            ledger = _create_ledger("AAPL")
+            portfolio.journal.ledgers.add(ledger)
+
+            # Edited journals see the session's ledgers, while the record is unchanged
+            assert portfolio.journal.get_ledger(ticker="AAPL") is ledger
+            assert record.get_ledger(ticker="AAPL") is None
+
+            # Further edits update the journal's index in place
+            journal_index = portfolio.journal.ledger_index
+            portfolio.journal.ledgers.discard(ledger)
+            assert portfolio.journal.get_ledger(ticker="AAPL") is None
+            msft = _create_ledger("MSFT")
+            portfolio.journal.ledgers.add(msft)
+            portfolio.journal.ledgers.add(ledger)
+            assert portfolio.journal.ledger_index is journal_index
+            assert portfolio.journal.get_ledger(ticker="AAPL") is ledger
+            assert portfolio.journal.get_ledger(ticker="MSFT") is msft
+
+        assert portfolio.record is not record
+        assert portfolio.record.ledger_index is not index
+        assert portfolio.get_ledger(ticker="AAPL") is ledger
+
+    @pytest.mark.benchmark
+    def test_lookup_latency(self, portfolio_root: PortfolioRoot, session_manager: SessionManager, record_property: Callable[[str, object], None]):
+        count = 500
+        tickers = [f"T{i:04d}" for i in range(count)]
+
+        portfolio = portfolio_root.portfolio
+        with session_manager(actor="tester", reason="add ledgers"):
+            for ticker in tickers:
+                portfolio.journal.ledgers.add(_create_ledger(ticker))
+
+        def _instance_lookup() -> None:
+            for ticker in tickers:
+                instrument = Instrument.instance(ticker=ticker)
+                assert instrument is not None
+                if instrument in portfolio:
+                    portfolio[instrument]
+
+        def _indexed_lookup() -> None:
+            for ticker in tickers:
+                portfolio.get_ledger(ticker=ticker)
+
+        instance = min(timeit.repeat(_instance_lookup, number=5, repeat=5))
+        indexed = min(timeit.repeat(_indexed_lookup, number=5, repeat=5))
+
+        record_property("instance_lookup_s", instance)
+        record_property("indexed_lookup_s", indexed)
@@ -9,6 +9,7 @@ from typing import Any, NamedTuple, override
 
 import pytest
 
+from app.portfolio.journal import COMMIT_STATISTICS
 from app.portfolio.models.entity import EntityRecord
 from app.portfolio.models.entity.dependency_event_handler import EntityDependencyEventType
 from app.portfolio.models.entity.dependency_event_handler.impl import EntityDependencyEventHandlerImpl
@@ -676,6 +677,7 @@ class TestPortfolioDependencies:
 
         # Act: update instrument -> should notify both handlers
         inst_appl_record = inst_appl.record
+        statistics_before = COMMIT_STATISTICS.snapshot()
         with portfolio_root.session_manager(actor="tester", reason="update instrument (generics filter)"):
             inst_appl.journal.currency = Currency("EUR")
         assert inst_appl_record.superseded
@@ -688,6 +690,11 @@ class TestPortfolioDependencies:
         assert union_calls, "Union handler should receive instrument updates"
         assert any(record_cls is InstrumentRecord for _owner_uid, _event, record_cls, _matched in union_calls)
 
+        # Every handler call is counted in the commit statistics
+        handlers = (COMMIT_STATISTICS.snapshot() - statistics_before).handlers
+        assert handlers[f"LedgerRecord.{instrument_only_handler.__qualname__}"] == len(inst_calls)
+        assert handlers[f"LedgerRecord.{union_handler.__qualname__}"] == len(union_calls)
+
         instrument_calls_count = len(inst_calls)
         union_calls_before_transaction = len(union_calls)
 
@@ -952,3 +959,46 @@ class TestPortfolioDependencies:
         assert inst_isin_3333.record is inst_isin_3333_record.superseding
         target_uid = inst_isin_3333.uid
         assert calls and calls[-1] is not None and calls[-1].issuperset({"currency", "ticker"})
+
+    def test_dependency_event_dispatch_indexes_attribute_names(self):
+        def handler(
+            owner: LedgerRecord,
+            event: EntityDependencyEventType,
+            record: EntityRecord,
+            *,
+            matched_attributes: frozenset[str] | None = None,
+        ) -> None:
+            pass
+
+        def attr_matcher(owner: LedgerRecord, record: EntityRecord, attribute: str, value: Any) -> bool:  # noqa: ARG001
+            return attribute == "type"
+
+        for attribute_matchers in ("currency", ("ticker", "isin"), attr_matcher):
+            EntityDependencyEventHandlerModel[LedgerRecord, InstrumentRecord](
+                handler=handler,
+                on_updated=True,
+                on_deleted=True,
+                attribute_matchers=attribute_matchers,
+            ).register(LedgerRecord)
+
+        # Updates: plain attribute names are indexed, callables are always considered
+        updated = LedgerRecord.get_dependency_event_dispatch(InstrumentRecord, EntityDependencyEventType.UPDATED)
+        assert len(updated.handlers) == 3
+        assert set(updated.attribute_index) == {"currency", "ticker", "isin"}
+        assert len(updated.unindexed) == 1
+        assert LedgerRecord.get_dependency_event_dispatch(InstrumentRecord, EntityDependencyEventType.UPDATED) is updated
+
+        # Deletions do not match attributes, so nothing is indexed
+        deleted = LedgerRecord.get_dependency_event_dispatch(InstrumentRecord, EntityDependencyEventType.DELETED)
+        assert len(deleted.handlers) == 3
+        assert not deleted.attribute_index
+
+        # Handlers for other record classes are filtered out up-front
+        assert not LedgerRecord.get_dependency_event_dispatch(TransactionRecord, EntityDependencyEventType.UPDATED).handlers
+
+        # Registering a handler invalidates the dispatch tables
+        EntityDependencyEventHandlerModel[LedgerRecord, InstrumentRecord](handler=handler, on_updated=True, on_deleted=False).register(LedgerRecord)
+        rebuilt = LedgerRecord.get_dependency_event_dispatch(InstrumentRecord, EntityDependencyEventType.UPDATED)
+        assert rebuilt is not updated
+        assert len(rebuilt.handlers) == 4
+        assert len(rebuilt.unindexed) == 2
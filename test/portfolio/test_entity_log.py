@@ -0,0 +1,130 @@
+# SPDX-License-Identifier: GPLv3-or-later
+# Copyright © 2025 pygaindalf Rui Pinheiro
+
+import datetime
+import gc
+import tracemalloc
+
+from collections.abc import Callable
+from decimal import Decimal
+
+import pytest
+
+from frozendict import frozendict
+
+from app.portfolio.models.entity.entity_log import CompactEntityLogEntry, EntityLog, EntityLogEntry, EntityLogRetention, EntityModificationType
+from app.portfolio.models.entity.entity_log_config import EntityLogConfig
+from app.portfolio.models.transaction import Transaction, TransactionType
+from app.util.helpers.decimal_currency import DecimalCurrency
+
+
+def _create_transaction(updates: int) -> Transaction:
+    tx = Transaction(
+        type=TransactionType.BUY,
+        date=datetime.date(2025, 3, 1),
+        quantity=Decimal(1),
+        consideration=DecimalCurrency(100, currency="USD"),
+    )
+    for i in range(updates):
+        tx.update(quantity=Decimal(i + 2))
+    return tx
+
+
+def _traced_memory[T](factory: Callable[[], T]) -> tuple[T, int]:
+    gc.collect()
+    tracemalloc.start()
+    try:
+        result = factory()
+        current, _ = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    return result, current
+
+
+@pytest.mark.portfolio
+@pytest.mark.entity_log
+class TestEntityLog:
+    def test_compact_entry_round_trip(self):
+        entry = EntityLogEntry(
+            what=EntityModificationType.UPDATED,
+            who="tester",
+            why="round trip",
+            diff=frozendict({"quantity": Decimal(3)}),
+            version=2,
+        )
+
+        compact = CompactEntityLogEntry.encode(entry)
+        assert isinstance(compact, tuple)
+        assert compact.diff == (("quantity", Decimal(3)),)
+        assert compact.decode() == entry
+
+    def test_retention_all_keeps_every_entry(self):
+        log = _create_transaction(5).entity_log
+
+        assert log.version == 6
+        assert len(log) == 6
+        assert [entry.version for entry in log] == [1, 2, 3, 4, 5, 6]
+        assert log[0].what == EntityModificationType.CREATED
+        assert [entry.version for entry in log[-2:]] == [5, 6]
+
+    def test_retention_last_n(self, monkeypatch: pytest.MonkeyPatch):
+        monkeypatch.setattr(EntityLog, "RETENTION", EntityLogRetention.LAST_N)
+        monkeypatch.setattr(EntityLog, "RETENTION_LIMIT", 2)
+
+        tx = _create_transaction(5)
+        log = tx.entity_log
+
+        assert log.version == 6
+        assert log.next_version == 7
+        assert [entry.version for entry in log] == [5, 6]
+        assert log.get_entry_by_version(1) is None
+        assert (entry := log.get_entry_by_version(6)) is not None and entry.what == EntityModificationType.UPDATED
+        assert log.exists
+        assert tx.quantity == Decimal(6)
+
+    def test_retention_creation_and_latest(self, monkeypatch: pytest.MonkeyPatch):
+        monkeypatch.setattr(EntityLog, "RETENTION", EntityLogRetention.CREATION_AND_LATEST)
+
+        tx = _create_transaction(5)
+        log = tx.entity_log
+
+        assert [entry.version for entry in log] == [1, 6]
+        assert log.most_recent.version == 6
+        assert (entry := log.get_entry_by_version(1)) is not None and entry.what == EntityModificationType.CREATED
+        assert log.get_entry_by_version(3) is None
+
+        # Dropped entries were updates, so superseded records whose superseding entry was dropped are not deleted
+        tx.update(quantity=Decimal(10))
+        assert tx.quantity == Decimal(10)
+        assert [entry.version for entry in log] == [1, 7]
+
+    def test_configure(self, monkeypatch: pytest.MonkeyPatch):
+        # Restore the class-level policy after the test
+        monkeypatch.setattr(EntityLog, "RETENTION", EntityLog.RETENTION)
+        monkeypatch.setattr(EntityLog, "RETENTION_LIMIT", EntityLog.RETENTION_LIMIT)
+
+        EntityLog.configure(EntityLogConfig.model_validate({"retention": "last_n", "retention_limit": 3}))
+        assert EntityLog.RETENTION == EntityLogRetention.LAST_N
+        assert EntityLog.RETENTION_LIMIT == 3
+
+        log = _create_transaction(5).entity_log
+        assert [entry.version for entry in log] == [4, 5, 6]
+        assert log.most_recent.version == 6
+
+    @pytest.mark.benchmark
+    def test_compact_entries_memory(self, record_property: Callable[[str, object], None]):
+        count = 1000
+        when = datetime.datetime.now(tz=datetime.UTC)
+        values = [Decimal(i) for i in range(count)]
+
+        entries, model_bytes = _traced_memory(
+            lambda: [
+                EntityLogEntry(what=EntityModificationType.UPDATED, when=when, who="benchmark", diff=frozendict({"quantity": value}), version=i + 2)
+                for i, value in enumerate(values)
+            ]
+        )
+        compact, compact_bytes = _traced_memory(lambda: [CompactEntityLogEntry.encode(entry) for entry in entries])
+
+        assert [entry.decode() for entry in compact] == entries
+        record_property("model_bytes", model_bytes)
+        record_property("compact_bytes", compact_bytes)
@@ -0,0 +1,100 @@
+# SPDX-License-Identifier: GPLv3-or-later
+# Copyright © 2025 pygaindalf Rui Pinheiro
+
+import datetime
+import timeit
+
+from collections.abc import Callable
+from decimal import Decimal
+
+import pytest
+
+from app.portfolio.models.instrument import Instrument
+from app.portfolio.models.instrument.instrument_type import InstrumentType
+from app.portfolio.models.ledger import Ledger
+from app.portfolio.models.root.portfolio_root import PortfolioRoot
+from app.portfolio.models.store import EntityStore
+from app.portfolio.models.transaction import Transaction, TransactionType
+from app.util.helpers.currency import Currency
+from app.util.helpers.decimal_currency import DecimalCurrency
+
+
+def _create_transaction(i: int) -> Transaction:
+    return Transaction(
+        type=TransactionType.BUY,
+        date=datetime.date(2025, 3, 1),
+        quantity=Decimal(i + 1),
+        consideration=DecimalCurrency(100, currency="USD"),
+    )
+
+
+@pytest.mark.portfolio
+@pytest.mark.entity_store
+class TestEntityStorePinnedGeneration:
+    def test_pin_entities_pins_reachable_entities(self, portfolio_root: PortfolioRoot):
+        store = portfolio_root.entity_store
+        portfolio = portfolio_root.portfolio
+        assert not store.pinned_generation
+        assert not store.is_pinned(portfolio)
+
+        portfolio_root.pin_entities()
+
+        assert store.pinned_generation
+        assert store.is_pinned(portfolio_root.entity)
+        assert store.is_pinned(portfolio)
+        assert store[portfolio.uid] is portfolio
+        assert portfolio.uid in store
+        assert len(store) == len(list(store))
+
+    def test_created_entities_are_pinned_on_commit(self, portfolio_root: PortfolioRoot, session_manager):
+        store = portfolio_root.entity_store
+        portfolio_root.pin_entities()
+
+        with session_manager(actor="tester", reason="create ledger"):
+            instrument = Instrument(ticker="AAPL", type=InstrumentType.EQUITY, currency=Currency("USD"))
+            ledger = Ledger(instrument=instrument)
+            portfolio_root.portfolio.journal.ledgers.add(ledger)
+            assert not store.is_pinned(ledger)
+
+        assert store.is_pinned(ledger)
+        assert store.is_pinned(instrument)
+        assert Ledger.by_uid(ledger.uid) is ledger
+
+    def test_sweep_unpins_unreachable_entities(self, entity_store: EntityStore):
+        tx = _create_transaction(0)
+
+        entity_store.set_pinned_generation(True, roots=tx.uid)
+        assert entity_store.is_pinned(tx)
+
+        sweep = entity_store.sweep(())
+        assert sweep.unpinned == 1
+        assert sweep.pinned == 0
+        assert not entity_store.is_pinned(tx)
+        assert entity_store[tx.uid] is tx
+
+        sweep = entity_store.sweep(tx.uid)
+        assert sweep.pinned == 1
+        assert entity_store.is_pinned(tx)
+
+        entity_store.set_pinned_generation(False)
+        assert entity_store.pinned_count == 0
+        assert entity_store[tx.uid] is tx
+
+    @pytest.mark.benchmark
+    def test_pinned_lookup_latency(self, entity_store: EntityStore, record_property: Callable[[str, object], None]):
+        count = 1000
+        transactions = [_create_transaction(i) for i in range(count)]
+        uids = [tx.uid for tx in transactions]
+
+        def _lookup() -> None:
+            for uid in uids:
+                entity_store.get(uid)
+
+        weak = min(timeit.repeat(_lookup, number=20, repeat=5))
+
+        entity_store.set_pinned_generation(True, roots=uids)
+        assert entity_store.pinned_count == count
+        pinned = min(timeit.repeat(_lookup, number=20, repeat=5))
+
+        record_property("weak_lookup_s", weak)
+        record_property("pinned_lookup_s", pinned)
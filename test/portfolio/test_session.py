@@ -11,6 +11,7 @@ from pydantic import Field, ValidationError
 
 from app.portfolio.collections.journalled.mapping import JournalledMapping
 from app.portfolio.collections.journalled.sequence import JournalledSequence
+from app.portfolio.journal.commit_statistics import COMMIT_STATISTICS
 from app.portfolio.journal.journal import Journal
 from app.portfolio.journal.session_manager import SessionManager
 from app.portfolio.models.entity import Entity, EntityImpl, EntityRecord, EntitySchemaBase, IncrementingUidMixin
@@ -287,3 +288,32 @@ class TestSessionEntityJournal:
             assert entity.value == 1
             assert entity.items[1] == 2
             assert entity.meta["a"] == 1
+
+    # --- Commit statistics ---------------------------------------------------------------------
+    def test_commit_statistics_are_recorded(self, entity: SampleEntity, session_manager: SessionManager):
+        before = COMMIT_STATISTICS.snapshot()
+
+        with session_manager(actor="tester", reason="unit-test") as s:
+            entity.journal.value = 42
+            s.commit()
+            assert s.commit_statistics is None
+
+        delta = COMMIT_STATISTICS.snapshot() - before
+        assert delta.commits == 1
+        assert delta.counters["dirty_journals"] == 1
+        assert delta.counters["notify_passes"] >= 1
+        assert delta.counters["journals_committed"] >= 1
+        assert delta.counters["records_created"] >= 1
+        assert {"notify", "travel", "apply", "journal_commit"} <= set(delta.phase_ns)
+        assert delta.as_dict()["commits"] == 1
+
+    def test_slow_commit_is_logged(self, entity: SampleEntity, session_manager: SessionManager, caplog: pytest.LogCaptureFixture):
+        COMMIT_STATISTICS.configure(slow_threshold_ms=0)
+        try:
+            with caplog.at_level("WARNING"), session_manager(actor="tester", reason="slow-commit") as s:
+                entity.journal.value = 43
+                s.commit()
+        finally:
+            COMMIT_STATISTICS.configure(slow_threshold_ms=None)
+
+        assert any("Slow commit" in record.getMessage() and "slow-commit" in record.getMessage() for record in caplog.records)
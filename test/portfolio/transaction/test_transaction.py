@@ -2,12 +2,14 @@
 # Copyright © 2025 pygaindalf Rui Pinheiro
 
 import datetime
+import inspect
 
 from decimal import Decimal
 
 import pytest
 
 from app.portfolio.models.entity.entity_log import EntityLog, EntityModificationType
+from app.portfolio.models.entity.entity_record_attribute import EntityRecordAttribute
 from app.portfolio.models.transaction import Transaction, TransactionType
 from app.util.helpers.decimal_currency import DecimalCurrency
 
@@ -107,3 +109,23 @@ class TestTransactionEntity:
         assert entry_v2 is not None and entry_v2.what == EntityModificationType.UPDATED
         if EntityLog.TRACK_ENTITY_DIFF:
             assert entry_v2.diff == {"quantity": Decimal(3)}
+
+    def test_entity_forwards_record_attributes_through_descriptors(self):
+        for name in ("type", "date", "quantity", "consideration"):
+            assert isinstance(inspect.getattr_static(Transaction, name), EntityRecordAttribute)
+            assert name in Transaction.__entity_record_attributes__
+
+        # Entity attributes are never shadowed by record attribute descriptors
+        for name in ("uid", "version", "instance_name", "entity_log", "record"):
+            assert not isinstance(inspect.getattr_static(Transaction, name, None), EntityRecordAttribute)
+
+        tx = Transaction(
+            type=TransactionType.BUY,
+            date=datetime.date(2025, 3, 1),
+            quantity=Decimal(4),
+            consideration=DecimalCurrency(400, currency="USD"),
+        )
+        assert tx.date == tx.record.date == datetime.date(2025, 3, 1)
+
+        tx.update(quantity=Decimal(6))
+        assert tx.quantity == Decimal(6)
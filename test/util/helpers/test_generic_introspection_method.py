@@ -1,11 +1,13 @@
 # SPDX-License-Identifier: GPLv3-or-later
 # Copyright © 2025 pygaindalf Rui Pinheiro
 
+import gc
 import typing
+import weakref
 
 import pytest
 
-from app.util.helpers.generics import GenericIntrospectionMethod, GenericsError
+from app.util.helpers.generics import INTROSPECTION_METHODS, GenericIntrospectionMethod, GenericsError, resolve_introspection_methods
 
 
 # Simple domain types at module scope so they are visible inside nested class bodies
@@ -169,3 +171,65 @@ class TestGenericIntrospectionMethod:
         assert AliasUnionBoundChild.kind_union_alias() is int
         with pytest.raises(GenericsError):
             AliasUnionBoundInvalid.kind_union_alias()
+
+    def test_plain_calls_are_stored_on_each_class(self):
+        ChildDog = TestGenericIntrospectionMethod.ChildDog
+
+        class GrandChild(ChildDog):
+            pass
+
+        assert ChildDog.kind() is Dog
+        assert vars(ChildDog)["__kind_resolved__"] is Dog
+
+        # Subclasses do not trust the attribute inherited from their parent
+        assert "__kind_resolved__" not in vars(GrandChild)
+        assert GrandChild.kind() is Dog
+        assert vars(GrandChild)["__kind_resolved__"] is Dog
+
+    def test_eager_resolution_and_consistency_check(self):
+        class Base[T]:
+            kind = GenericIntrospectionMethod[T]()
+
+        class Child(Base[int]):
+            pass
+
+        class Unresolved[Z](Base[Z]):
+            pass
+
+        assert resolve_introspection_methods() >= 1
+        assert vars(Child)["__kind_resolved__"] is int
+        assert "__kind_resolved__" not in vars(Unresolved)
+
+        # A stale stored value is detected on the next eager resolution
+        descriptor = vars(Base)["kind"]
+        Child.__kind_resolved__ = str  # pyright: ignore[reportAttributeAccessIssue]
+        with pytest.raises(GenericsError, match="previously stored"):
+            descriptor.resolve_eagerly(Child)
+
+    def test_eager_resolution_does_not_raise_unexpected_errors(self, monkeypatch: pytest.MonkeyPatch):
+        class Base[T]:
+            kind = GenericIntrospectionMethod[T]()
+
+        class Child(Base[int]):
+            pass
+
+        def fail(cls: type) -> type:
+            msg = f"Cannot resolve {cls.__name__}"
+            raise RuntimeError(msg)
+
+        descriptor = vars(Base)["kind"]
+        monkeypatch.setattr(descriptor, "_resolve", fail)
+        with pytest.warns(UserWarning, match="Cannot resolve Child"):
+            assert not descriptor.resolve_eagerly(Child)
+        assert "__kind_resolved__" not in vars(Child)
+
+    def test_descriptors_are_dropped_with_their_class(self):
+        class Base[T]:
+            kind = GenericIntrospectionMethod[T]()
+
+        descriptor = weakref.ref(vars(Base)["kind"])
+        assert descriptor() in INTROSPECTION_METHODS
+
+        del Base
+        gc.collect()
+        assert descriptor() is None
@@ -5,18 +5,22 @@
 """Unit tests for the instance_lru_cache decorator.
 
 Validates:
- - cached_property semantics (single function object per instance)
+ - cached_property semantics (single function object per instance, even when its creation races)
  - per-instance cache isolation
  - LRU behaviour with maxsize
  - cache_info() hit/miss accounting
  - metadata (__name__, __doc__) preservation
+ - per-instance, per-method and global limits of the shared registry
+ - registry statistics of garbage collected instances
 """
 
+import gc
+
 from typing import ClassVar
 
 import pytest
 
-from app.util.helpers.instance_lru_cache import instance_lru_cache
+from app.util.helpers.instance_lru_cache import InstanceCacheRegistry, instance_lru_cache
 
 
 class Example:
@@ -53,6 +57,13 @@ class TestInstanceLruCache:
         b = Example(2)
         assert b.add is not fn1  # different instance => different cached function
 
+    def test_racing_cache_creation_shares_the_cache(self):
+        a = Example(1)
+        fn = a.add
+        del a.__dict__["add"]  # as if another thread created the cache before this one published it
+
+        assert a.add is fn
+
     def test_calls_are_cached_per_instance(self):
         a = Example(1)
         b = Example(2)
@@ -93,3 +104,99 @@ class TestInstanceLruCache:
         a = Example(1)
         assert a.add.__name__ == "add"  # type: ignore[attr-defined]
         assert "Return x + y" in (a.add.__doc__ or "")  # type: ignore[attr-defined]
+
+
+class Registered:
+    registry = InstanceCacheRegistry(maxsize=4)
+
+    def __init__(self, ident: int) -> None:
+        self.ident = ident
+
+    @instance_lru_cache(maxsize=3, method_maxsize=5, registry=registry)
+    def double(self, x: int) -> int:
+        return 2 * x
+
+    @instance_lru_cache(registry=registry)
+    def triple(self, x: int) -> int:
+        return 3 * x
+
+
+@pytest.mark.helpers
+@pytest.mark.instance_lru_cache
+class TestInstanceCacheRegistry:
+    def setup_method(self):
+        Registered.registry.configure(maxsize=None)
+        Registered.registry.clear()
+
+    def test_per_instance_limit(self):
+        a = Registered(1)
+        for x in range(5):
+            a.double(x)
+
+        info = a.double.cache_info()  # type: ignore[attr-defined]
+        assert info.currsize == 3 and info.maxsize == 3
+        assert info.misses == 5
+        assert a.double(4) == 8
+        assert a.double.cache_info().hits == 1  # type: ignore[attr-defined]
+
+    def test_per_method_limit_across_instances(self):
+        instances = [Registered(i) for i in range(3)]
+        for instance in instances:
+            instance.double(1)
+            instance.double(2)
+
+        info = Registered.registry.cache_info()[f"{__name__}.Registered.double"]
+        assert info.currsize == 4 and info.maxsize == 5
+        assert info.misses == 6
+
+        # The least recently filled cache, belonging to the first instance, was cleared
+        assert instances[0].double.cache_info().currsize == 0  # type: ignore[attr-defined]
+        assert instances[1].double.cache_info().currsize == 2  # type: ignore[attr-defined]
+
+    def test_global_limit_across_methods(self):
+        Registered.registry.configure(maxsize=4)
+        a = Registered(1)
+        for x in range(3):
+            a.double(x)
+            a.triple(x)
+
+        # The limit is enforced when an entry is inserted, by clearing the least recently filled cache
+        assert Registered.registry.currsize == 4
+        assert a.double.cache_info().currsize == 3  # type: ignore[attr-defined]
+        assert a.triple.cache_info().currsize == 1  # type: ignore[attr-defined]
+        assert Registered.registry.total_info().misses == 6
+
+        assert a.triple(2) == 6
+        assert Registered.registry.total_info().hits == 1
+
+    def test_statistics_outlive_instances(self):
+        a = Registered(1)
+        a.double(1)
+        a.double(1)
+
+        del a
+        gc.collect()
+        info = Registered.registry.cache_info()[f"{__name__}.Registered.double"]
+        assert info.hits == 1 and info.misses == 1
+        assert info.currsize == 0
+
+    def test_entries_are_dropped_with_their_instance(self):
+        a = Registered(1)
+        a.double(1)
+        a.triple(1)
+        assert Registered.registry.currsize == 2
+
+        del a
+        gc.collect()
+        assert Registered.registry.currsize == 0
+
+    def test_cache_clear_only_affects_instance(self):
+        a = Registered(1)
+        b = Registered(2)
+        a.double(1)
+        b.double(1)
+
+        a.double.cache_clear()  # type: ignore[attr-defined]
+        assert a.double.cache_info() == (0, 0, 3, 0)  # type: ignore[attr-defined]
+        assert b.double.cache_info().currsize == 1  # type: ignore[attr-defined]
+        assert Registered.registry.currsize == 1
@@ -14,6 +14,7 @@ from app.util.helpers.type_hints import (
     SupportsCachedTypeHints,
     iterate_type_hints,
     match_type_hint,
+    resolve_cached_type_hints,
     validate_type_hint,
 )
 
@@ -43,6 +44,22 @@ class TestTypeHints:
         assert first is second
         assert dict(first) == get_type_hints(_SampleWithHints)
 
+    def test_cached_type_hints_are_not_inherited_from_parent(self) -> None:
+        class Child(_SampleWithHints):
+            extra: float
+
+        assert "required" in _SampleWithHints.__cached_type_hints__
+        assert "extra" not in _SampleWithHints.__cached_type_hints__
+        assert dict(Child.__cached_type_hints__) == get_type_hints(Child)
+
+    def test_resolve_cached_type_hints_stores_plain_attributes(self) -> None:
+        class Eager(_SampleWithHints):
+            extra: float
+
+        assert resolve_cached_type_hints() >= 1
+        assert isinstance(hints := vars(Eager)["__cached_type_hints__"], frozendict)
+        assert dict(hints) == get_type_hints(Eager)
+
     def test_supports_cached_type_hints_runtime_protocol(self) -> None:
         instance = _SampleWithHints()
 
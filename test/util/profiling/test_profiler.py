@@ -0,0 +1,154 @@
+# SPDX-License-Identifier: GPLv3-or-later
+# Copyright © 2025 pygaindalf Rui Pinheiro
+
+
+"""Unit tests for the profiler.
+
+Validates:
+ - disabled profiler is a no-op
+ - spans nest following the current span, with inclusive counters
+ - Chrome trace-event export
+ - per-name summary aggregation, including spans dropped from the trace
+ - thread-safe counter merging into a shared parent span
+"""
+
+import json
+import threading
+
+from collections.abc import Iterator
+
+import pytest
+
+from app.util.profiling import CURRENT_SPAN, PROFILER
+from app.util.profiling.config import ProfilingConfig
+
+
+@pytest.fixture
+def profiler() -> Iterator[None]:
+    PROFILER.configure(ProfilingConfig(enabled=True))
+    PROFILER.reset()
+    try:
+        yield
+    finally:
+        PROFILER.configure(ProfilingConfig())
+        PROFILER.reset()
+
+
+@pytest.mark.profiling
+class TestProfiler:
+    def test_disabled_is_noop(self):
+        assert not PROFILER.enabled
+
+        with PROFILER.span("noop") as span:
+            assert span is None
+            assert CURRENT_SPAN.get() is None
+            PROFILER.count("events")
+
+        assert not PROFILER.spans
+
+    @pytest.mark.usefixtures("profiler")
+    def test_nested_spans_and_inclusive_counters(self):
+        with PROFILER.span("outer", category="agent") as outer:
+            PROFILER.count("commits")
+            with PROFILER.span("inner") as inner:
+                assert CURRENT_SPAN.get() is inner
+                PROFILER.count("commits", 2)
+                PROFILER.count("entities_created")
+            assert CURRENT_SPAN.get() is outer
+
+        assert CURRENT_SPAN.get() is None
+        assert outer is not None
+        assert inner is not None
+
+        assert inner.parent is outer
+        assert inner.depth == 1
+        assert inner.counters == {"commits": 2, "entities_created": 1}
+        assert outer.counters == {"commits": 3, "entities_created": 1}
+        assert outer.wall_ns >= inner.wall_ns >= 0
+
+        # Spans are recorded when they finish
+        assert [span.name for span in PROFILER.spans] == ["inner", "outer"]
+
+    @pytest.mark.usefixtures("profiler")
+    def test_span_survives_exceptions(self):
+        with pytest.raises(ValueError, match="boom"), PROFILER.span("failing"):
+            msg = "boom"
+            raise ValueError(msg)
+
+        assert CURRENT_SPAN.get() is None
+        assert [span.name for span in PROFILER.spans] == ["failing"]
+
+    @pytest.mark.usefixtures("profiler")
+    def test_chrome_trace(self, tmp_path):
+        with PROFILER.span("outer", category="agent"), PROFILER.span("inner"):
+            PROFILER.count("sessions")
+
+        path = tmp_path / "trace.json"
+        PROFILER.write_chrome_trace(path)
+        trace = json.loads(path.read_text(encoding="utf-8"))
+
+        events = trace["traceEvents"]
+        assert [event["name"] for event in events] == ["outer", "inner"]
+        assert all(event["ph"] == "X" for event in events)
+        assert events[0]["cat"] == "agent"
+        assert events[1]["cat"] == "component"
+        assert events[0]["ts"] <= events[1]["ts"]
+        assert events[0]["dur"] >= events[1]["dur"]
+        assert events[1]["args"]["sessions"] == 1
+
+    @pytest.mark.usefixtures("profiler")
+    def test_summary(self):
+        for _ in range(3):
+            with PROFILER.span("repeated"):
+                PROFILER.count("commits")
+        with PROFILER.span("single"):
+            pass
+
+        rows = PROFILER.summarize()
+        assert [(row.name, row.calls) for row in rows] == [("repeated", 3), ("single", 1)]
+        assert rows[0].counters == {"commits": 3}
+        assert rows[0].allocated is None
+
+        table = PROFILER.summary_table()
+        assert table.row_count == 2
+
+    @pytest.mark.usefixtures("profiler")
+    def test_max_spans(self):
+        PROFILER.configure(ProfilingConfig(enabled=True, max_spans=2))
+
+        for i in range(5):
+            with PROFILER.span(f"span{i % 2}"):
+                PROFILER.count("commits")
+
+        assert [span.name for span in PROFILER.spans] == ["span1", "span0"]
+        assert PROFILER.dropped_spans == 3
+
+        rows = PROFILER.summarize()
+        assert [(row.name, row.calls) for row in rows] == [("span0", 3), ("span1", 2)]
+        assert sum(row.counters["commits"] for row in rows) == 5
+
+    @pytest.mark.usefixtures("profiler")
+    def test_threaded_children_merge_into_parent(self):
+        threads = 8
+        commits = 1000
+
+        def work(parent) -> None:
+            token = CURRENT_SPAN.set(parent)
+            try:
+                with PROFILER.span("child"):
+                    for _ in range(commits):
+                        PROFILER.count("commits")
+            finally:
+                CURRENT_SPAN.reset(token)
+
+        with PROFILER.span("parent") as parent:
+            workers = [threading.Thread(target=work, args=(parent,)) for _ in range(threads)]
+            for worker in workers:
+                worker.start()
+            for _ in range(commits):
+                PROFILER.count("commits")
+            for worker in workers:
+                worker.join()
+
+        assert parent is not None
+        assert parent.counters["commits"] == (threads + 1) * commits